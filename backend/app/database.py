@@ -16,6 +16,132 @@ class Settings(BaseSettings):
     gemini_api_key: str = ""
     cors_origins: str = "http://localhost:5173"
     
+    # Ollama HTTP transport (shared keep-alive pool)
+    ollama_base_url: str = "http://localhost:11434"
+    ollama_max_connections: int = 20
+    ollama_max_keepalive_connections: int = 10
+    ollama_keepalive_expiry: float = 30.0
+    
+    # Record/replay Ollama responses ("off", "record" or "replay"), for benchmarks without a model
+    llm_record_mode: str = "off"
+    llm_fixtures_dir: str = "fixtures/llm"
+    
+    # Provider health monitoring / circuit breaker
+    provider_health_interval: float = 10.0
+    circuit_failure_threshold: int = 3
+    circuit_cooldown_seconds: float = 30.0
+    
+    # Content-addressed resume parse cache
+    resume_cache_max_entries: int = 1000
+    resume_cache_max_bytes: int = 50_000_000
+    
+    # ATS score memoization
+    ats_cache_max_entries: int = 5000
+    
+    # Bulk ATS re-scoring (keep workers low: a single Ollama host serializes generations)
+    rescore_max_workers: int = 2
+    rescore_batch_size: int = 25
+    rescore_job_ttl_seconds: float = 3600.0  # Finished job status kept in memory this long (lost on restart)
+    rescore_max_finished_jobs: int = 100
+    
+    # Hedged interview chat: race the fallback provider when the primary is slow
+    chat_hedging_enabled: bool = False
+    chat_hedge_percentile: float = 0.9  # Hedge once the primary exceeds this latency percentile
+    chat_hedge_initial_delay: float = 5.0  # Used until enough latency samples exist
+    chat_hedge_min_delay: float = 1.0
+    chat_hedge_max_delay: float = 10.0
+    
+    # Resume text sent to LLM parse prompts: cleaned, then fit into a token budget
+    parse_prompt_condense: bool = True
+    parse_prompt_token_budget: int = 2000  # Contact and experience are kept first
+    
+    # Interview chat context: recent turns verbatim, older turns summarized
+    chat_context_token_budget: int = 2000
+    chat_context_keep_messages: int = 6
+    chat_context_summary_tokens: int = 250
+    
+    # LLM admission control: concurrent calls per provider and queue limits
+    llm_concurrency_ollama: int = 2
+    llm_concurrency_openai: int = 8
+    llm_max_queue: int = 100
+    llm_queue_timeout_interactive: float = 10.0
+    llm_queue_timeout_parse: float = 60.0
+    llm_queue_timeout_batch: float = 300.0
+    
+    # Background resume intake (uploads are acknowledged before parsing)
+    upload_dir: str = "uploads"
+    intake_max_workers: int = 2
+    intake_poll_interval: float = 2.0
+    intake_max_attempts: int = 3
+    
+    # Bulk resume import (zip or multi-file upload per recruitment)
+    bulk_import_max_workers: int = 4  # Parallel parse/score calls; the LLM scheduler still caps provider load
+    bulk_import_batch_size: int = 25  # Candidates inserted per commit
+    bulk_import_max_files: int = 500
+    bulk_import_max_file_mb: int = 10
+    bulk_import_max_total_mb: int = 200  # Whole upload, and unpacked zip contents
+    bulk_import_job_ttl_seconds: float = 3600.0  # Finished job progress kept in memory this long (lost on restart)
+    bulk_import_max_finished_jobs: int = 50
+    
+    # Ollama models per task (empty = ollama_model), warmed up at startup
+    ollama_model: str = "phi3"
+    ollama_model_parse: str = ""
+    ollama_model_score: str = ""
+    ollama_model_chat: str = ""  # Also used for interview summaries
+    ollama_model_evaluate: str = ""
+    ollama_warmup_enabled: bool = True
+    ollama_warmup_timeout: float = 300.0  # A cold load of a large model can take minutes
+    ollama_warmup_retry_interval: float = 30.0
+    ollama_keepalive_refresh: float = 600.0  # Re-ping loaded models this often (0 = never)
+    
+    # Ollama context reuse for interview sessions
+    ollama_keep_alive: str = "30m"  # Keep the model (and its KV cache) loaded between turns
+    ollama_num_ctx: int = 4096
+    ollama_context_max_tokens: int = 3072  # Rebuild from compacted history beyond this
+    ollama_context_max_sessions: int = 500
+    
+    # Provider routing: fastest healthy provider first (EWMA latency + error rate)
+    provider_routing_enabled: bool = True
+    routing_ewma_alpha: float = 0.2
+    routing_error_penalty: float = 4.0  # Cost multiplier per unit of error rate
+    routing_min_samples: int = 5
+    routing_prior_latency: float = 5.0  # Assumed latency until a provider has enough samples
+    routing_stale_seconds: float = 120.0  # Re-measure a provider whose stats are older than this
+    # Operator overrides, e.g. "openai,ollama" (pins the order, unlisted providers are skipped)
+    provider_order_parse: str = ""
+    provider_order_score: str = ""
+    provider_order_chat: str = ""
+    
+    # Background interview evaluation (submit returns before the LLM runs)
+    evaluation_max_workers: int = 2
+    evaluation_poll_interval: float = 2.0
+    evaluation_max_attempts: int = 3
+    evaluation_retry_delay: float = 30.0  # Multiplied by the attempt number
+    
+    # PDF text extraction budgets (a resume is a few pages)
+    pdf_max_pages: int = 20
+    pdf_max_chars: int = 100_000
+    pdf_enough_chars: int = 30_000  # Stop at a page boundary once this much text is extracted
+    pdf_time_budget: float = 10.0  # Seconds, checked between pages
+    
+    # Resume text extraction in worker processes (killed and replaced on timeout)
+    extraction_process_pool: bool = True  # False = extract in the request thread
+    extraction_processes: int = 0  # 0 = one per CPU core; keep file_executor_workers at least this high
+    extraction_timeout: float = 30.0
+    extraction_memory_limit_mb: int = 1024  # Address-space limit per worker (0 = none)
+    extraction_max_jobs_per_worker: int = 200
+    
+    # Skills taxonomy JSON for the skill matcher (empty = bundled app/data/skills_taxonomy.json)
+    skills_taxonomy_path: str = ""
+    
+    # Thread pools for blocking work called from async endpoints
+    db_executor_workers: int = 8
+    file_executor_workers: int = 4
+    
+    # Event loop lag monitoring (reported in /health)
+    loop_monitor_interval: float = 0.1
+    loop_stall_threshold: float = 0.25
+    
     class Config:
         env_file = ".env"
 
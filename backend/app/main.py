@@ -1,10 +1,21 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, JSONResponse
+import time
 from app.database import engine, Base, get_settings
+from app.migrations import add_missing_columns
 from app.routers import recruitment, candidates, interview
+from app.services.ai_service import get_ai_service
+from app.services.resume_intake import get_intake_manager
+from app.services.executors import executor_stats, shutdown_executors
+from app.services.resume_parser import get_document_extractor, shutdown_document_extractor
+from app.services.loop_monitor import get_loop_monitor
+from app.services.evaluation_worker import get_evaluation_manager
+from app.services.metrics import REGISTRY, HTTP_REQUEST_SECONDS, gauges_from
 
-# Create database tables
+# Create database tables, then add columns introduced since an existing database was created
 Base.metadata.create_all(bind=engine)
+add_missing_columns(engine, Base.metadata)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -32,6 +43,80 @@ app.include_router(recruitment.router)
 app.include_router(candidates.router)
 app.include_router(interview.router)
 
+@app.middleware("http")
+async def record_request_duration(request: Request, call_next):
+    """Request latency per route template (not raw path, to keep label cardinality bounded)"""
+    started = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    HTTP_REQUEST_SECONDS.observe(
+        time.perf_counter() - started,
+        method=request.method,
+        route=getattr(route, "path", "unmatched"),
+        status=str(response.status_code)
+    )
+    return response
+
+def _runtime_metrics():
+    """Gauges read from live state on each /metrics scrape"""
+    ai_service = get_ai_service()
+    scheduler = ai_service.scheduler_stats()
+    providers = ai_service.health_snapshot()
+    caches = ai_service.cache_stats()
+    loop = get_loop_monitor().snapshot()
+    return [
+        gauges_from("candidly_llm_active_calls", "LLM calls currently holding a scheduler slot", ("provider",),
+                    {(name,): lane["active"] for name, lane in scheduler.items()}),
+        gauges_from("candidly_llm_queue_depth", "LLM calls waiting for a scheduler slot", ("provider",),
+                    {(name,): lane["queue_depth"] for name, lane in scheduler.items()}),
+        gauges_from("candidly_provider_available", "1 if the provider is reachable and its circuit is not open", ("provider",),
+                    {(name,): 1 if state["available"] else 0 for name, state in providers.items()}),
+        gauges_from("candidly_cache_lookups", "Cache lookups since start by result", ("cache", "result"),
+                    {(cache, result): stats[result]
+                     for cache, stats in caches.items() for result in ("hits", "misses") if result in stats}),
+        gauges_from("candidly_event_loop_lag_seconds", "Event loop scheduling lag over the recent window", ("stat",),
+                    {("p50",): loop["lag_seconds_p50"], ("p99",): loop["lag_seconds_p99"], ("max",): loop["lag_seconds_max"]}),
+        gauges_from("candidly_executor_queued", "Blocking calls waiting for a pool thread", ("pool",),
+                    {(pool,): stats["queued"] for pool, stats in executor_stats().items()}),
+    ]
+
+REGISTRY.register_collector(_runtime_metrics)
+
+@app.on_event("startup")
+def start_provider_health_monitor():
+    """Refresh provider health in the background instead of probing per request"""
+    get_ai_service().start_health_monitor()
+
+@app.on_event("startup")
+async def start_model_warmup():
+    """Load the configured Ollama models now rather than inside the first user request"""
+    get_ai_service().start_model_warmup()
+
+@app.on_event("startup")
+def start_resume_intake_workers():
+    """Resume queued uploads (including any interrupted by a restart)"""
+    get_intake_manager().start()
+
+@app.on_event("startup")
+async def start_loop_monitor():
+    """Track event loop lag so blocking calls in async endpoints show up in /health"""
+    get_loop_monitor().start()
+
+@app.on_event("startup")
+async def start_evaluation_workers():
+    """Score submitted interviews in the background (including any interrupted by a restart)"""
+    await get_evaluation_manager().start()
+
+@app.on_event("shutdown")
+async def close_ai_service():
+    """Stop background workers and close pooled LLM provider connections"""
+    await get_loop_monitor().stop()
+    await get_evaluation_manager().stop()
+    get_intake_manager().stop()
+    await get_ai_service().aclose()
+    shutdown_executors()
+    shutdown_document_extractor()
+
 @app.get("/")
 def read_root():
     return {
@@ -42,7 +127,33 @@ def read_root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
+    """Liveness: always 200 while the process serves requests, with diagnostics"""
+    body = {
+        "status": "healthy",
+        "ready": get_ai_service().ready,
+        "models": get_ai_service().warmup_snapshot(),
+        "providers": get_ai_service().health_snapshot(),
+        "caches": get_ai_service().cache_stats(),
+        "routing": get_ai_service().provider_stats(),
+        "scheduler": get_ai_service().scheduler_stats(),
+        "event_loop": get_loop_monitor().snapshot(),
+        "executors": executor_stats(),
+        "extraction": get_document_extractor().stats(),
+        "llm_recording": get_ai_service().recording_stats()
+    }
+    return body
+
+@app.get("/ready")
+def readiness_check():
+    """Readiness: 503 until the startup model warm-up pass has finished, so traffic waits for warm models"""
+    ready = get_ai_service().ready
+    body = {"status": "ready" if ready else "warming_up", "models": get_ai_service().warmup_snapshot()}
+    return JSONResponse(body, status_code=200 if ready else 503)
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
 
 if __name__ == "__main__":
     import uvicorn
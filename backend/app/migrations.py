@@ -0,0 +1,54 @@
+"""
+Schema upgrades for existing databases
+create_all only creates missing tables; columns added to a table that already
+exists are added here at startup, in the order they were introduced
+"""
+
+from typing import List, Tuple
+
+from sqlalchemy import MetaData, inspect, literal
+from sqlalchemy.engine import Engine
+
+# (table, column) pairs added after the table first shipped; append, never reorder
+ADDED_COLUMNS: List[Tuple[str, str]] = [
+    ("candidates", "interview_strengths"),
+    ("candidates", "interview_improvements"),
+    ("candidates", "evaluation_status"),
+    ("candidates", "evaluation_attempts"),
+    ("candidates", "evaluation_error"),
+    ("candidates", "evaluation_retry_at"),
+    ("candidates", "evaluated_at"),
+]
+
+
+def add_missing_columns(bind: Engine, metadata: MetaData) -> List[str]:
+    """
+    ALTER TABLE ... ADD COLUMN for every ADDED_COLUMNS entry the database lacks
+
+    The column type, scalar default (so existing rows get it too) and indexes
+    come from the model. Columns are added as nullable. Idempotent: returns
+    the "table.column" names added on this run, empty once up to date.
+    """
+    inspector = inspect(bind)
+    tables = set(inspector.get_table_names())
+    preparer = bind.dialect.identifier_preparer
+    added = []
+    with bind.begin() as conn:
+        for table_name, column_name in ADDED_COLUMNS:
+            if table_name not in tables:
+                continue  # create_all just built it with every column
+            if column_name in {c["name"] for c in inspector.get_columns(table_name)}:
+                continue
+            table = metadata.tables[table_name]
+            column = table.columns[column_name]
+            ddl = f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.format_column(column)} " \
+                  f"{column.type.compile(dialect=bind.dialect)}"
+            if column.default is not None and column.default.is_scalar:
+                value = literal(column.default.arg).compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True})
+                ddl += f" DEFAULT {value}"
+            conn.exec_driver_sql(ddl)
+            for index in table.indexes:
+                if column in index.columns.values():
+                    index.create(conn, checkfirst=True)
+            added.append(f"{table_name}.{column_name}")
+    return added
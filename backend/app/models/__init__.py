@@ -1,4 +1,7 @@
 from .recruitment import Recruitment
 from .candidate import Candidate
+from .candidate_resume import CandidateResume
+from .resume_cache import ResumeParseCache
+from .intake_job import ResumeIntakeJob
 
-__all__ = ["Recruitment", "Candidate"]
+__all__ = ["Recruitment", "Candidate", "CandidateResume", "ResumeParseCache", "ResumeIntakeJob"]
@@ -21,7 +21,7 @@ class Candidate(Base):
     education = Column(String, nullable=True)
     
     # Status and Scores
-    status = Column(String, default="New")  # New, Shortlisted, Interviewed, Offered, Rejected
+    status = Column(String, default="New")  # New, Shortlisted, Evaluating, Interviewed, Offered, Rejected
     ats_score = Column(Integer)  # 0-100
     interview_score = Column(Integer, nullable=True)  # 0-100, null if not interviewed
     
@@ -32,6 +32,8 @@ class Candidate(Base):
     
     # Interview Data
     summary = Column(Text)  # AI-generated summary
+    interview_strengths = Column(JSON, nullable=True)  # List of strengths from the interview evaluation
+    interview_improvements = Column(JSON, nullable=True)  # List of gaps/areas to improve from the interview evaluation
     flags = Column(JSON, default=list)  # List of flag objects: [{"type": "sound", "severity": "high"}]
     transcript_url = Column(String, nullable=True)
     resume_url = Column(String, nullable=True)
@@ -45,6 +47,13 @@ class Candidate(Base):
     interview_ended_at = Column(DateTime, nullable=True)
     interview_question_index = Column(Integer, default=0)
     
+    # Background Interview Evaluation
+    evaluation_status = Column(String, nullable=True, index=True)  # pending, running, completed, failed
+    evaluation_attempts = Column(Integer, default=0)
+    evaluation_error = Column(Text, nullable=True)
+    evaluation_retry_at = Column(DateTime, nullable=True)
+    evaluated_at = Column(DateTime, nullable=True)
+    
     # Session Management
     session_token = Column(String, nullable=True, index=True)
     
@@ -54,5 +63,6 @@ class Candidate(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
-    # Relationship
+    # Relationships
     recruitment = relationship("Recruitment", back_populates="candidates")
+    stored_resume = relationship("CandidateResume", back_populates="candidate", uselist=False, cascade="all, delete-orphan")
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, LargeBinary
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.database import Base
+
+class CandidateResume(Base):
+    __tablename__ = "candidate_resumes"
+    
+    # One stored resume per candidate, kept out of the candidates table so
+    # listing candidates never loads resume text
+    candidate_id = Column(Integer, ForeignKey("candidates.id", ondelete="CASCADE"), primary_key=True)
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of the uploaded file bytes
+    filename = Column(String, nullable=True)
+    
+    # Extracted text, zlib-compressed UTF-8
+    text_compressed = Column(LargeBinary, nullable=False)
+    text_chars = Column(Integer, nullable=False)
+    compressed_bytes = Column(Integer, nullable=False)
+    
+    # Section name -> [start, end) character offsets into the text
+    sections = Column(JSON, nullable=True)  # {"contact": [0, 180], "experience": [180, 2400], ...}
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Relationship
+    candidate = relationship("Candidate", back_populates="stored_resume")
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from datetime import datetime
+from app.database import Base
+
+class ResumeIntakeJob(Base):
+    __tablename__ = "resume_intake_jobs"
+    
+    id = Column(String(32), primary_key=True)  # uuid4 hex, returned to the applicant
+    recruitment_id = Column(Integer, ForeignKey("recruitments.id", ondelete="CASCADE"), nullable=False)
+    
+    # Upload persisted to disk before the request returns
+    filename = Column(String, nullable=False)
+    file_path = Column(String, nullable=False)
+    
+    # Issued at upload time, attached to the candidate once processing finishes
+    session_token = Column(String, nullable=False, index=True)
+    
+    # Processing state
+    status = Column(String, default="queued", index=True)  # queued, running, completed, failed
+    stage = Column(String, default="queued")  # queued, extracting, parsing, scoring, saving, done
+    attempts = Column(Integer, default=0)
+    error = Column(Text, nullable=True)
+    parsing_method = Column(String, nullable=True)
+    candidate_id = Column(Integer, ForeignKey("candidates.id", ondelete="SET NULL"), nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -19,11 +19,18 @@ class Recruitment(Base):
     # Relationship
     candidates = relationship("Candidate", back_populates="recruitment", cascade="all, delete-orphan")
     
+    def job_requirements_text(self):
+        """Job description as sent to the ATS scorer"""
+        return f"""Position: {self.title}
+Department: {self.department}
+Location: {self.location}
+Requirements: {self.requirements or 'Not specified'}"""
+    
     def get_stats(self):
         """Calculate recruitment statistics"""
         total_applicants = len(self.candidates)
         shortlisted = sum(1 for c in self.candidates if c.status == "Shortlisted")
-        interviewed = sum(1 for c in self.candidates if c.status == "Interviewed")
+        interviewed = sum(1 for c in self.candidates if c.status in ("Interviewed", "Evaluating"))
         offered = sum(1 for c in self.candidates if c.status == "Offered")
         
         return {
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Text
+from datetime import datetime
+from app.database import Base
+
+class ResumeParseCache(Base):
+    __tablename__ = "resume_parse_cache"
+    
+    # SHA-256 of the uploaded file bytes
+    content_hash = Column(String(64), primary_key=True)
+    filename = Column(String, nullable=True)
+    size_bytes = Column(Integer, nullable=False)
+    
+    # Extraction + parse results
+    extracted_text = Column(Text, nullable=False)
+    parsed_data = Column(JSON, nullable=True)  # Normalized parse result, null until an AI provider parsed it
+    parsing_method = Column(String, nullable=True)  # ollama, openai
+    
+    # Usage (drives LRU eviction)
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_accessed_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -4,11 +4,12 @@ from typing import Optional
 import re
 
 from app.database import get_db
-from app.models import Candidate, Recruitment
+from app.models import Candidate, Recruitment, ResumeIntakeJob
 from app.schemas import (
     CandidateCreate, CandidateUpdate, CandidateResponse,
-    CandidateList, CandidateStatusUpdate
+    CandidateList, CandidateStatusUpdate, CandidateResumeText
 )
+from app.services.resume_store import resume_text
 
 router = APIRouter(prefix="/api/candidates", tags=["candidates"])
 
@@ -217,11 +218,54 @@ def delete_candidate(candidate_id: int, db: Session = Depends(get_db)):
             detail="Candidate not found"
         )
     
+    # Same as the FK's ON DELETE SET NULL, for databases that don't enforce it
+    db.query(ResumeIntakeJob).filter(ResumeIntakeJob.candidate_id == candidate_id).update(
+        {ResumeIntakeJob.candidate_id: None}, synchronize_session=False
+    )
     db.delete(db_candidate)
     db.commit()
     
     return None
 
+@router.get("/{candidate_id}/resume-text", response_model=CandidateResumeText)
+def get_candidate_resume_text(
+    candidate_id: int,
+    section: Optional[str] = Query(None, description="contact, summary, experience, education, skills, projects, certifications, interests, references or declaration"),
+    db: Session = Depends(get_db)
+):
+    """Stored resume text (or one section of it), without touching the original file"""
+    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    
+    if not candidate:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Candidate not found"
+        )
+    
+    stored = candidate.stored_resume
+    if stored is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume text not stored for this candidate"
+        )
+    
+    text = resume_text(stored, section)
+    if text is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Resume has no {section} section"
+        )
+    
+    return CandidateResumeText(
+        candidate_id=candidate.id,
+        filename=stored.filename,
+        section=section,
+        text=text,
+        text_chars=stored.text_chars,
+        compressed_bytes=stored.compressed_bytes,
+        sections=stored.sections or {}
+    )
+
 @router.get("/{candidate_id}/transcript")
 def get_candidate_transcript(candidate_id: int, db: Session = Depends(get_db)):
     """Download candidate interview transcript"""
@@ -1,12 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Optional, List
+import json
 import secrets
 import string
 
 from app.database import get_db
-from app.models import Recruitment
-from app.schemas import RecruitmentCreate, RecruitmentUpdate, RecruitmentResponse, RecruitmentStats
+from app.models import Recruitment, ResumeIntakeJob
+from app.schemas import RecruitmentCreate, RecruitmentUpdate, RecruitmentResponse, RecruitmentStats, RescoreJobResponse, BulkImportJobResponse
+from app.services.ai_service import get_ai_service
+from app.services.rescoring import get_rescoring_manager
+from app.services.bulk_import import get_bulk_import_manager, BulkImportJob, ImportLimitError
+from app.services.executors import run_db, run_file
 
 router = APIRouter(prefix="/api/recruitment", tags=["recruitment"])
 
@@ -93,6 +99,8 @@ def update_recruitment(
             detail="Recruitment not found"
         )
     
+    old_job_requirements = db_recruitment.job_requirements_text()
+    
     # Update only provided fields
     update_data = recruitment_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
@@ -101,6 +109,10 @@ def update_recruitment(
     db.commit()
     db.refresh(db_recruitment)
     
+    # Cached ATS scores for the old requirements are stale now
+    if db_recruitment.job_requirements_text() != old_job_requirements:
+        get_ai_service().invalidate_ats_scores(old_job_requirements)
+    
     # Add stats
     stats = db_recruitment.get_stats()
     response = RecruitmentResponse.model_validate(db_recruitment)
@@ -119,9 +131,15 @@ def delete_recruitment(recruitment_id: int, db: Session = Depends(get_db)):
             detail="Recruitment not found"
         )
     
+    job_requirements = db_recruitment.job_requirements_text()
+    
+    # Same as the FK's ON DELETE CASCADE, for databases that don't enforce it
+    db.query(ResumeIntakeJob).filter(ResumeIntakeJob.recruitment_id == recruitment_id).delete(synchronize_session=False)
     db.delete(db_recruitment)
     db.commit()
     
+    get_ai_service().invalidate_ats_scores(job_requirements)
+    
     return None
 
 @router.get("/{recruitment_id}/stats", response_model=RecruitmentStats)
@@ -138,6 +156,125 @@ def get_recruitment_stats(recruitment_id: int, db: Session = Depends(get_db)):
     stats = recruitment.get_stats()
     return RecruitmentStats(**stats)
 
+@router.post("/{recruitment_id}/rescore", response_model=RescoreJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def start_rescoring(recruitment_id: int, db: Session = Depends(get_db)):
+    """Re-run ATS scoring for every candidate against the current requirements"""
+    recruitment = db.query(Recruitment).filter(Recruitment.id == recruitment_id).first()
+    
+    if not recruitment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Recruitment not found"
+        )
+    
+    job = get_rescoring_manager().start(recruitment_id)
+    return RescoreJobResponse(**job.to_dict())
+
+@router.get("/{recruitment_id}/rescore/{job_id}", response_model=RescoreJobResponse)
+def get_rescoring_status(recruitment_id: int, job_id: str):
+    """Poll progress of a re-scoring job (kept in memory: finished jobs expire, and all are lost on restart)"""
+    job = get_rescoring_manager().get(job_id)
+    
+    if not job or job.recruitment_id != recruitment_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Re-scoring job not found (it may have expired or the server restarted)"
+        )
+    
+    return RescoreJobResponse(**job.to_dict())
+
+def _get_recruitment(db: Session, recruitment_id: int) -> Optional[Recruitment]:
+    return db.query(Recruitment).filter(Recruitment.id == recruitment_id).first()
+
+def _import_events(job: BulkImportJob) -> StreamingResponse:
+    """NDJSON stream of a bulk import's events, from the first one to the final "done" event"""
+    async def event_stream():
+        queue = job.subscribe()
+        try:
+            while True:
+                event = await queue.get()
+                yield json.dumps(event, default=str) + "\n"
+                if event["event"] == "done":
+                    return
+        finally:
+            job.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "X-Import-Job-Id": job.id}
+    )
+
+@router.post("/{recruitment_id}/import")
+async def bulk_import_resumes(
+    recruitment_id: int,
+    files: List[UploadFile] = File(...),
+    db: Session = Depends(get_db)
+):
+    """Import a zip and/or several PDF/DOCX resumes as candidates of this recruitment
+
+    Streams newline-delimited JSON: `{"event": "started", "total": N}` once the
+    upload is unpacked, one `{"event": "file", "filename": ..., "status": "imported" |
+    "failed" | "skipped", ...}` per document and a final `{"event": "done", ...}` summary. The import keeps
+    running if the client disconnects; see GET /{recruitment_id}/import/{job_id}.
+    """
+    recruitment = await run_db(_get_recruitment, db, recruitment_id)
+    
+    if not recruitment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Recruitment not found"
+        )
+    
+    manager = get_bulk_import_manager()
+    job = await run_file(manager.create, recruitment_id)
+    try:
+        # Copy each upload to disk in chunks; nothing is held in memory whole
+        stored = 0
+        for index, upload in enumerate(files):
+            stored += await run_file(manager.store_upload, job, index, upload.filename, upload.file, stored)
+    except ImportLimitError as e:
+        await run_file(manager.discard, job)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+    except ValueError as e:
+        await run_file(manager.discard, job)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    manager.start(job)
+    return _import_events(job)
+
+@router.get("/{recruitment_id}/import/{job_id}", response_model=BulkImportJobResponse)
+def get_bulk_import_status(recruitment_id: int, job_id: str):
+    """Poll progress of a bulk import"""
+    job = get_bulk_import_manager().get(job_id)
+    
+    if not job or job.recruitment_id != recruitment_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import job not found (it may have expired or the server restarted)"
+        )
+    
+    return BulkImportJobResponse(**job.to_dict())
+
+@router.get("/{recruitment_id}/import/{job_id}/events")
+def stream_bulk_import_events(recruitment_id: int, job_id: str):
+    """Re-open the event stream of a bulk import (replays earlier events)"""
+    job = get_bulk_import_manager().get(job_id)
+    
+    if not job or job.recruitment_id != recruitment_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import job not found (it may have expired or the server restarted)"
+        )
+    
+    return _import_events(job)
+
 @router.post("/regenerate-code/{recruitment_id}", response_model=dict)
 def regenerate_interview_code(recruitment_id: int, db: Session = Depends(get_db)):
     """Regenerate interview access code"""
@@ -1,14 +1,14 @@
-from .recruitment import RecruitmentCreate, RecruitmentUpdate, RecruitmentResponse, RecruitmentStats
-from .candidate import CandidateCreate, CandidateUpdate, CandidateResponse, CandidateList, CandidateStatusUpdate
+from .recruitment import RecruitmentCreate, RecruitmentUpdate, RecruitmentResponse, RecruitmentStats, RescoreJobResponse, BulkImportJobResponse
+from .candidate import CandidateCreate, CandidateUpdate, CandidateResponse, CandidateList, CandidateStatusUpdate, CandidateResumeText
 from .interview import (
-    InterviewCodeValidation, ResumeUploadResponse, SessionToken, 
+    InterviewCodeValidation, ResumeIntakeResponse, ResumeIntakeStatus, SessionToken, 
     InterviewStartRequest, InterviewSubmitRequest,
     ChatMessage, ChatResponse, FlagUpdate
 )
 
 __all__ = [
-    "RecruitmentCreate", "RecruitmentUpdate", "RecruitmentResponse", "RecruitmentStats",
-    "CandidateCreate", "CandidateUpdate", "CandidateResponse", "CandidateList", "CandidateStatusUpdate",
-    "InterviewCodeValidation", "ResumeUploadResponse", "SessionToken", "InterviewStartRequest", "InterviewSubmitRequest",
+    "RecruitmentCreate", "RecruitmentUpdate", "RecruitmentResponse", "RecruitmentStats", "RescoreJobResponse", "BulkImportJobResponse",
+    "CandidateCreate", "CandidateUpdate", "CandidateResponse", "CandidateList", "CandidateStatusUpdate", "CandidateResumeText",
+    "InterviewCodeValidation", "ResumeIntakeResponse", "ResumeIntakeStatus", "SessionToken", "InterviewStartRequest", "InterviewSubmitRequest",
     "ChatMessage", "ChatResponse", "FlagUpdate"
 ]
@@ -32,7 +32,7 @@ class CandidateUpdate(BaseModel):
     transcript_url: Optional[str] = None
 
 class CandidateStatusUpdate(BaseModel):
-    status: str  # New, Shortlisted, Interviewed, Offered, Rejected
+    status: str  # New, Shortlisted, Evaluating, Interviewed, Offered, Rejected
 
 class CandidateResponse(CandidateBase):
     id: int
@@ -44,6 +44,12 @@ class CandidateResponse(CandidateBase):
     ats_gaps: Optional[List[str]] = None
     ats_reasoning: Optional[str] = None
     summary: Optional[str] = None
+    interview_strengths: Optional[List[str]] = None
+    interview_improvements: Optional[List[str]] = None
+    evaluation_status: Optional[str] = None  # pending, running, completed, failed
+    evaluation_attempts: Optional[int] = None
+    evaluation_error: Optional[str] = None
+    evaluated_at: Optional[datetime] = None
     flags: Optional[List[Dict]] = []
     transcript_url: Optional[str] = None
     resume_url: Optional[str] = None
@@ -57,3 +63,12 @@ class CandidateResponse(CandidateBase):
 class CandidateList(BaseModel):
     candidates: List[CandidateResponse]
     total: int
+
+class CandidateResumeText(BaseModel):
+    candidate_id: int
+    filename: Optional[str] = None
+    section: Optional[str] = None  # None = full text
+    text: str
+    text_chars: int
+    compressed_bytes: int
+    sections: Dict[str, List[int]] = {}  # Section name -> [start, end) offsets into the full text
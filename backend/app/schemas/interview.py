@@ -1,15 +1,28 @@
 from pydantic import BaseModel
 from typing import Optional
+from datetime import datetime
 
 class InterviewCodeValidation(BaseModel):
     interview_code: str
 
-class ResumeUploadResponse(BaseModel):
-    candidate_id: int
+class ResumeIntakeResponse(BaseModel):
+    job_id: str
     session_token: str
-    candidate_name: str
+    status: str
     message: str
 
+class ResumeIntakeStatus(BaseModel):
+    job_id: str
+    status: str  # queued, running, completed, failed
+    stage: str  # queued, extracting, parsing, scoring, saving, done
+    attempts: int
+    error: Optional[str] = None
+    candidate_id: Optional[int] = None
+    candidate_name: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
 class SessionToken(BaseModel):
     token: str
     candidate_id: int
@@ -35,3 +35,31 @@ class RecruitmentResponse(RecruitmentBase):
     
     class Config:
         from_attributes = True
+
+class RescoreJobResponse(BaseModel):
+    job_id: str
+    recruitment_id: int
+    status: str  # queued, running, completed, failed
+    total: int
+    processed: int
+    failed: int
+    progress: float  # 0-1
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+class BulkImportJobResponse(BaseModel):
+    job_id: str
+    recruitment_id: int
+    status: str  # queued, running, completed, failed
+    total: int
+    processed: int
+    imported: int
+    failed: int
+    skipped: int
+    progress: float  # 0-1
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
@@ -3,9 +3,30 @@ Unified AI Service Manager
 Handles resume parsing and ATS scoring with multiple AI providers
 """
 
-from typing import Dict, Any, Optional, Literal
+from typing import Dict, Any, Optional, Literal, AsyncIterator
 from enum import Enum
+import asyncio
+import functools
 import json
+import time
+
+from app.services.llm_recording import build_ollama_transport
+from app.services.provider_health import ProviderHealth, ProviderHealthRegistry
+from app.services.provider_stats import LatencyTracker
+from app.services.provider_routing import ProviderRouter
+from app.services.llm_scheduler import LLMScheduler, Priority, SchedulerError
+from app.services.executors import run_db, run_file
+from app.services.resume_cache import ResumeCache
+from app.services.score_cache import ScoreCache
+from app.services.chat_context import ConversationContextManager
+from app.services.prompt_condenser import ResumeCondenser
+from app.services.ollama_sessions import OllamaContextCache
+from app.services.model_warmup import OllamaWarmup
+from app.services.skill_matcher import get_skill_matcher
+from app.services.metrics import (
+    llm_call, classify_error, record_llm_attempt, record_llm_exchange, record_result, time_stage,
+    PDF_EXTRACTIONS, PDF_PAGES, PARSE_PROMPT_RATIO
+)
 
 # AI Provider configurations
 class AIProvider(Enum):
@@ -22,31 +43,436 @@ class AIService:
     """
     
     def __init__(self):
+        from app.database import get_settings
+        
+        settings = get_settings()
         self._gemini_model = None
         self._openai_client = None
+        self._async_openai_client = None
+        # Shared keep-alive pool for every Ollama call (sync and async);
+        # optionally recording responses to, or replaying them from, fixtures
+        self._ollama = build_ollama_transport(
+            settings.ollama_base_url,
+            record_mode=settings.llm_record_mode,
+            fixtures_dir=settings.llm_fixtures_dir,
+            max_connections=settings.ollama_max_connections,
+            max_keepalive_connections=settings.ollama_max_keepalive_connections,
+            keepalive_expiry=settings.ollama_keepalive_expiry,
+            observer=self._observe_ollama
+        )
+        # Shared health state: probed in the background, not before every call
+        self._health = ProviderHealthRegistry(interval=settings.provider_health_interval)
+        for provider, probe in [
+            (AIProvider.OLLAMA, self._probe_ollama),
+            (AIProvider.OPENAI, None),
+        ]:
+            self._health.register(ProviderHealth(
+                provider.value,
+                probe=probe,
+                failure_threshold=settings.circuit_failure_threshold,
+                cooldown_seconds=settings.circuit_cooldown_seconds
+            ))
+    
+        # Repeat uploads of the same file skip extraction and parsing
+        self._resume_cache = ResumeCache(
+            max_entries=settings.resume_cache_max_entries,
+            max_text_bytes=settings.resume_cache_max_bytes
+        )
+        # Identical profile + requirements + model never hits the LLM twice
+        self._score_cache = ScoreCache(max_entries=settings.ats_cache_max_entries)
+        # Latency samples and hedge wins, used to pick the hedge delay
+        self._latency = LatencyTracker()
+        self._hedge_percentile = settings.chat_hedge_percentile
+        self._hedge_min_delay = settings.chat_hedge_min_delay
+        self._hedge_max_delay = settings.chat_hedge_max_delay
+        self._hedge_initial_delay = settings.chat_hedge_initial_delay
+        # Provider order per task follows observed latency and error rate
+        self._router = ProviderRouter(
+            alpha=settings.routing_ewma_alpha,
+            error_penalty=settings.routing_error_penalty,
+            min_samples=settings.routing_min_samples,
+            prior_latency=settings.routing_prior_latency,
+            stale_after=settings.routing_stale_seconds,
+            overrides={
+                "parse": settings.provider_order_parse,
+                "score": settings.provider_order_score,
+                "chat": settings.provider_order_chat,
+            },
+            enabled=settings.provider_routing_enabled
+        )
+        # Providers without credentials are never routed to, whatever their cost
+        self._configured = {
+            AIProvider.OLLAMA: True,
+            AIProvider.OPENAI: bool(settings.openai_api_key),
+            AIProvider.GEMINI: bool(settings.gemini_api_key),
+        }
+        # Per-provider concurrency caps with a priority queue (chat > parse > batch)
+        self._scheduler = LLMScheduler(
+            concurrency={
+                AIProvider.OLLAMA.value: settings.llm_concurrency_ollama,
+                AIProvider.OPENAI.value: settings.llm_concurrency_openai,
+            },
+            max_queue=settings.llm_max_queue,
+            queue_timeouts={
+                Priority.INTERACTIVE: settings.llm_queue_timeout_interactive,
+                Priority.PARSE: settings.llm_queue_timeout_parse,
+                Priority.BATCH: settings.llm_queue_timeout_batch,
+            }
+        )
+        # Token-bounded interview history with a rolling per-session summary
+        self._chat_context = ConversationContextManager(
+            token_budget=settings.chat_context_token_budget,
+            keep_messages=settings.chat_context_keep_messages,
+            summary_tokens=settings.chat_context_summary_tokens,
+            summarizer=self._asummarize_turns
+        )
+        # Resume text is condensed before it goes into parse prompts
+        self._resume_condenser = ResumeCondenser(
+            token_budget=settings.parse_prompt_token_budget,
+            enabled=settings.parse_prompt_condense
+        )
+        # Ollama KV context per interview session: later turns only send the new message
+        self._ollama_contexts = OllamaContextCache(
+            max_sessions=settings.ollama_context_max_sessions,
+            max_context_tokens=settings.ollama_context_max_tokens
+        )
+        self._ollama_keep_alive = settings.ollama_keep_alive
+        self._ollama_num_ctx = settings.ollama_num_ctx
+        # Ollama model per task; summaries run on the chat model
+        chat_model = settings.ollama_model_chat or settings.ollama_model
+        self._ollama_models = {
+            "parse": settings.ollama_model_parse or settings.ollama_model,
+            "score": settings.ollama_model_score or settings.ollama_model,
+            "chat": chat_model,
+            "summary": chat_model,
+            "evaluate": settings.ollama_model_evaluate or settings.ollama_model,
+        }
+        # Preload those models at startup and keep them resident
+        self._warmup = OllamaWarmup(
+            self._ollama,
+            list(self._ollama_models.values()),
+            keep_alive=settings.ollama_keep_alive,
+            timeout=settings.ollama_warmup_timeout,
+            retry_interval=settings.ollama_warmup_retry_interval,
+            refresh_interval=settings.ollama_keepalive_refresh,
+            # Replayed fixtures need no model; without an Ollama URL there is nothing to load
+            enabled=settings.ollama_warmup_enabled and settings.llm_record_mode != "replay" and bool(settings.ollama_base_url)
+        )
+    
+    def start_health_monitor(self):
+        """Start refreshing provider health in the background"""
+        self._health.start()
+    
+    def start_model_warmup(self):
+        """Load the configured Ollama models in the background (call from the running loop)"""
+        self._warmup.start()
+    
+    @property
+    def ready(self) -> bool:
+        """False until the startup model warm-up pass has finished"""
+        return self._warmup.ready
+    
+    def warmup_snapshot(self) -> Dict[str, Any]:
+        """Load state of each configured Ollama model"""
+        return self._warmup.snapshot()
+    
+    def _ollama_model(self, task: str) -> str:
+        return self._ollama_models[task]
+    
+    def health_snapshot(self) -> Dict[str, Any]:
+        """Current health and circuit state for every provider"""
+        return self._health.snapshot()
+    
+    def scheduler_stats(self) -> Dict[str, Any]:
+        """Queue depth, active calls and wait times per provider"""
+        return self._scheduler.snapshot()
+    
+    def provider_stats(self) -> Dict[str, Any]:
+        """Per-provider latency percentiles, hedge wins and routing costs"""
+        stats = self._latency.snapshot()
+        stats["routing"] = self._router.snapshot()
+        return stats
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the AI caches"""
+        return {
+            "resume_parse": self._resume_cache.stats(),
+            "ats_score": self._score_cache.stats(),
+            "ollama_context": self._ollama_contexts.stats()
+        }
+    
+    def recording_stats(self) -> Optional[Dict[str, Any]]:
+        """Fixture counters when LLM record/replay is enabled"""
+        stats = getattr(self._ollama, "stats", None)
+        return stats() if stats else None
+    
+    def invalidate_ats_scores(self, job_requirements: str) -> int:
+        """Forget cached ATS results computed against this requirements text"""
+        return self._score_cache.invalidate_requirements(job_requirements)
+    
+    def close(self):
+        """Release pooled sync connections"""
+        self._health.stop()
+        self._ollama.close()
+    
+    async def aclose(self):
+        """Release pooled sync and async connections"""
+        self._health.stop()
+        await self._warmup.stop()
+        await self._ollama.aclose()
+        if self._async_openai_client is not None:
+            await self._async_openai_client.close()
+            self._async_openai_client = None
+    
+    def _route(self, task: str, providers: list) -> list:
+        """Order (provider, func) pairs for this task (fastest healthy first), dropping unconfigured providers"""
+        providers = [pair for pair in providers if self._configured.get(pair[0], True)]
+        return self._router.order(task, providers, name=lambda pair: pair[0].value)
+    
+    def _try_providers(self, providers: list, task: str, *args, priority: Priority = Priority.PARSE):
+        """
+        Call providers in routed order, skipping any whose circuit is open
+        Each call waits for a scheduler slot at the given priority; a provider
+        whose queue is full or too slow is skipped without counting as a failure.
+        Returns (provider, result) or (None, None) if every provider failed
+        """
+        for provider, func in self._route(task, providers):
+            health = self._health.get(provider.value)
+            if not health.allow_request():
+                record_llm_attempt(provider.value, task, "circuit_open")
+                continue
+            started = None
+            try:
+                with self._scheduler.slot(provider.value, priority), llm_call(provider.value, task):
+                    started = time.monotonic()
+                    result = func(*args)
+                    elapsed = time.monotonic() - started
+            except SchedulerError:
+                health.release()
+                record_llm_attempt(provider.value, task, "rejected")
+                continue
+            except json.JSONDecodeError:
+                # The provider answered, the model output was just unusable
+                health.record_success()
+                self._router.record_failure(provider.value, task)
+                record_llm_attempt(provider.value, task, "invalid_output", time.monotonic() - started)
+                continue
+            except Exception as e:
+                health.record_failure(e)
+                self._router.record_failure(provider.value, task)
+                record_llm_attempt(provider.value, task, classify_error(e), self._since(started))
+                continue
+            health.record_success()
+            self._router.record_success(provider.value, task, elapsed)
+            record_llm_attempt(provider.value, task, "success", elapsed)
+            return provider, result
+        return None, None
+    
+    async def _atry_providers(self, providers: list, task: str, *args, priority: Priority = Priority.PARSE):
+        """Async variant of _try_providers"""
+        for provider, func in self._route(task, providers):
+            health = self._health.get(provider.value)
+            if not health.allow_request():
+                record_llm_attempt(provider.value, task, "circuit_open")
+                continue
+            started = None
+            try:
+                async with self._scheduler.aslot(provider.value, priority):
+                    with llm_call(provider.value, task):
+                        started = time.monotonic()
+                        result = await func(*args)
+                        elapsed = time.monotonic() - started
+            except SchedulerError:
+                health.release()
+                record_llm_attempt(provider.value, task, "rejected")
+                continue
+            except json.JSONDecodeError:
+                health.record_success()
+                self._router.record_failure(provider.value, task)
+                record_llm_attempt(provider.value, task, "invalid_output", time.monotonic() - started)
+                continue
+            except Exception as e:
+                health.record_failure(e)
+                self._router.record_failure(provider.value, task)
+                record_llm_attempt(provider.value, task, classify_error(e), self._since(started))
+                continue
+            health.record_success()
+            self._router.record_success(provider.value, task, elapsed)
+            record_llm_attempt(provider.value, task, "success", elapsed)
+            return provider, result
+        return None, None
+    
+    def _since(self, started: Optional[float]) -> Optional[float]:
+        """Elapsed time for a call that may have failed before it started"""
+        return time.monotonic() - started if started is not None else None
+    
+    def _hedge_delay(self, provider: AIProvider, task: str) -> float:
+        """How long to wait on `provider` before racing the next one"""
+        observed = self._latency.percentile(provider.value, task, self._hedge_percentile)
+        if observed is None:
+            return self._hedge_initial_delay
+        return max(self._hedge_min_delay, min(self._hedge_max_delay, observed))
+    
+    async def _ahedged_providers(self, providers: list, task: str, *args, priority: Priority = Priority.INTERACTIVE):
+        """
+        Hedged variant of _atry_providers
+        
+        Starts the first provider; if it hasn't answered within its hedge delay
+        the next provider is started in parallel. The first good answer wins and
+        the other in-flight calls are cancelled. A provider that fails outright
+        is replaced by the next one immediately.
+        """
+        remaining = self._route(task, providers)
+        in_flight: Dict[asyncio.Task, AIProvider] = {}
+        
+        async def timed_call(provider, func):
+            # Queue wait counts: the hedge delay tracks what the caller experiences
+            started = time.monotonic()
+            async with self._scheduler.aslot(provider.value, priority):
+                admitted = time.monotonic()
+                try:
+                    with llm_call(provider.value, task):
+                        result = await func(*args)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    record_llm_attempt(
+                        provider.value, task,
+                        "invalid_output" if isinstance(e, json.JSONDecodeError) else classify_error(e),
+                        time.monotonic() - admitted
+                    )
+                    raise
+            finished = time.monotonic()
+            self._latency.record(provider.value, task, finished - started)
+            self._router.record_success(provider.value, task, finished - admitted)
+            record_llm_attempt(provider.value, task, "success", finished - admitted)
+            return result
+        
+        def launch_next() -> Optional[AIProvider]:
+            while remaining:
+                provider, func = remaining.pop(0)
+                if self._health.get(provider.value).allow_request():
+                    in_flight[asyncio.create_task(timed_call(provider, func))] = provider
+                    return provider
+                record_llm_attempt(provider.value, task, "circuit_open")
+            return None
+        
+        newest = launch_next()
+        try:
+            while in_flight:
+                timeout = self._hedge_delay(newest, task) if remaining else None
+                done, _ = await asyncio.wait(in_flight.keys(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                
+                if not done:
+                    # Slow primary: race the next provider
+                    hedged = launch_next()
+                    if hedged is not None:
+                        newest = hedged
+                        self._latency.record_hedge(task)
+                    continue
+                
+                # Settle every finished call before returning, so none of them
+                # is left in in_flight for the cleanup below
+                winner = None
+                for finished in done:
+                    provider = in_flight.pop(finished)
+                    health = self._health.get(provider.value)
+                    error = finished.exception()
+                    if error is None:
+                        health.record_success()
+                        if winner is None:
+                            self._latency.record_win(provider.value, task)
+                            winner = provider, finished.result()
+                        continue
+                    if isinstance(error, SchedulerError):
+                        health.release()
+                        record_llm_attempt(provider.value, task, "rejected")
+                        continue
+                    if isinstance(error, json.JSONDecodeError):
+                        health.record_success()
+                    else:
+                        health.record_failure(error)
+                    self._router.record_failure(provider.value, task)
+                
+                if winner is not None:
+                    return winner
+                if not in_flight:
+                    newest = launch_next()
+        finally:
+            # Cancel the losers (only unfinished calls are left) and give back
+            # any half-open trial slots they held
+            losers = list(in_flight.items())
+            in_flight.clear()
+            for loser, provider in losers:
+                loser.cancel()
+                self._health.get(provider.value).release()
+            if losers:
+                await asyncio.gather(*(loser for loser, _ in losers), return_exceptions=True)
+        
+        return None, None
     
     # ==================== RESUME PARSING ====================
     
-    def parse_resume(self, file_content: bytes, filename: str) -> Dict[str, Any]:
+    def _extract_text(self, file_content: bytes, filename: str) -> str:
+        """Extract plain text from a PDF/DOCX upload (in an extraction worker process)"""
+        from app.services.resume_parser import get_document_extractor
+        
+        with time_stage("extract_text"):
+            text, stats = get_document_extractor().extract(file_content, filename)
+        if "pages_read" in stats:
+            PDF_EXTRACTIONS.inc(stop_reason=stats["stop_reason"])
+            PDF_PAGES.observe(stats["pages_read"])
+        
+        if not text.strip():
+            raise ValueError("Could not extract text from resume")
+        return text
+    
+    def _lookup_resume(self, file_content: bytes, filename: str):
+        """
+        Resolve an upload against the parse cache
+        Returns (cache_key, cached_entry_or_None, extracted_text)
+        """
+        key = self._resume_cache.key_for(file_content)
+        cached = self._resume_cache.get(key)
+        if cached is not None:
+            return key, cached, cached["text"]
+        
+        text = self._extract_text(file_content, filename)
+        self._resume_cache.put_text(key, filename, len(file_content), text)
+        return key, None, text
+    
+    def _condense_resume(self, text: str, document: Dict[str, Any]) -> str:
+        """Resume text for the LLM parse prompts; stats go to document["prompt"]"""
+        with time_stage("condense_prompt"):
+            condensed, stats = self._resume_condenser.condense(text)
+        PARSE_PROMPT_RATIO.observe(stats["ratio"])
+        document["prompt"] = stats
+        return condensed
+    
+    def parse_resume(self, file_content: bytes, filename: str, priority: Priority = Priority.PARSE) -> Dict[str, Any]:
         """
         Parse resume using available AI providers in priority order:
         1. Ollama (free, local, no limits)
         2. OpenAI (paid, cloud)
         3. Regex (basic fallback)
-        """
-        from app.services.resume_parser import extract_text_from_pdf, extract_text_from_docx
-        
-        # Extract text
-        text = ""
-        if filename.lower().endswith('.pdf'):
-            text = extract_text_from_pdf(file_content)
-        elif filename.lower().endswith(('.docx', '.doc')):
-            text = extract_text_from_docx(file_content)
-        else:
-            raise ValueError("Unsupported file format")
         
-        if not text.strip():
-            raise ValueError("Could not extract text from resume")
+        Identical files are served from the content-addressed parse cache.
+        """
+        parsed_data, parsing_method, _ = self.parse_resume_document(file_content, filename, priority=priority)
+        return parsed_data, parsing_method
+    
+    def parse_resume_document(self, file_content: bytes, filename: str, priority: Priority = Priority.PARSE):
+        """
+        parse_resume that also returns the document it parsed:
+        (parsed_data, parsing_method, {"text", "content_hash", "prompt"}), so
+        callers can store the extracted text without extracting it again.
+        "prompt" holds the condensation stats when an LLM prompt was built.
+        """
+        key, cached, text = self._lookup_resume(file_content, filename)
+        document = {"text": text, "content_hash": key}
+        if cached is not None and cached["parsed_data"] is not None:
+            record_result("parse", "cache")
+            return cached["parsed_data"], cached["parsing_method"], document
         
         # Try providers in order
         providers = [
@@ -54,80 +480,55 @@ class AIService:
             (AIProvider.OPENAI, self._parse_with_openai),
         ]
         
-        for provider, parse_func in providers:
-            try:
-                result = parse_func(text)
-                # Resume parsed with provider
-                return result, provider.value
-            except Exception as e:
-                # Parsing failed for provider
-                continue
+        prompt_text = self._condense_resume(text, document)
+        provider, result = self._try_providers(providers, "parse", prompt_text, priority=priority)
+        if provider is not None:
+            # Resume parsed with provider
+            record_result("parse", provider.value)
+            self._resume_cache.put_result(key, result, provider.value)
+            return result, provider.value, document
         
         # Final fallback: regex
         # Using regex fallback for parsing
-        return self._parse_with_regex(file_content, filename), AIProvider.REGEX.value
+        record_result("parse", AIProvider.REGEX.value)
+        return self._timed_regex_parse(text), AIProvider.REGEX.value, document
     
-    def _parse_with_gemini(self, resume_text: str) -> Dict[str, Any]:
-        """Parse resume using Gemini"""
-        from app.database import get_settings
-        import google.generativeai as genai
-        from google.generativeai.types import HarmCategory, HarmBlockThreshold
-        
-        if self._gemini_model is None:
-            settings = get_settings()
-            if not settings.gemini_api_key:
-                raise ValueError("Gemini API key not configured")
-            genai.configure(api_key=settings.gemini_api_key)
-            self._gemini_model = genai.GenerativeModel('gemini-2.0-flash-exp')
-        
-        prompt = f"""Extract candidate information from this resume text and return as JSON.
-
-Resume Text:
-{resume_text}
-
-Return JSON with these fields:
-- name: full name
-- email: email address
-- phone: phone number or null
-- location: city/state or null
-- experience: work history as paragraph or null
-- skills: comma-separated skills or null
-- education: education details as paragraph or null
-
-Return ONLY the JSON object."""
-
-        safety_settings = {
-            HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-            HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-        }
-        
-        response = self._gemini_model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(temperature=0.1, max_output_tokens=2048),
-            safety_settings=safety_settings
-        )
+    async def aparse_resume(self, file_content: bytes, filename: str, priority: Priority = Priority.PARSE) -> Dict[str, Any]:
+        """Async variant of parse_resume (same provider order)"""
+        parsed_data, parsing_method, _ = await self.aparse_resume_document(file_content, filename, priority=priority)
+        return parsed_data, parsing_method
+    
+    async def aparse_resume_document(self, file_content: bytes, filename: str, priority: Priority = Priority.PARSE):
+        """Async variant of parse_resume_document"""
+        # Hashing, cache lookup and PDF/DOCX extraction are blocking, keep them off the event loop
+        key, cached, text = await run_file(self._lookup_resume, file_content, filename)
+        document = {"text": text, "content_hash": key}
+        if cached is not None and cached["parsed_data"] is not None:
+            record_result("parse", "cache")
+            return cached["parsed_data"], cached["parsing_method"], document
         
-        if not response.candidates or not response.candidates[0].content.parts:
-            raise ValueError("Response blocked by safety filters")
+        providers = [
+            (AIProvider.OLLAMA, self._aparse_with_ollama),
+            (AIProvider.OPENAI, self._aparse_with_openai),
+        ]
         
-        response_text = response.text.strip()
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
+        prompt_text = await run_file(self._condense_resume, text, document)
+        provider, result = await self._atry_providers(providers, "parse", prompt_text, priority=priority)
+        if provider is not None:
+            record_result("parse", provider.value)
+            await run_db(self._resume_cache.put_result, key, result, provider.value)
+            return result, provider.value, document
         
-        parsed = json.loads(response_text)
-        return self._normalize_parsed_data(parsed, resume_text)
+        record_result("parse", AIProvider.REGEX.value)
+        result = await run_file(self._timed_regex_parse, text)
+        return result, AIProvider.REGEX.value, document
     
-    def _parse_with_ollama(self, resume_text: str) -> Dict[str, Any]:
-        """Parse resume using Ollama"""
-        import requests
-        
-        if not self._check_ollama():
-            raise ValueError("Ollama not available")
-        
+    def _timed_regex_parse(self, resume_text: str) -> Dict[str, Any]:
+        with time_stage("regex_parse"):
+            return self._parse_with_regex(resume_text)
+    
+    def _build_ollama_parse_payload(self, resume_text: str) -> Dict[str, Any]:
+        """Build the /api/generate request for resume parsing"""
         prompt = f"""Extract candidate information from this resume and return ONLY a JSON object.
 
 Resume:
@@ -146,16 +547,17 @@ Example: {{"name": "John Doe", "email": "john@email.com", "phone": "+1234567890"
 
 Return ONLY the JSON object, no other text."""
 
-        response = requests.post(
-            "http://localhost:11434/api/generate",
-            json={"model": "phi3", "prompt": prompt, "stream": False, "format": "json"},
-            timeout=60
-        )
-        
-        if response.status_code != 200:
-            raise ValueError(f"Ollama error: {response.status_code}")
-        
-        response_text = response.json().get("response", "")
+        return {
+            "model": self._ollama_model("parse"),
+            "prompt": prompt,
+            "stream": False,
+            "format": "json",
+            "keep_alive": self._ollama_keep_alive
+        }
+    
+    def _read_ollama_parse_response(self, result: Dict[str, Any], resume_text: str) -> Dict[str, Any]:
+        """Decode the parse JSON returned by Ollama"""
+        response_text = result.get("response", "")
         if "```" in response_text:
             response_text = response_text.split("```")[1].split("```")[0].strip()
             if response_text.startswith("json"):
@@ -164,8 +566,18 @@ Return ONLY the JSON object, no other text."""
         parsed = json.loads(response_text)
         return self._normalize_parsed_data(parsed, resume_text)
     
-    def _parse_with_openai(self, resume_text: str) -> Dict[str, Any]:
-        """Parse resume using OpenAI"""
+    def _parse_with_ollama(self, resume_text: str) -> Dict[str, Any]:
+        """Parse resume using Ollama"""
+        result = self._ollama.post_json("/api/generate", self._build_ollama_parse_payload(resume_text), timeout=60)
+        return self._read_ollama_parse_response(result, resume_text)
+    
+    async def _aparse_with_ollama(self, resume_text: str) -> Dict[str, Any]:
+        """Parse resume using Ollama (async)"""
+        result = await self._ollama.apost_json("/api/generate", self._build_ollama_parse_payload(resume_text), timeout=60)
+        return self._read_ollama_parse_response(result, resume_text)
+    
+    def _get_openai_client(self):
+        """Lazily create the sync OpenAI client"""
         from app.database import get_settings
         from openai import OpenAI
         
@@ -174,28 +586,62 @@ Return ONLY the JSON object, no other text."""
             if not settings.openai_api_key:
                 raise ValueError("OpenAI API key not configured")
             self._openai_client = OpenAI(api_key=settings.openai_api_key)
+        return self._openai_client
+    
+    def _get_async_openai_client(self):
+        """Lazily create the async OpenAI client"""
+        from app.database import get_settings
+        from openai import AsyncOpenAI
         
+        if self._async_openai_client is None:
+            settings = get_settings()
+            if not settings.openai_api_key:
+                raise ValueError("OpenAI API key not configured")
+            self._async_openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
+        return self._async_openai_client
+    
+    def _build_openai_parse_messages(self, resume_text: str) -> list:
         prompt = f"""Extract candidate information and return as JSON:
 
 {resume_text}
 
 Return: {{"name": "...", "email": "...", "phone": "...", "location": "...", "experience": "...", "skills": "...", "education": "..."}}"""
 
-        response = self._openai_client.chat.completions.create(
+        return [{"role": "user", "content": prompt}]
+    
+    def _parse_with_openai(self, resume_text: str) -> Dict[str, Any]:
+        """Parse resume using OpenAI"""
+        messages = self._build_openai_parse_messages(resume_text)
+        response = self._get_openai_client().chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            temperature=0.1,
+            response_format={"type": "json_object"}
+        )
+        self._observe_openai(messages, response)
+        
+        parsed = json.loads(response.choices[0].message.content)
+        return self._normalize_parsed_data(parsed, resume_text)
+    
+    async def _aparse_with_openai(self, resume_text: str) -> Dict[str, Any]:
+        """Parse resume using OpenAI (async)"""
+        messages = self._build_openai_parse_messages(resume_text)
+        response = await self._get_async_openai_client().chat.completions.create(
             model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
+            messages=messages,
             temperature=0.1,
             response_format={"type": "json_object"}
         )
+        self._observe_openai(messages, response)
         
         parsed = json.loads(response.choices[0].message.content)
         return self._normalize_parsed_data(parsed, resume_text)
     
-    def _parse_with_regex(self, file_content: bytes, filename: str) -> Dict[str, Any]:
+    def _parse_with_regex(self, resume_text: str) -> Dict[str, Any]:
         """Parse resume using regex patterns"""
-        from app.services.resume_parser import parse_resume
+        from app.services.resume_parser import parse_resume_text
         
-        raw_parsed = parse_resume(file_content, filename)
+        raw_parsed = parse_resume_text(resume_text)
         
         # Normalize to expected format
         return {
@@ -210,15 +656,14 @@ Return: {{"name": "...", "email": "...", "phone": "...", "location": "...", "exp
     
     def _normalize_parsed_data(self, parsed: Dict, resume_text: str) -> Dict[str, Any]:
         """Normalize and validate parsed data"""
-        import re
+        from app.services.resume_parser import EMAIL_PATTERN
         
         # Ensure required fields
         if not parsed.get("name"):
             parsed["name"] = "Unknown Candidate"
         if not parsed.get("email"):
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            matches = re.findall(email_pattern, resume_text)
-            parsed["email"] = matches[0] if matches else "noemail@provided.com"
+            match = EMAIL_PATTERN.search(resume_text)
+            parsed["email"] = match.group(0) if match else "noemail@provided.com"
         
         # Convert lists to strings for database compatibility
         if isinstance(parsed.get("experience"), list):
@@ -262,36 +707,76 @@ Return: {{"name": "...", "email": "...", "phone": "...", "location": "...", "exp
     
     # ==================== ATS SCORING ====================
     
-    def calculate_ats_score(self, candidate_data: Dict[str, Any], job_requirements: str) -> Dict[str, Any]:
+    def calculate_ats_score(
+        self,
+        candidate_data: Dict[str, Any],
+        job_requirements: str,
+        fallback: bool = True,
+        priority: Priority = Priority.PARSE
+    ) -> Dict[str, Any]:
         """
         Calculate ATS score using available AI providers:
         1. Ollama (best for scoring, no safety filters)
         2. Simple algorithm (fallback)
+        
+        AI results are memoized per profile/requirements/model fingerprint.
+        With fallback=False a RuntimeError is raised instead of using the
+        simple algorithm (used by bulk re-scoring so old AI scores survive outages).
         """
+        cache_key, requirements_fp = self._score_cache.key_for(candidate_data, job_requirements, self._ollama_model("score"))
+        cached = self._score_cache.get(cache_key)
+        if cached is not None:
+            record_result("score", "cache")
+            return cached
+        
         providers = [
             (AIProvider.OLLAMA, self._score_with_ollama),
         ]
         
-        for provider, score_func in providers:
-            try:
-                result = score_func(candidate_data, job_requirements)
-                # ATS scored with provider
-                return result
-            except Exception as e:
-                # ATS scoring failed for provider
-                continue
+        provider, result = self._try_providers(providers, "score", candidate_data, job_requirements, priority=priority)
+        if provider is not None:
+            # ATS scored with provider
+            record_result("score", provider.value)
+            self._score_cache.put(cache_key, requirements_fp, result)
+            return result
+        
+        if not fallback:
+            record_result("score", "none")
+            raise RuntimeError("No AI provider available for ATS scoring")
         
         # Fallback to simple scoring
         # Using simple scoring algorithm fallback
-        return self._score_simple(candidate_data)
+        record_result("score", "simple")
+        return self._score_simple(candidate_data, job_requirements)
     
-    def _score_with_ollama(self, candidate_data: Dict[str, Any], job_requirements: str) -> Dict[str, Any]:
-        """Score with Ollama"""
-        import requests
+    async def acalculate_ats_score(
+        self,
+        candidate_data: Dict[str, Any],
+        job_requirements: str,
+        priority: Priority = Priority.PARSE
+    ) -> Dict[str, Any]:
+        """Async variant of calculate_ats_score"""
+        cache_key, requirements_fp = self._score_cache.key_for(candidate_data, job_requirements, self._ollama_model("score"))
+        cached = self._score_cache.get(cache_key)
+        if cached is not None:
+            record_result("score", "cache")
+            return cached
         
-        if not self._check_ollama():
-            raise ValueError("Ollama not available")
+        providers = [
+            (AIProvider.OLLAMA, self._ascore_with_ollama),
+        ]
         
+        provider, result = await self._atry_providers(providers, "score", candidate_data, job_requirements, priority=priority)
+        if provider is not None:
+            record_result("score", provider.value)
+            self._score_cache.put(cache_key, requirements_fp, result)
+            return result
+        
+        record_result("score", "simple")
+        return self._score_simple(candidate_data, job_requirements)
+    
+    def _build_ollama_score_payload(self, candidate_data: Dict[str, Any], job_requirements: str) -> Dict[str, Any]:
+        """Build the /api/generate request for ATS scoring"""
         prompt = f"""Evaluate candidate match to job requirements.
 
 Job: {job_requirements}
@@ -303,17 +788,18 @@ Candidate:
 
 Return JSON: {{"score": 0-100, "strengths": ["item1", "item2"], "gaps": ["item1"], "reasoning": "brief explanation"}}"""
 
-        response = requests.post(
-            "http://localhost:11434/api/generate",
-            json={"model": "phi3", "prompt": prompt, "stream": False, "format": "json", "options": {"temperature": 0.3}},
-            timeout=60
-        )
-        
-        if response.status_code != 200:
-            raise ValueError(f"Ollama error: {response.status_code}")
-        
-        response_text = response.json().get("response", "")
-        parsed = json.loads(response_text)
+        return {
+            "model": self._ollama_model("score"),
+            "prompt": prompt,
+            "stream": False,
+            "format": "json",
+            "keep_alive": self._ollama_keep_alive,
+            "options": {"temperature": 0.3}
+        }
+    
+    def _read_ollama_score_response(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode the ATS JSON returned by Ollama"""
+        parsed = json.loads(result.get("response", ""))
         
         return {
             "ats_score": int(parsed.get("score", 75)),
@@ -322,6 +808,18 @@ Return JSON: {{"score": 0-100, "strengths": ["item1", "item2"], "gaps": ["item1"
             "reasoning": parsed.get("reasoning", "")
         }
     
+    def _score_with_ollama(self, candidate_data: Dict[str, Any], job_requirements: str) -> Dict[str, Any]:
+        """Score with Ollama"""
+        payload = self._build_ollama_score_payload(candidate_data, job_requirements)
+        result = self._ollama.post_json("/api/generate", payload, timeout=60)
+        return self._read_ollama_score_response(result)
+    
+    async def _ascore_with_ollama(self, candidate_data: Dict[str, Any], job_requirements: str) -> Dict[str, Any]:
+        """Score with Ollama (async)"""
+        payload = self._build_ollama_score_payload(candidate_data, job_requirements)
+        result = await self._ollama.apost_json("/api/generate", payload, timeout=60)
+        return self._read_ollama_score_response(result)
+    
     def _score_with_gemini(self, candidate_data: Dict[str, Any], job_requirements: str) -> Dict[str, Any]:
         """Score with Gemini"""
         from app.database import get_settings
@@ -372,8 +870,8 @@ JSON: {{"score": 85, "strengths": [], "gaps": [], "reasoning": ""}}"""
             "reasoning": parsed.get("reasoning", "")
         }
     
-    def _score_simple(self, candidate_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Simple scoring based on profile completeness"""
+    def _score_simple(self, candidate_data: Dict[str, Any], job_requirements: str = "") -> Dict[str, Any]:
+        """Simple scoring based on profile completeness, plus required-skill coverage"""
         score = 60
         strengths = []
         gaps = []
@@ -402,6 +900,12 @@ JSON: {{"score": 85, "strengths": [], "gaps": [], "reasoning": ""}}"""
             score += 5
             strengths.append("Education documented")
         
+        coverage = get_skill_matcher().overlap(skills, job_requirements)
+        if coverage["matched"]:
+            strengths.append("Has required skills: " + ", ".join(coverage["matched"]))
+        if coverage["missing"]:
+            gaps.append("Missing required skills: " + ", ".join(coverage["missing"]))
+        
         return {
             "ats_score": min(score, 100),
             "strengths": strengths or ["Profile submitted"],
@@ -409,14 +913,35 @@ JSON: {{"score": 85, "strengths": [], "gaps": [], "reasoning": ""}}"""
             "reasoning": f"Profile completeness score based on information depth and quality"
         }
     
-    def _check_ollama(self) -> bool:
-        """Check if Ollama is running"""
-        import requests
-        try:
-            response = requests.get("http://localhost:11434/api/tags", timeout=2)
-            return response.status_code == 200
-        except:
-            return False
+    def _observe_ollama(self, payload: Dict[str, Any], result: Dict[str, Any], streamed_text: Optional[str] = None):
+        """Transport hook: prompt/response sizes and Ollama's own token counts"""
+        prompt_chars = len(payload.get("system") or "") + len(payload.get("prompt") or "")
+        prompt_chars += sum(len(m.get("content") or "") for m in payload.get("messages", []))
+        if streamed_text is None:
+            streamed_text = result.get("response") or result.get("message", {}).get("content") or ""
+        # With a reused context prompt_eval_count only covers the new tokens
+        record_llm_exchange(
+            AIProvider.OLLAMA.value, prompt_chars, len(streamed_text),
+            result.get("prompt_eval_count"), result.get("eval_count")
+        )
+    
+    def _observe_openai(self, messages: list, response=None, text: Optional[str] = None):
+        """Prompt/response sizes and token usage of an OpenAI completion"""
+        if text is None:
+            text = response.choices[0].message.content or ""
+        usage = getattr(response, "usage", None)
+        record_llm_exchange(
+            AIProvider.OPENAI.value,
+            sum(len(m.get("content") or "") for m in messages),
+            len(text),
+            getattr(usage, "prompt_tokens", None),
+            getattr(usage, "completion_tokens", None)
+        )
+    
+    def _probe_ollama(self) -> bool:
+        """Health probe: is Ollama running? (called by the health monitor, not per request)"""
+        response = self._ollama.get("/api/tags", timeout=2)
+        return response.status_code == 200
     
     # ==================== CHAT / INTERVIEW ====================
     
@@ -424,11 +949,14 @@ JSON: {{"score": 85, "strengths": [], "gaps": [], "reasoning": ""}}"""
         self, 
         message: str, 
         system_prompt: str = "", 
-        conversation_history: list = None
+        conversation_history: list = None,
+        priority: Priority = Priority.INTERACTIVE
     ) -> str:
         """
         Chat with AI for interview conversations
-        Tries Gemini first, then Ollama, then OpenAI
+        Providers (Ollama, OpenAI) are tried in routed order: PROVIDER_ORDER_CHAT
+        if set, otherwise by observed latency and error rate; unconfigured
+        providers and open circuits are skipped
         
         Args:
             message: User's message
@@ -443,22 +971,135 @@ JSON: {{"score": 85, "strengths": [], "gaps": [], "reasoning": ""}}"""
         
         # Try providers in order
         providers = [
-            ("Ollama", self._chat_with_ollama),
-            ("OpenAI", self._chat_with_openai),
+            (AIProvider.OLLAMA, self._chat_with_ollama),
+            (AIProvider.OPENAI, self._chat_with_openai),
         ]
         
-        for provider_name, chat_func in providers:
-            try:
-                reply = chat_func(message, system_prompt, conversation_history)
-                # Chat response received from provider
-                return reply
-            except Exception as e:
-                # Chat failed for provider
-                continue
+        provider, reply = self._try_providers(
+            providers, "chat", message, system_prompt, conversation_history, priority=priority
+        )
+        if provider is not None:
+            # Chat response received from provider
+            record_result("chat", provider.value)
+            return reply
         
         # Fallback response
+        record_result("chat", "fallback_reply")
         return "I apologize, but I'm having technical difficulties. Please try again in a moment."
     
+    async def achat(
+        self,
+        message: str,
+        system_prompt: str = "",
+        conversation_history: list = None,
+        hedge: bool = False,
+        priority: Priority = Priority.INTERACTIVE,
+        session_key: Optional[str] = None,
+        turn_instruction: str = ""
+    ) -> str:
+        """
+        Async variant of chat (same provider order and fallback reply)
+        
+        With hedge=True a slow primary provider is raced against the next one
+        once it exceeds its observed latency percentile (interactive turns only).
+        
+        With a session_key (interview turns) the full client history is passed
+        in: Ollama reuses the session's cached context when it matches, other
+        providers get the token-bounded history. turn_instruction is appended
+        to this turn's message only, so the system prompt stays stable.
+        """
+        if conversation_history is None:
+            conversation_history = []
+        
+        prompt_message, conversation_history, ollama_chat = await self._aprepare_chat_turn(
+            message, system_prompt, conversation_history, session_key, turn_instruction,
+            self._achat_with_ollama_session
+        )
+        providers = [
+            (AIProvider.OLLAMA, ollama_chat or self._achat_with_ollama),
+            (AIProvider.OPENAI, self._achat_with_openai),
+        ]
+        
+        if hedge:
+            provider, reply = await self._ahedged_providers(
+                providers, "chat", prompt_message, system_prompt, conversation_history, priority=priority
+            )
+        else:
+            provider, reply = await self._atry_providers(
+                providers, "chat", prompt_message, system_prompt, conversation_history, priority=priority
+            )
+        if provider is not None:
+            record_result("chat", provider.value)
+            return reply
+        
+        record_result("chat", "fallback_reply")
+        return "I apologize, but I'm having technical difficulties. Please try again in a moment."
+    
+    async def achat_stream(
+        self,
+        message: str,
+        system_prompt: str = "",
+        conversation_history: list = None,
+        priority: Priority = Priority.INTERACTIVE,
+        session_key: Optional[str] = None,
+        turn_instruction: str = ""
+    ) -> AsyncIterator[str]:
+        """
+        Streaming variant of achat: yields reply tokens as the provider produces them
+        
+        Falls back to the next provider only if the current one fails before
+        its first token; a mid-stream failure ends the reply where it stopped.
+        """
+        if conversation_history is None:
+            conversation_history = []
+        
+        message, conversation_history, ollama_stream = await self._aprepare_chat_turn(
+            message, system_prompt, conversation_history, session_key, turn_instruction,
+            self._astream_with_ollama_session
+        )
+        providers = [
+            (AIProvider.OLLAMA, ollama_stream or self._astream_with_ollama),
+            (AIProvider.OPENAI, self._astream_with_openai),
+        ]
+        
+        for provider, stream_func in self._route("chat", providers):
+            health = self._health.get(provider.value)
+            if not health.allow_request():
+                record_llm_attempt(provider.value, "chat", "circuit_open")
+                continue
+            started = False
+            admitted = None
+            try:
+                # The slot is held until the stream finishes
+                async with self._scheduler.aslot(provider.value, priority):
+                    admitted = time.monotonic()
+                    with llm_call(provider.value, "chat"):
+                        async for token in stream_func(message, system_prompt, conversation_history):
+                            started = True
+                            yield token
+                    elapsed = time.monotonic() - admitted
+            except SchedulerError:
+                health.release()
+                record_llm_attempt(provider.value, "chat", "rejected")
+                continue
+            except Exception as e:
+                health.record_failure(e)
+                self._router.record_failure(provider.value, "chat")
+                record_llm_attempt(provider.value, "chat", classify_error(e), self._since(admitted))
+                if started:
+                    record_result("chat", provider.value)
+                    return
+                continue
+            health.record_success()
+            self._router.record_success(provider.value, "chat", elapsed)
+            record_llm_attempt(provider.value, "chat", "success", elapsed)
+            if started:
+                record_result("chat", provider.value)
+                return
+        
+        record_result("chat", "fallback_reply")
+        yield "I apologize, but I'm having technical difficulties. Please try again in a moment."
+    
     def _chat_with_gemini(self, message: str, system_prompt: str, history: list) -> str:
         """Chat using Gemini"""
         from app.database import get_settings
@@ -490,13 +1131,66 @@ JSON: {{"score": 85, "strengths": [], "gaps": [], "reasoning": ""}}"""
         
         return response.text.strip()
     
-    def _chat_with_ollama(self, message: str, system_prompt: str, history: list) -> str:
-        """Chat using Ollama"""
-        import requests
+    async def _aprepare_chat_turn(
+        self,
+        message: str,
+        system_prompt: str,
+        history: list,
+        session_key: Optional[str],
+        turn_instruction: str,
+        ollama_session_func
+    ):
+        """
+        Returns (prompt message, history for stateless providers, Ollama func or None)
+        
+        For interview sessions the Ollama call is bound to the full client
+        history (to match its cached context) and everyone else gets the
+        compacted history.
+        """
+        prompt_message = f"{message}\n\n{turn_instruction}" if turn_instruction else message
+        if session_key is None:
+            return prompt_message, history, None
         
-        if not self._check_ollama():
-            raise ConnectionError("Ollama is not running")
+        compacted = await self.acompact_history(session_key, system_prompt, history, prompt_message)
+        return prompt_message, compacted, functools.partial(ollama_session_func, session_key, history, message)
+    
+    async def acompact_history(self, session_key: str, system_prompt: str, history: list, message: str) -> list:
+        """Trim interview history to the token budget (older turns become a cached summary)"""
+        return await self._chat_context.abuild(session_key, system_prompt, history, message)
+    
+    def forget_chat_session(self, session_key: str):
+        """Drop per-session chat state once the interview is over"""
+        self._chat_context.evict(session_key)
+        self._ollama_contexts.evict(session_key)
+    
+    async def _asummarize_turns(self, previous_summary: str, turns: list) -> Optional[str]:
+        """Fold new turns into the running interview summary (None if no provider answered)"""
+        transcript = "\n".join(
+            f"{'Candidate' if t.get('role') == 'user' else 'Interviewer'}: {t.get('content', '')}"
+            for t in turns
+        )
+        prompt = f"""Current summary of the interview so far:
+{previous_summary or '(none yet)'}
+
+New conversation turns:
+{transcript}
+
+Rewrite the summary to include the new turns. Keep the questions asked and the key facts, claims and technologies the candidate mentioned. At most 120 words, plain prose."""
         
+        providers = [
+            (AIProvider.OLLAMA, self._achat_with_ollama),
+            (AIProvider.OPENAI, self._achat_with_openai),
+        ]
+        # Summaries are background work: they must not delay live interview turns
+        provider, summary = await self._atry_providers(
+            providers, "summary", prompt, "You maintain concise running summaries of job interviews.", [],
+            priority=Priority.PARSE
+        )
+        record_result("summary", provider.value if provider is not None else "none")
+        return summary if provider is not None else None
+    
+    def _build_chat_messages(self, message: str, system_prompt: str, history: list) -> list:
+        """System prompt + prior turns + current user message"""
         # Build messages with system prompt
         messages = [{"role": "system", "content": system_prompt}]
         
@@ -506,53 +1200,213 @@ JSON: {{"score": 85, "strengths": [], "gaps": [], "reasoning": ""}}"""
         
         # Add current message
         messages.append({"role": "user", "content": message})
-        
-        response = requests.post(
-            "http://localhost:11434/api/chat",
-            json={
-                "model": "phi3",
-                "messages": messages,
-                "stream": False,
-                "options": {"temperature": 0.7}
-            },
-            timeout=30
-        )
-        
-        if response.status_code != 200:
-            raise Exception(f"Ollama returned status {response.status_code}")
-        
-        result = response.json()
+        return messages
+    
+    def _build_ollama_chat_payload(self, message: str, system_prompt: str, history: list) -> Dict[str, Any]:
+        return {
+            "model": self._ollama_model("chat"),
+            "messages": self._build_chat_messages(message, system_prompt, history),
+            "stream": False,
+            "keep_alive": self._ollama_keep_alive,
+            "options": {"temperature": 0.7}
+        }
+    
+    def _build_ollama_session_payload(self, message: str, system_prompt: str, history: list, context: Optional[list]) -> Dict[str, Any]:
+        """/api/generate payload that continues a cached context, or seeds a new one"""
+        payload = {
+            "model": self._ollama_model("chat"),
+            "stream": False,
+            "keep_alive": self._ollama_keep_alive,
+            "options": {"temperature": 0.7, "num_ctx": self._ollama_num_ctx}
+        }
+        if context:
+            # System prompt and earlier turns are already in the context
+            payload["context"] = context
+            payload["prompt"] = message
+        else:
+            payload["system"] = system_prompt
+            payload["prompt"] = self._render_transcript(history, message)
+        return payload
+    
+    def _render_transcript(self, history: list, message: str) -> str:
+        """Flatten (compacted) history + the new message into one prompt"""
+        if not history:
+            return message
+        speakers = {"user": "Candidate", "assistant": "Interviewer"}
+        lines = [f"{speakers.get(t.get('role'), 'Note')}: {t.get('content', '')}" for t in history]
+        return "Conversation so far:\n" + "\n".join(lines) + f"\n\nCandidate: {message}"
+    
+    def _chat_with_ollama(self, message: str, system_prompt: str, history: list) -> str:
+        """Chat using Ollama"""
+        payload = self._build_ollama_chat_payload(message, system_prompt, history)
+        result = self._ollama.post_json("/api/chat", payload, timeout=30)
         return result.get("message", {}).get("content", "").strip()
     
+    async def _achat_with_ollama(self, message: str, system_prompt: str, history: list) -> str:
+        """Chat using Ollama (async)"""
+        payload = self._build_ollama_chat_payload(message, system_prompt, history)
+        result = await self._ollama.apost_json("/api/chat", payload, timeout=30)
+        return result.get("message", {}).get("content", "").strip()
+    
+    async def _astream_with_ollama(self, message: str, system_prompt: str, history: list) -> AsyncIterator[str]:
+        """Stream chat tokens from Ollama's NDJSON /api/chat stream"""
+        payload = self._build_ollama_chat_payload(message, system_prompt, history)
+        payload["stream"] = True
+        
+        async for chunk in self._ollama.astream_json_lines("/api/chat", payload, timeout=30):
+            token = chunk.get("message", {}).get("content", "")
+            if token:
+                yield token
+            if chunk.get("done"):
+                break
+    
+    async def _achat_with_ollama_session(
+        self,
+        session_key: str,
+        full_history: list,
+        raw_message: str,
+        message: str,
+        system_prompt: str,
+        history: list
+    ) -> str:
+        """Interview turn on Ollama, continuing the session's cached context when it matches"""
+        context = self._ollama_contexts.lookup(session_key, self._ollama_model("chat"), system_prompt, full_history)
+        payload = self._build_ollama_session_payload(message, system_prompt, history, context)
+        result = await self._ollama.apost_json("/api/generate", payload, timeout=30)
+        reply = result.get("response", "").strip()
+        self._ollama_contexts.store(
+            session_key, self._ollama_model("chat"), system_prompt, full_history, raw_message, reply, result.get("context")
+        )
+        return reply
+    
+    async def _astream_with_ollama_session(
+        self,
+        session_key: str,
+        full_history: list,
+        raw_message: str,
+        message: str,
+        system_prompt: str,
+        history: list
+    ) -> AsyncIterator[str]:
+        """Streaming variant of _achat_with_ollama_session"""
+        context = self._ollama_contexts.lookup(session_key, self._ollama_model("chat"), system_prompt, full_history)
+        payload = self._build_ollama_session_payload(message, system_prompt, history, context)
+        payload["stream"] = True
+        
+        tokens = []
+        async for chunk in self._ollama.astream_json_lines("/api/generate", payload, timeout=30):
+            token = chunk.get("response", "")
+            if token:
+                tokens.append(token)
+                yield token
+            if chunk.get("done"):
+                self._ollama_contexts.store(
+                    session_key, self._ollama_model("chat"), system_prompt, full_history,
+                    raw_message, "".join(tokens), chunk.get("context")
+                )
+                break
+    
     def _chat_with_openai(self, message: str, system_prompt: str, history: list) -> str:
         """Chat using OpenAI"""
-        from app.database import get_settings
-        from openai import OpenAI
-        
-        if self._openai_client is None:
-            settings = get_settings()
-            if not settings.openai_api_key:
-                raise ValueError("OpenAI API key not configured")
-            self._openai_client = OpenAI(api_key=settings.openai_api_key)
-        
-        # Build messages
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        # Add conversation history
-        for h in history:
-            messages.append(h)
-        
-        # Add current message
-        messages.append({"role": "user", "content": message})
+        messages = self._build_chat_messages(message, system_prompt, history)
+        response = self._get_openai_client().chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            temperature=0.7,
+            max_tokens=300
+        )
+        self._observe_openai(messages, response)
         
-        response = self._openai_client.chat.completions.create(
+        return response.choices[0].message.content.strip()
+    
+    async def _achat_with_openai(self, message: str, system_prompt: str, history: list) -> str:
+        """Chat using OpenAI (async)"""
+        messages = self._build_chat_messages(message, system_prompt, history)
+        response = await self._get_async_openai_client().chat.completions.create(
             model="gpt-4o-mini",
             messages=messages,
             temperature=0.7,
             max_tokens=300
         )
+        self._observe_openai(messages, response)
         
         return response.choices[0].message.content.strip()
+    
+    async def _astream_with_openai(self, message: str, system_prompt: str, history: list) -> AsyncIterator[str]:
+        """Stream chat tokens from OpenAI"""
+        messages = self._build_chat_messages(message, system_prompt, history)
+        stream = await self._get_async_openai_client().chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            temperature=0.7,
+            max_tokens=300,
+            stream=True
+        )
+        
+        tokens = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                tokens.append(chunk.choices[0].delta.content)
+                yield chunk.choices[0].delta.content
+        self._observe_openai(messages, text="".join(tokens))
+
+    
+    # ==================== INTERVIEW EVALUATION ====================
+    
+    async def aevaluate_interview(
+        self,
+        prompt: str,
+        system_prompt: str,
+        priority: Priority = Priority.PARSE
+    ):
+        """
+        One JSON-mode evaluation call (Ollama format=json / OpenAI json_object)
+        Returns (provider name, raw reply) or (None, None); validation is left
+        to the caller so an unusable reply never triggers a second LLM call
+        """
+        providers = [
+            (AIProvider.OLLAMA, self._aevaluate_with_ollama),
+            (AIProvider.OPENAI, self._aevaluate_with_openai),
+        ]
+        provider, raw = await self._atry_providers(providers, "evaluate", prompt, system_prompt, priority=priority)
+        if provider is None:
+            record_result("evaluate", "none")
+            return None, None
+        record_result("evaluate", provider.value)
+        return provider.value, raw
+    
+    async def _aevaluate_with_ollama(self, prompt: str, system_prompt: str) -> str:
+        """Evaluate with Ollama (async)"""
+        payload = {
+            "model": self._ollama_model("evaluate"),
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "stream": False,
+            "format": "json",
+            "keep_alive": self._ollama_keep_alive,
+            "options": {"temperature": 0.2}
+        }
+        result = await self._ollama.apost_json("/api/chat", payload, timeout=120)
+        return result.get("message", {}).get("content", "")
+    
+    async def _aevaluate_with_openai(self, prompt: str, system_prompt: str) -> str:
+        """Evaluate with OpenAI (async)"""
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+        response = await self._get_async_openai_client().chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            response_format={"type": "json_object"},
+            temperature=0.2,
+            max_tokens=600
+        )
+        self._observe_openai(messages, response)
+        
+        return response.choices[0].message.content or ""
 
 
 # Singleton instance
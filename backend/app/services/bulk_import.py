@@ -0,0 +1,396 @@
+"""
+Bulk resume import
+Imports a zip or a batch of CVs into one recruitment: parses documents in
+parallel, scores them in batches and inserts the candidates in bulk, while
+streaming per-file progress to the client
+"""
+
+from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import asyncio
+import os
+import secrets
+import shutil
+import threading
+import uuid
+import zipfile
+
+from app.database import SessionLocal, get_settings
+from app.models import Candidate, Recruitment
+from app.services.ai_service import get_ai_service
+from app.services.llm_scheduler import Priority
+from app.services.resume_intake import _safe_filename
+from app.services.resume_store import build_stored_resume
+
+RESUME_EXTENSIONS = ('.pdf', '.docx', '.doc')
+
+
+class ImportLimitError(ValueError):
+    """The upload exceeds the configured file count or size limits"""
+
+
+class BulkImportJob:
+    """Progress of one import, plus the event log streamed to clients"""
+
+    def __init__(self, recruitment_id: int, directory: str):
+        self.id = uuid.uuid4().hex
+        self.recruitment_id = recruitment_id
+        self.directory = directory
+        self.status = "queued"  # queued, running, completed, failed
+        self.total = 0
+        self.processed = 0
+        self.imported = 0
+        self.failed = 0
+        self.skipped = 0
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+        self._events: List[Dict[str, Any]] = []
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ("queued", "running")
+
+    def emit(self, event: Dict[str, Any]):
+        """Record an event and push it to every connected stream"""
+        with self._lock:
+            self._events.append(event)
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:
+                # Client's loop is gone (shutdown); it will not read any more
+                pass
+
+    def subscribe(self) -> asyncio.Queue:
+        """Queue of past and future events for a stream on the running loop"""
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            for event in self._events:
+                queue.put_nowait(event)
+            self._subscribers.append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        with self._lock:
+            self._subscribers = [(loop, q) for loop, q in self._subscribers if q is not queue]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "recruitment_id": self.recruitment_id,
+            "status": self.status,
+            "total": self.total,
+            "processed": self.processed,
+            "imported": self.imported,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "progress": round(self.processed / self.total, 3) if self.total else (1.0 if self.status == "completed" else 0.0),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error
+        }
+
+
+class BulkImportManager:
+    """
+    Runs bulk imports one at a time on a background thread
+
+    The endpoint streams the uploaded files to `<upload_dir>/imports/<job>/`
+    and returns; zips are unpacked there by the job (with member count and
+    size limits against zip bombs). Documents are then handled in batches of
+    `batch_size`: parsed in parallel by `max_workers` threads (text extraction
+    itself runs in the extraction process pool), scored with
+    calculate_ats_score at batch priority so live interviews go first, and
+    inserted with one commit per batch. A document that fails only affects
+    its own row; every outcome is emitted as an event.
+
+    The job keeps running if the client disconnects; the stream can be
+    re-opened and replays the events so far. Job progress lives in memory
+    only: finished jobs are kept for `job_ttl` seconds, and at most
+    `max_finished_jobs` of them.
+    """
+
+    def __init__(
+        self,
+        upload_dir: str = "uploads",
+        max_workers: int = 4,
+        batch_size: int = 25,
+        max_files: int = 500,
+        max_file_bytes: int = 10 * 1024 * 1024,
+        max_total_bytes: int = 200 * 1024 * 1024,
+        job_ttl: float = 3600.0,
+        max_finished_jobs: int = 50
+    ):
+        self.upload_dir = upload_dir
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.max_files = max_files
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self.job_ttl = job_ttl
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs: Dict[str, BulkImportJob] = {}
+        self._runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bulk-import-job")
+        self._lock = threading.Lock()
+
+    def create(self, recruitment_id: int) -> BulkImportJob:
+        """New job with an empty directory for its uploads"""
+        job = BulkImportJob(recruitment_id, "")
+        job.directory = os.path.join(self.upload_dir, "imports", job.id)
+        os.makedirs(job.directory, exist_ok=True)
+        with self._lock:
+            self._evict_finished()
+            self._jobs[job.id] = job
+        return job
+
+    def store_upload(self, job: BulkImportJob, index: int, filename: str, source, stored_bytes: int = 0) -> int:
+        """
+        Copy one uploaded file into the job directory in chunks
+        Returns the bytes written; `stored_bytes` is what earlier files of the
+        same upload already took, for the total size limit
+        """
+        if not (filename or "").lower().endswith(RESUME_EXTENSIONS + (".zip",)):
+            raise ValueError(f"{filename}: only PDF, DOCX and ZIP files are supported")
+        if index >= self.max_files:
+            raise ImportLimitError(f"Import is limited to {self.max_files} files")
+        # Zips are checked member by member when they are unpacked
+        max_bytes = self.max_total_bytes if filename.lower().endswith(".zip") else self.max_file_bytes
+        path = os.path.join(job.directory, f"{index:05d}_{_safe_filename(filename)}")
+        written = 0
+        with open(path, "wb") as out:
+            while True:
+                chunk = source.read(1024 * 1024)
+                if not chunk:
+                    break
+                written += len(chunk)
+                if written > max_bytes or stored_bytes + written > self.max_total_bytes:
+                    raise ImportLimitError(f"{filename} is too large")
+                out.write(chunk)
+        return written
+
+    def discard(self, job: BulkImportJob):
+        """Drop a job whose upload was rejected before it started"""
+        with self._lock:
+            self._jobs.pop(job.id, None)
+        shutil.rmtree(job.directory, ignore_errors=True)
+
+    def start(self, job: BulkImportJob):
+        self._runner.submit(self._run, job)
+
+    def get(self, job_id: str) -> Optional[BulkImportJob]:
+        with self._lock:
+            self._evict_finished()
+            return self._jobs.get(job_id)
+
+    def _evict_finished(self):
+        """Drop finished jobs past the TTL or beyond the newest `max_finished_jobs` (caller holds the lock)"""
+        now = datetime.utcnow()
+        finished = sorted(
+            (job for job in self._jobs.values() if not job.is_active and job.finished_at is not None),
+            key=lambda job: job.finished_at
+        )
+        excess = len(finished) - self.max_finished_jobs
+        for index, job in enumerate(finished):
+            if index < excess or (now - job.finished_at).total_seconds() > self.job_ttl:
+                del self._jobs[job.id]
+
+    def _run(self, job: BulkImportJob):
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        try:
+            self._import(job)
+            job.status = "completed"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e) or e.__class__.__name__
+        finally:
+            job.finished_at = datetime.utcnow()
+            job.emit({"event": "done", **{k: v for k, v in job.to_dict().items() if not k.endswith("_at")}})
+
+    # ==================== UNPACKING ====================
+
+    def _unpack(self, job: BulkImportJob) -> List[Tuple[str, str]]:
+        """(display name, path) of every document in the upload, zips expanded"""
+        documents = []
+        total_bytes = 0
+        for entry in sorted(os.listdir(job.directory)):
+            path = os.path.join(job.directory, entry)
+            upload, name = entry.split("_", 1)
+            if not name.lower().endswith(".zip"):
+                documents.append((name, path))
+                continue
+            try:
+                with zipfile.ZipFile(path) as archive:
+                    for index, member in enumerate(archive.infolist()):
+                        member_name = member.filename
+                        base = os.path.basename(member_name)
+                        if member.is_dir() or not base or base.startswith(".") or "__MACOSX" in member_name:
+                            continue
+                        if not base.lower().endswith(RESUME_EXTENSIONS):
+                            self._skip(job, member_name, "Only PDF and DOCX files are supported")
+                            continue
+                        # Sizes come from the zip directory; the copy below enforces them again
+                        if member.file_size > self.max_file_bytes:
+                            self._skip(job, member_name, "File is too large")
+                            continue
+                        if len(documents) >= self.max_files or total_bytes + member.file_size > self.max_total_bytes:
+                            raise ImportLimitError(f"Import is limited to {self.max_files} files / {self.max_total_bytes // (1024 * 1024)} MB")
+                        # Upload index first: two zips with the same layout must not collide
+                        target = os.path.join(job.directory, f"z{upload}_{index:05d}_{_safe_filename(base)}")
+                        written = self._copy_member(archive, member, target)
+                        total_bytes += written
+                        documents.append((member_name, target))
+            except zipfile.BadZipFile:
+                self._skip(job, name, "Not a valid zip file")
+            finally:
+                os.remove(path)
+        return documents
+
+    def _copy_member(self, archive: zipfile.ZipFile, member: zipfile.ZipInfo, target: str) -> int:
+        written = 0
+        with archive.open(member) as source, open(target, "wb") as out:
+            while True:
+                chunk = source.read(1024 * 1024)
+                if not chunk:
+                    return written
+                written += len(chunk)
+                if written > self.max_file_bytes:
+                    raise ImportLimitError(f"{member.filename} expands beyond its declared size")
+                out.write(chunk)
+
+    def _skip(self, job: BulkImportJob, filename: str, error: str):
+        job.skipped += 1
+        job.emit({"event": "file", "filename": filename, "status": "skipped", "error": error})
+
+    # ==================== PIPELINE ====================
+
+    def _import(self, job: BulkImportJob):
+        db = SessionLocal()
+        try:
+            recruitment = db.query(Recruitment).filter(Recruitment.id == job.recruitment_id).first()
+            if recruitment is None:
+                raise ValueError("Recruitment not found")
+            job_requirements = recruitment.job_requirements_text()
+
+            documents = self._unpack(job)
+            job.total = len(documents)
+            job.emit({"event": "started", "job_id": job.id, "total": job.total})
+
+            ai_service = get_ai_service()
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bulk-import-worker") as pool:
+                for start in range(0, len(documents), self.batch_size):
+                    batch = documents[start:start + self.batch_size]
+                    parsed = list(pool.map(lambda doc: self._parse(ai_service, *doc), batch))
+                    scored = list(pool.map(lambda item: self._score(ai_service, item, job_requirements), parsed))
+                    self._save_batch(db, job, scored)
+        finally:
+            db.close()
+
+    def _parse(self, ai_service, filename: str, path: str) -> Dict[str, Any]:
+        item = {"filename": filename, "path": path}
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+            item["parsed"], item["parsing_method"], item["document"] = ai_service.parse_resume_document(
+                content, os.path.basename(path), priority=Priority.BATCH
+            )
+        except Exception as e:
+            item["stage"], item["error"] = "parse", str(e) or e.__class__.__name__
+        return item
+
+    def _score(self, ai_service, item: Dict[str, Any], job_requirements: str) -> Dict[str, Any]:
+        if "error" in item:
+            return item
+        try:
+            item["evaluation"] = ai_service.calculate_ats_score(
+                item["parsed"], job_requirements, priority=Priority.BATCH
+            )
+        except Exception as e:
+            item["stage"], item["error"] = "score", str(e) or e.__class__.__name__
+        return item
+
+    def _save_batch(self, db, job: BulkImportJob, items: List[Dict[str, Any]]):
+        ready = [item for item in items if "error" not in item]
+        candidates = [self._candidate(job.recruitment_id, item) for item in ready]
+        try:
+            db.add_all(candidates)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            for item in ready:
+                item["stage"], item["error"] = "save", str(e) or e.__class__.__name__
+            candidates = []
+
+        saved = dict(zip((id(item) for item in ready), candidates))
+        for item in items:
+            job.processed += 1
+            event = {"event": "file", "filename": item["filename"], "processed": job.processed, "total": job.total}
+            candidate = saved.get(id(item))
+            if candidate is not None:
+                job.imported += 1
+                event.update({
+                    "status": "imported",
+                    "candidate_id": candidate.id,
+                    "name": candidate.name,
+                    "ats_score": candidate.ats_score,
+                    "parsing_method": item["parsing_method"]
+                })
+                if "prompt" in item["document"]:
+                    # Condensed / extracted text sent to the LLM (absent on cache hits)
+                    event["prompt_ratio"] = item["document"]["prompt"]["ratio"]
+            else:
+                job.failed += 1
+                event.update({"status": "failed", "stage": item["stage"], "error": item["error"]})
+                if os.path.exists(item["path"]):
+                    os.remove(item["path"])
+            job.emit(event)
+
+    def _candidate(self, recruitment_id: int, item: Dict[str, Any]) -> Candidate:
+        parsed, evaluation = item["parsed"], item["evaluation"]
+        return Candidate(
+            recruitment_id=recruitment_id,
+            name=parsed.get("name") or "Unknown",
+            email=parsed.get("email") or "noemail@provided.com",
+            phone=parsed.get("phone"),
+            location=parsed.get("location"),
+            experience=parsed.get("experience"),
+            education=parsed.get("education"),
+            skills=parsed.get("skills"),
+            ats_score=evaluation["ats_score"],
+            ats_strengths=evaluation.get("strengths"),
+            ats_gaps=evaluation.get("gaps"),
+            ats_reasoning=evaluation.get("reasoning"),
+            # Lets the candidate be invited to the interview later
+            session_token=secrets.token_urlsafe(32),
+            status="New",
+            resume_url=item["path"],
+            stored_resume=build_stored_resume(item["document"]["text"], item["filename"], item["document"]["content_hash"])
+        )
+
+
+# Singleton instance
+_bulk_import_manager = None
+
+def get_bulk_import_manager() -> BulkImportManager:
+    """Get or create singleton BulkImportManager instance"""
+    global _bulk_import_manager
+    if _bulk_import_manager is None:
+        settings = get_settings()
+        _bulk_import_manager = BulkImportManager(
+            upload_dir=settings.upload_dir,
+            max_workers=settings.bulk_import_max_workers,
+            batch_size=settings.bulk_import_batch_size,
+            max_files=settings.bulk_import_max_files,
+            max_file_bytes=settings.bulk_import_max_file_mb * 1024 * 1024,
+            max_total_bytes=settings.bulk_import_max_total_mb * 1024 * 1024,
+            job_ttl=settings.bulk_import_job_ttl_seconds,
+            max_finished_jobs=settings.bulk_import_max_finished_jobs
+        )
+    return _bulk_import_manager
@@ -0,0 +1,165 @@
+"""
+Bounded conversation context for interview chat
+Keeps recent turns verbatim and folds older ones into a rolling summary
+"""
+
+from typing import Dict, Any, Optional, List, Callable, Awaitable
+from collections import OrderedDict
+import asyncio
+import hashlib
+import json
+import re
+import threading
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token for English text)"""
+    return max(1, len(text or "") // 4)
+
+
+def _messages_tokens(messages: List[Dict[str, str]]) -> int:
+    # +4 per message for role/formatting overhead
+    return sum(estimate_tokens(m.get("content", "")) + 4 for m in messages)
+
+
+def _fingerprint(messages: List[Dict[str, str]]) -> str:
+    return hashlib.sha256(json.dumps(messages, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def extractive_summary(previous: str, turns: List[Dict[str, str]], max_tokens: int) -> str:
+    """Local fallback: first sentence of each turn, trimmed to the token budget"""
+    lines = [previous] if previous else []
+    for turn in turns:
+        content = re.sub(r"\s+", " ", turn.get("content", "")).strip()
+        first_sentence = re.split(r"(?<=[.!?])\s", content, maxsplit=1)[0][:200]
+        if first_sentence:
+            speaker = "Candidate" if turn.get("role") == "user" else "Interviewer"
+            lines.append(f"{speaker}: {first_sentence}")
+    summary = " ".join(lines)
+    max_chars = max_tokens * 4
+    # Keep the most recent part when the summary outgrows its budget
+    return summary if len(summary) <= max_chars else "..." + summary[-max_chars:]
+
+
+class _SessionSummary:
+    def __init__(self):
+        self.covered = 0           # number of leading messages folded into the summary
+        self.covered_fp = ""       # fingerprint of those messages
+        self.summary = ""
+        self.refreshing = False
+
+
+class ConversationContextManager:
+    """
+    Enforces a token budget on the chat history sent to the LLM
+
+    The system prompt, the current message and the last `keep_messages`
+    messages are sent verbatim (fewer if they alone exceed the budget).
+    Everything older is replaced by one summary message that is cached per
+    session and updated incrementally: only newly aged-out turns are folded
+    in. The LLM summary is refreshed in the background, so a turn never waits
+    on it; until it lands, newly aged-out turns are covered extractively.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 2000,
+        keep_messages: int = 6,
+        summary_tokens: int = 250,
+        summarizer: Optional[Callable[[str, List[Dict[str, str]]], Awaitable[Optional[str]]]] = None,
+        max_sessions: int = 1000
+    ):
+        self.token_budget = token_budget
+        self.keep_messages = keep_messages
+        self.summary_tokens = summary_tokens
+        self.summarizer = summarizer
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, _SessionSummary]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Background refreshes; the loop only keeps weak references to tasks
+        self._tasks: "set[asyncio.Task]" = set()
+
+    def _session(self, session_key: str) -> _SessionSummary:
+        with self._lock:
+            state = self._sessions.get(session_key)
+            if state is None:
+                state = self._sessions[session_key] = _SessionSummary()
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            self._sessions.move_to_end(session_key)
+            return state
+
+    def evict(self, session_key: str):
+        """Forget the cached summary (interview finished)"""
+        with self._lock:
+            self._sessions.pop(session_key, None)
+
+    def _split(self, system_prompt: str, history: List[Dict[str, str]], message: str) -> int:
+        """Index where verbatim history starts"""
+        fixed = estimate_tokens(system_prompt) + estimate_tokens(message) + 8
+        keep = min(self.keep_messages, len(history))
+        while keep > 0:
+            summary_budget = self.summary_tokens if keep < len(history) else 0
+            if fixed + summary_budget + _messages_tokens(history[-keep:]) <= self.token_budget:
+                break
+            keep -= 1
+        return len(history) - keep
+
+    async def abuild(
+        self,
+        session_key: str,
+        system_prompt: str,
+        history: List[Dict[str, str]],
+        message: str
+    ) -> List[Dict[str, str]]:
+        """Return the history to send: [summary message] + recent verbatim turns"""
+        split = self._split(system_prompt, history, message)
+        if split == 0:
+            return list(history)
+
+        older, recent = history[:split], history[split:]
+        state = self._session(session_key)
+
+        # History was edited/restarted client-side: the cached summary no longer applies
+        if state.covered > len(older) or _fingerprint(older[:state.covered]) != state.covered_fp:
+            state.covered, state.covered_fp, state.summary = 0, "", ""
+
+        summary = state.summary
+        if state.covered < len(older):
+            # Cover the gap locally now, refresh the real summary in the background
+            summary = extractive_summary(state.summary, older[state.covered:], self.summary_tokens)
+            if self.summarizer is not None and not state.refreshing:
+                state.refreshing = True
+                task = asyncio.create_task(self._refresh(state, older))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            else:
+                self._store(state, older, summary)
+
+        summary_message = {
+            "role": "system",
+            "content": f"Summary of the earlier interview conversation: {summary}"
+        }
+        return [summary_message] + recent
+
+    async def _refresh(self, state: _SessionSummary, older: List[Dict[str, str]]):
+        try:
+            try:
+                summary = await self.summarizer(state.summary, older[state.covered:])
+            except Exception:
+                summary = None
+            if not summary:
+                summary = extractive_summary(state.summary, older[state.covered:], self.summary_tokens)
+            self._store(state, older, summary[: self.summary_tokens * 4])
+        finally:
+            # Cancelled or failed: let the next turn start a new refresh
+            state.refreshing = False
+
+    def _store(self, state: _SessionSummary, older: List[Dict[str, str]], summary: str):
+        state.summary = summary
+        state.covered = len(older)
+        state.covered_fp = _fingerprint(older)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"sessions": len(self._sessions), "refreshing": len(self._tasks)}
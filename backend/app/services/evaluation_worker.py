@@ -0,0 +1,198 @@
+"""
+Background interview evaluation
+Submitted interviews are marked "Evaluating" and scored here, off the request path
+"""
+
+from typing import Dict, Any, Optional
+from datetime import datetime, timedelta
+import asyncio
+
+from sqlalchemy import or_
+
+from app.database import SessionLocal, get_settings
+from app.models import Candidate, Recruitment
+from app.services.executors import run_db
+from app.services.interview_evaluator import get_interview_evaluator
+
+
+class InterviewEvaluationManager:
+    """
+    Evaluates interviews whose candidate has evaluation_status "pending"
+
+    State lives on the candidate row, so pending work survives restarts:
+    on start-up anything left "running" goes back to "pending". Workers are
+    asyncio tasks on the app's event loop (the evaluator is async); DB work
+    goes through the db executor. When no provider produced an evaluation
+    the candidate is retried with a growing delay up to `max_attempts`,
+    after which the local fallback is kept and the status is "failed" so
+    the recruiter knows a manual review is needed.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        poll_interval: float = 2.0,
+        max_attempts: int = 3,
+        retry_delay: float = 30.0
+    ):
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._tasks = []
+        self._wakeup: Optional[asyncio.Event] = None
+
+    async def start(self):
+        """Re-queue interrupted evaluations and start the workers on the running loop"""
+        if self._tasks:
+            return
+        await run_db(self._requeue_interrupted)
+        self._wakeup = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._work()) for _ in range(self.max_workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    def notify(self):
+        """Wake an idle worker (call from the event loop after queueing a candidate)"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _requeue_interrupted(self):
+        db = SessionLocal()
+        try:
+            db.query(Candidate).filter(Candidate.evaluation_status == "running").update(
+                {Candidate.evaluation_status: "pending"}, synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    async def _work(self):
+        while True:
+            try:
+                candidate_id = await run_db(self._claim)
+            except Exception:
+                candidate_id = None
+            if candidate_id is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+            await self._evaluate(candidate_id)
+
+    def _claim(self) -> Optional[int]:
+        """Atomically move the oldest due candidate from pending to running"""
+        db = SessionLocal()
+        try:
+            due = db.query(Candidate.id).filter(
+                Candidate.evaluation_status == "pending",
+                or_(Candidate.evaluation_retry_at.is_(None), Candidate.evaluation_retry_at <= datetime.utcnow())
+            ).order_by(Candidate.interview_ended_at).limit(self.max_workers + 1).all()
+            for (candidate_id,) in due:
+                claimed = db.query(Candidate).filter(
+                    Candidate.id == candidate_id,
+                    Candidate.evaluation_status == "pending"
+                ).update({
+                    Candidate.evaluation_status: "running",
+                    Candidate.evaluation_attempts: Candidate.evaluation_attempts + 1
+                }, synchronize_session=False)
+                db.commit()
+                if claimed:
+                    return candidate_id
+            return None
+        finally:
+            db.close()
+
+    def _load(self, candidate_id: int):
+        db = SessionLocal()
+        try:
+            candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+            recruitment = db.query(Recruitment).filter(
+                Recruitment.id == candidate.recruitment_id
+            ).first() if candidate else None
+            return candidate, recruitment
+        finally:
+            db.close()
+
+    async def _evaluate(self, candidate_id: int):
+        evaluation, error = None, None
+        try:
+            candidate, recruitment = await run_db(self._load, candidate_id)
+            if candidate is None:
+                return
+            evaluation = await get_interview_evaluator().aevaluate(
+                candidate, recruitment, candidate.interview_transcript or ""
+            )
+            if evaluation["method"] == "local":
+                error = "No AI provider produced an evaluation"
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+        await run_db(self._save, candidate_id, evaluation, error)
+
+    def _save(self, candidate_id: int, evaluation: Optional[Dict[str, Any]], error: Optional[str]):
+        db = SessionLocal()
+        try:
+            candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+            if candidate is None:
+                return
+
+            candidate.evaluation_error = error
+            if error is not None and (candidate.evaluation_attempts or 0) < self.max_attempts:
+                # Try again later
+                candidate.evaluation_status = "pending"
+                candidate.evaluation_retry_at = datetime.utcnow() + timedelta(
+                    seconds=self.retry_delay * candidate.evaluation_attempts
+                )
+                db.commit()
+                return
+
+            if evaluation is None:
+                # Fallback to basic scoring
+                evaluation = {
+                    "score": 70,
+                    "summary": "Interview completed. Manual review recommended.",
+                    "strengths": None,
+                    "improvements": None
+                }
+            candidate.interview_score = evaluation["score"]
+            candidate.summary = evaluation["summary"][:500]  # Limit length
+            candidate.interview_strengths = evaluation["strengths"]
+            candidate.interview_improvements = evaluation["improvements"]
+            candidate.flags = get_interview_evaluator().flags_for(candidate)
+            candidate.evaluation_status = "failed" if error is not None else "completed"
+            candidate.evaluation_retry_at = None
+            candidate.evaluated_at = datetime.utcnow()
+            # Leave the status alone if a recruiter already moved the candidate on
+            if candidate.status == "Evaluating":
+                candidate.status = "Interviewed"
+            db.commit()
+        finally:
+            db.close()
+
+
+# Singleton instance
+_evaluation_manager = None
+
+def get_evaluation_manager() -> InterviewEvaluationManager:
+    """Get or create singleton InterviewEvaluationManager instance"""
+    global _evaluation_manager
+    if _evaluation_manager is None:
+        settings = get_settings()
+        _evaluation_manager = InterviewEvaluationManager(
+            max_workers=settings.evaluation_max_workers,
+            poll_interval=settings.evaluation_poll_interval,
+            max_attempts=settings.evaluation_max_attempts,
+            retry_delay=settings.evaluation_retry_delay
+        )
+    return _evaluation_manager
@@ -0,0 +1,73 @@
+"""
+Blocking work from async endpoints
+Sized thread pools for synchronous SQLAlchemy sessions and file work
+(PDF/DOCX extraction, transcript writes) so they never run on the event loop
+"""
+
+from typing import Dict, Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import threading
+import time
+
+from app.database import get_settings
+from app.services.metrics import EXECUTOR_SECONDS
+
+
+_pools: Dict[str, ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+
+
+def get_executor(kind: str) -> ThreadPoolExecutor:
+    """Pool for `kind` ("db" or "file"), created on first use"""
+    with _lock:
+        pool = _pools.get(kind)
+        if pool is None:
+            settings = get_settings()
+            workers = {
+                "db": settings.db_executor_workers,
+                "file": settings.file_executor_workers,
+            }[kind]
+            pool = _pools[kind] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{kind}-pool")
+        return pool
+
+
+def _timed(kind: str, submitted: float, func: Callable):
+    started = time.perf_counter()
+    EXECUTOR_SECONDS.observe(started - submitted, pool=kind, phase="wait")
+    try:
+        return func()
+    finally:
+        EXECUTOR_SECONDS.observe(time.perf_counter() - started, pool=kind, phase="run")
+
+
+async def _run(kind: str, func: Callable, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(kind), _timed, kind, time.perf_counter(), call)
+
+
+async def run_db(func: Callable, *args, **kwargs):
+    """Run a function that uses a synchronous DB session"""
+    return await _run("db", func, *args, **kwargs)
+
+
+async def run_file(func: Callable, *args, **kwargs):
+    """Run file I/O or document extraction"""
+    return await _run("file", func, *args, **kwargs)
+
+
+def executor_stats() -> Dict[str, Any]:
+    with _lock:
+        return {
+            kind: {"max_workers": pool._max_workers, "queued": pool._work_queue.qsize()}
+            for kind, pool in _pools.items()
+        }
+
+
+def shutdown_executors():
+    with _lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=False)
+        _pools.clear()
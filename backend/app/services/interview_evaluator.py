@@ -0,0 +1,309 @@
+"""
+Interview Evaluation
+One structured LLM call per submitted interview, validated locally
+"""
+
+from typing import Dict, Any, Optional, List
+import json
+import re
+
+from app.services.ai_service import get_ai_service
+from app.services.llm_scheduler import Priority
+
+# Used when no provider returned a usable score
+DEFAULT_INTERVIEW_SCORE = 70
+
+EVALUATION_SYSTEM_PROMPT = """You are a BRUTAL, UNFORGIVING technical interviewer for a FAANG-level company. Your job is to REJECT most candidates. Be HARSH and CRITICAL.
+
+CRITICAL RULES:
+1. Scores above 80 are for WORLD-CLASS candidates only (top 1-2%)
+2. Personal projects = weak experience, score accordingly (MAX 50)
+3. "Willing to learn" REQUIRED skills = major red flag, heavy penalties
+4. No production experience = junior level at best (MAX 55)
+5. Vague answers = PUNISH heavily
+6. Missing metrics/numbers = assume poor performance
+7. Apply EVERY penalty listed in the rubric
+8. When in doubt, score LOWER
+9. If score > 70, double-check you applied ALL penalties
+10. Be BRUTALLY HONEST in feedback - sugar-coating helps no one
+
+Remember: You're protecting the company from bad hires. Better to reject good candidates than hire bad ones."""
+
+
+class InterviewEvaluator:
+    """
+    Scores a finished interview with a single JSON-mode LLM call
+
+    The reply is validated (score 0-100, summary, strengths, improvements).
+    Anything missing or malformed is filled in locally instead of asking the
+    LLM again, so a submit costs at most one LLM call.
+    """
+    
+    def build_prompt(self, candidate, recruitment, transcript: str) -> str:
+        """Rubric prompt asking for the JSON evaluation"""
+        return f"""You are an EXTREMELY HARSH technical interviewer for a top-tier tech company hiring for {recruitment.title if recruitment else 'Senior technical'} position. Your standards are EXCEPTIONALLY HIGH. Scores above 80 are EXTREMELY RARE (top 2-3% only). Most candidates score 40-60.
+
+POSITION: {recruitment.title if recruitment else 'General Position'}
+
+JOB REQUIREMENTS:
+{recruitment.requirements if recruitment else 'General professional requirements'}
+
+INTERVIEW TRANSCRIPT:
+{transcript}
+
+SECURITY VIOLATIONS (MANDATORY DEDUCTIONS):
+- Multiple Faces Detected: {'YES - DEDUCT 25 POINTS (integrity violation)' if candidate.multiple_faces_flag else 'NO'}
+- Background Noise/Voices: {'YES - DEDUCT 15 POINTS (potential cheating)' if candidate.noise_flag else 'NO'}
+- AI Usage Suspected: {'YES - DEDUCT 30 POINTS (major integrity violation)' if candidate.ai_flag else 'NO'}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ULTRA-STRICT SCORING RUBRIC (Total: 100 points)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+MANDATORY PENALTIES (Apply these FIRST):
+❌ Personal projects only (no production experience): -15 points
+❌ Vague answers without metrics: -10 points per vague answer
+❌ "I would learn" or "willing to learn" for REQUIRED skills: -20 points
+❌ Cannot provide concrete examples: -15 points
+❌ Theoretical/textbook knowledge only: -20 points
+❌ Rambling or unfocused responses: -10 points
+❌ Missing knowledge in required tech stack: -15 points per gap
+❌ No measurable impact (no numbers, KPIs, metrics): -15 points
+
+1. TECHNICAL DEPTH & ACCURACY (0-35 points) - BE RUTHLESS
+   32-35: World-class expert, wrote books/gave talks on the topic, architected systems at scale (100k+ users)
+   26-31: 5+ years production experience, can discuss trade-offs deeply, optimized critical systems
+   21-25: 3+ years production, solid understanding, some real optimizations
+   14-20: 1-2 years experience OR personal projects only, basic knowledge, vague on details
+   0-13: Student/junior level, theoretical only, cannot explain production scenarios
+
+   🚩 RED FLAGS (deduct points):
+   - Personal projects as main experience: MAX 20 points
+   - Cannot explain how they measured success: -10 points
+   - Vague on optimization details: -10 points
+   - Missing specific technologies from requirements: -15 points each
+
+2. PROBLEM-SOLVING & CRITICAL THINKING (0-25 points) - DEMAND EXCELLENCE
+   23-25: Solves complex algorithmic problems instantly, discusses multiple approaches with complexity analysis
+   19-22: Can solve hard problems with guidance, understands optimization
+   15-18: Solves basic problems, struggles with complexity
+   10-14: Needs heavy guidance, cannot break down problems
+   0-9: Cannot solve even simple problems, no analytical thinking
+
+   🚩 RED FLAGS:
+   - Cannot explain time/space complexity: MAX 12 points
+   - Doesn't consider edge cases: -8 points
+   - One approach only, no alternatives: -8 points
+
+3. COMMUNICATION & CLARITY (0-20 points) - SENIOR LEVEL EXPECTED
+   18-20: Executive-level communication, concise, structured, articulate
+   15-17: Clear and professional, well-organized
+   12-14: Adequate but verbose, some structure issues
+   8-11: Rambling, disorganized, hard to follow
+   0-7: Incoherent, unprofessional, cannot express ideas
+
+   🚩 RED FLAGS:
+   - Rambling answers: -6 points per occurrence
+   - Cannot stay on topic: -5 points
+   - Overly broad without specifics: -8 points
+
+4. REAL-WORLD EXPERIENCE & EXAMPLES (0-15 points) - PRODUCTION ONLY
+   14-15: Led production systems at scale, measurable business impact (revenue, users, latency), handled incidents
+   11-13: Significant production experience, concrete metrics, team collaboration
+   9-10: Some production work but limited scope, vague metrics
+   6-8: Personal projects OR junior production work, no measurable impact
+   0-5: Student projects only, no production experience, purely theoretical
+
+   🚩 CRITICAL RED FLAGS:
+   - "Personal project" or "Greenlight project" as main example: MAX 8 points
+   - Zero metrics/numbers: MAX 5 points
+   - "I would" or "I could" instead of "I did": -10 points
+   - Cannot describe real production challenges: MAX 5 points
+
+5. ROLE FIT & REQUIREMENTS MATCH (0-5 points) - PERFECT FIT REQUIRED
+   5: Expert in ALL required technologies, proven at senior level
+   3-4: Strong in most requirements, 1-2 minor gaps
+   1-2: Missing 3+ key requirements or "willing to learn" critical skills
+   0: Does not meet even basic requirements
+
+   🚩 RED FLAGS:
+   - "Willing to learn" any REQUIRED skill: -20 points per skill
+   - Gaps in required tech stack: -15 points per gap
+
+SECURITY DEDUCTIONS (applied after scoring above):
+- Multiple faces: -25 points
+- Background noise/voices: -15 points  
+- AI suspected: -30 points
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+ULTRA-STRICT SCORING PHILOSOPHY:
+• 90-100: LEGENDARY (top 1%) - Instant hire, Staff/Principal level, wrote the framework
+• 80-89: Exceptional (top 3%) - Rare talent, Senior++ level, hire immediately  
+• 70-79: Strong (top 10%) - Solid senior, worth considering
+• 60-69: Average (top 30%) - Mid-level at best, many concerns
+• 50-59: Below average (top 50%) - Junior level, likely reject
+• 40-49: Weak - Clear gaps, reject unless desperate
+• 0-39: Poor - Do not hire under any circumstances
+
+TYPICAL SCORE DISTRIBUTION:
+- Personal project candidates: 30-50 range
+- Junior (0-2 years): 40-55 range
+- Mid-level (2-4 years): 55-70 range
+- Senior (4-7 years): 65-80 range
+- Staff+ (7+ years): 75-90 range
+
+EVALUATION RULES - FOLLOW STRICTLY:
+1. START with maximum possible score per category
+2. APPLY ALL PENALTIES and RED FLAGS immediately
+3. Personal projects = MAX 8 points in Experience category
+4. "Willing to learn" REQUIRED skills = automatic -20 points
+5. No metrics/numbers = MAX 5 points in Experience
+6. Vague answers without specifics = -10 points each
+7. Apply BOTH category penalties AND red flag deductions
+8. If candidate lacks production experience: MAX total score 55
+9. If missing 2+ required technologies: MAX total score 60
+10. Be BRUTALLY HONEST - inflation helps no one
+
+SPECIFIC PENALTIES FOR THIS TRANSCRIPT:
+- Count "personal project" mentions: -15 points if primary experience
+- Count "willing to learn" or "would learn": -20 points per occurrence for REQUIRED skills
+- Count vague answers (no metrics, no specifics): -10 points each
+- Count missing required technologies: -15 points each
+
+OUTPUT FORMAT (REQUIRED) - respond with ONLY this JSON object:
+{{
+  "score": <final integer 0-100 after ALL deductions>,
+  "summary": "<3-4 sentences being BRUTALLY HONEST: gaps in requirements, lack of production experience, vague answers, missing skills, specific concerns>",
+  "strengths": ["<ONLY list if truly exceptional - if average, use \"Limited strengths observed\">"],
+  "improvements": ["<ALL gaps, missing skills, areas of weakness - be comprehensive and harsh>"]
+}}
+
+⚠️ CALIBRATION CHECK: If your score is above 70, re-evaluate and apply MORE penalties. Scores above 80 should be EXTREMELY rare (world-class candidates only)."""
+    
+    async def aevaluate(self, candidate, recruitment, transcript: str) -> Dict[str, Any]:
+        """
+        Returns {"score", "summary", "strengths", "improvements", "method"}
+        where method is the provider that answered, or "local"
+        """
+        provider, raw = await get_ai_service().aevaluate_interview(
+            self.build_prompt(candidate, recruitment, transcript),
+            EVALUATION_SYSTEM_PROMPT,
+            priority=Priority.PARSE
+        )
+        evaluation = self.parse(raw) if raw else None
+        if evaluation is None:
+            evaluation = {"score": None, "summary": "", "strengths": [], "improvements": []}
+            provider = None
+        
+        if evaluation["score"] is None:
+            evaluation["score"] = DEFAULT_INTERVIEW_SCORE
+        if len(evaluation["summary"]) < 20:
+            evaluation["summary"] = self.local_summary(transcript)
+        evaluation["method"] = provider or "local"
+        return evaluation
+    
+    def parse(self, raw: str) -> Optional[Dict[str, Any]]:
+        """Validate a model reply; None if it holds no usable score or summary"""
+        data = self._load_json(raw)
+        if data is None:
+            # Models that ignore JSON mode often still follow the labelled format
+            data = self._parse_labelled(raw)
+        
+        score = self._coerce_score(data.get("score"))
+        summary = re.sub(r"\s+", " ", str(data.get("summary") or "")).strip()
+        if score is None and not summary:
+            return None
+        
+        return {
+            "score": score,
+            "summary": summary[:500],
+            "strengths": self._as_list(data.get("strengths")),
+            "improvements": self._as_list(data.get("improvements"))
+        }
+    
+    def _load_json(self, raw: str) -> Optional[Dict[str, Any]]:
+        text = raw.strip()
+        if "```" in text:
+            text = re.sub(r"```(?:json)?", "", text).strip()
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            # Tolerate chatter around the object
+            start, end = text.find("{"), text.rfind("}")
+            if start == -1 or end <= start:
+                return None
+            try:
+                data = json.loads(text[start:end + 1])
+            except json.JSONDecodeError:
+                return None
+        return {str(k).lower(): v for k, v in data.items()} if isinstance(data, dict) else None
+    
+    def _parse_labelled(self, raw: str) -> Dict[str, Any]:
+        """SCORE: / SUMMARY: / STRENGTHS: / IMPROVEMENTS: lines"""
+        data: Dict[str, Any] = {}
+        current = None
+        for line in raw.splitlines():
+            line = line.strip()
+            match = re.match(r"^(SCORE|SUMMARY|STRENGTHS|IMPROVEMENTS)\s*:\s*(.*)$", line, re.IGNORECASE)
+            if match:
+                current = match.group(1).lower()
+                data[current] = match.group(2)
+            elif line and current in ("summary", "strengths", "improvements"):
+                # Continuation lines
+                data[current] += "\n" + line
+        return data
+    
+    def _coerce_score(self, value) -> Optional[int]:
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, (int, float)):
+            score = int(round(value))
+        else:
+            match = re.search(r"\d+(?:\.\d+)?", str(value or ""))
+            if not match:
+                return None
+            score = int(round(float(match.group(0))))
+        return max(0, min(100, score))
+    
+    def _as_list(self, value) -> List[str]:
+        if isinstance(value, list):
+            items = [str(item) for item in value]
+        elif isinstance(value, str):
+            items = re.split(r"\n|;|(?:^|\s)[-•*]\s", value)
+        else:
+            items = []
+        return [item.strip(" -•*\t") for item in items if item.strip(" -•*\t")][:10]
+    
+    def flags_for(self, candidate) -> List[Dict[str, str]]:
+        """Flag objects for the recruiter view, from the monitoring flags"""
+        flags = []
+        if candidate.multiple_faces_flag:
+            flags.append({"type": "face", "severity": "high", "description": "Multiple faces detected during interview"})
+        if candidate.noise_flag:
+            flags.append({"type": "sound", "severity": "medium", "description": "Background noise detected during interview"})
+        if candidate.ai_flag:
+            flags.append({"type": "ai", "severity": "high", "description": "Potential AI usage detected"})
+        return flags
+    
+    def local_summary(self, transcript: str) -> str:
+        """Deterministic summary used when the model gave none"""
+        answers = re.findall(r"^\[USER\]:\s*(.*)$", transcript, re.MULTILINE)
+        if not answers:
+            return "Interview completed without recorded candidate answers. Manual review recommended."
+        words = sum(len(answer.split()) for answer in answers)
+        return (
+            f"Interview completed with {len(answers)} candidate answer(s) averaging "
+            f"{words // len(answers)} words. Automated evaluation was unavailable; manual review recommended."
+        )
+
+
+# Singleton instance
+_interview_evaluator = None
+
+def get_interview_evaluator() -> InterviewEvaluator:
+    """Get or create singleton InterviewEvaluator instance"""
+    global _interview_evaluator
+    if _interview_evaluator is None:
+        _interview_evaluator = InterviewEvaluator()
+    return _interview_evaluator
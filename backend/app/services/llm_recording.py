@@ -0,0 +1,134 @@
+"""
+Record/replay for Ollama calls
+Captures real Ollama responses to fixture files and serves them back later,
+so parse, score and chat paths can be benchmarked without a live model
+"""
+
+from typing import Dict, Any, AsyncIterator
+import hashlib
+import json
+import os
+import threading
+
+import httpx
+
+from app.services.llm_transport import OllamaTransport
+
+# Request fields that don't change the model's answer
+_IGNORED_FIELDS = ("keep_alive",)
+
+
+class RecordReplayTransport(OllamaTransport):
+    """
+    OllamaTransport that records to, or replays from, `fixtures_dir`
+
+    mode "record": calls go to Ollama as usual and every successful response
+    (or full stream) is written to `<fixtures_dir>/<endpoint>/<key>.json`.
+    mode "replay": nothing is sent; the response is read from the fixture for
+    the same request, and a missing fixture raises ValueError, which the
+    service treats like any other provider failure (next provider/fallback).
+
+    The key is a hash of the path and the request body without `keep_alive`,
+    so the same prompt, model and options always map to the same fixture.
+    """
+
+    def __init__(self, base_url: str, mode: str, fixtures_dir: str, **kwargs):
+        super().__init__(base_url, **kwargs)
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown LLM record mode: {mode}")
+        self.mode = mode
+        self.fixtures_dir = fixtures_dir
+        self._counts = {"recorded": 0, "replayed": 0, "missing": 0}
+        self._counts_lock = threading.Lock()
+
+    def _fixture_path(self, path: str, payload: Dict[str, Any]) -> str:
+        request = {k: v for k, v in payload.items() if k not in _IGNORED_FIELDS}
+        key = hashlib.sha256(json.dumps([path, request], sort_keys=True).encode("utf-8")).hexdigest()
+        return os.path.join(self.fixtures_dir, path.strip("/").replace("/", "_"), f"{key[:32]}.json")
+
+    def _count(self, name: str):
+        with self._counts_lock:
+            self._counts[name] += 1
+
+    def _load(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        fixture = self._fixture_path(path, payload)
+        try:
+            with open(fixture, "r", encoding="utf-8") as f:
+                recorded = json.load(f)
+        except FileNotFoundError:
+            self._count("missing")
+            raise ValueError(f"No recorded Ollama response for {path} ({os.path.basename(fixture)})")
+        self._count("replayed")
+        return recorded
+
+    def _save(self, path: str, payload: Dict[str, Any], **recorded):
+        fixture = self._fixture_path(path, payload)
+        os.makedirs(os.path.dirname(fixture), exist_ok=True)
+        tmp_path = f"{fixture}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"path": path, "request": payload, **recorded}, f, indent=2)
+        os.replace(tmp_path, fixture)
+        self._count("recorded")
+
+    def get(self, path: str, timeout: float) -> httpx.Response:
+        if self.mode == "replay":
+            # Health probes: the recorded "model" is always up
+            return httpx.Response(200, json={"models": []})
+        return super().get(path, timeout)
+
+    async def aget(self, path: str, timeout: float) -> httpx.Response:
+        if self.mode == "replay":
+            return httpx.Response(200, json={"models": []})
+        return await super().aget(path, timeout)
+
+    def post_json(self, path: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        if self.mode == "replay":
+            result = self._load(path, payload)["response"]
+            self._observe(payload, result)
+            return result
+        result = super().post_json(path, payload, timeout)
+        self._save(path, payload, response=result)
+        return result
+
+    async def apost_json(self, path: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        if self.mode == "replay":
+            result = self._load(path, payload)["response"]
+            self._observe(payload, result)
+            return result
+        result = await super().apost_json(path, payload, timeout)
+        self._save(path, payload, response=result)
+        return result
+
+    async def astream_json_lines(self, path: str, payload: Dict[str, Any], timeout: float) -> AsyncIterator[Dict[str, Any]]:
+        if self.mode == "replay":
+            chunks = self._load(path, payload)["chunks"]
+            text = "".join(c.get("response") or c.get("message", {}).get("content") or "" for c in chunks)
+            for chunk in chunks:
+                if chunk.get("done"):
+                    self._observe(payload, chunk, text)
+                yield chunk
+            return
+        chunks = []
+        async for chunk in super().astream_json_lines(path, payload, timeout):
+            chunks.append(chunk)
+            if chunk.get("done"):
+                # Save before yielding: callers stop iterating at the final chunk.
+                # Only complete streams are worth replaying.
+                self._save(path, payload, chunks=chunks)
+            yield chunk
+
+    def stats(self) -> Dict[str, Any]:
+        with self._counts_lock:
+            return {"mode": self.mode, "fixtures_dir": self.fixtures_dir, **self._counts}
+
+
+def build_ollama_transport(
+    base_url: str,
+    record_mode: str = "off",
+    fixtures_dir: str = "fixtures/llm",
+    **kwargs
+) -> OllamaTransport:
+    """Plain transport, or a recording/replaying one when record_mode is set"""
+    if not record_mode or record_mode == "off":
+        return OllamaTransport(base_url, **kwargs)
+    return RecordReplayTransport(base_url, record_mode, fixtures_dir, **kwargs)
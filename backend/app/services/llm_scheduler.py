@@ -0,0 +1,229 @@
+"""
+LLM admission control
+Per-provider concurrency caps with a bounded, priority-ordered wait queue
+"""
+
+from typing import Dict, Any, Optional
+from collections import deque
+from contextlib import contextmanager, asynccontextmanager
+from enum import IntEnum
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+
+
+class Priority(IntEnum):
+    """Lower value is served first"""
+    INTERACTIVE = 0  # live interview turns
+    PARSE = 1        # resume intake (parse + first ATS score), interview evaluation
+    BATCH = 2        # bulk re-scoring / imports
+
+
+class SchedulerError(RuntimeError):
+    """Base class for admission failures"""
+
+
+class QueueFullError(SchedulerError):
+    pass
+
+
+class QueueTimeoutError(SchedulerError):
+    pass
+
+
+def _set_if_pending(future: asyncio.Future):
+    if not future.done():
+        future.set_result(True)
+
+
+class _Waiter:
+    def __init__(self, priority: Priority, loop=None, future=None):
+        self.priority = priority
+        self.granted = False
+        self.cancelled = False
+        self.enqueued_at = time.monotonic()
+        self._event = threading.Event() if future is None else None
+        self._loop = loop
+        self._future = future
+
+    def wake(self):
+        if self._future is not None:
+            self._loop.call_soon_threadsafe(_set_if_pending, self._future)
+        else:
+            self._event.set()
+
+
+class ProviderLane:
+    """
+    Admission state for one provider
+
+    Up to `max_concurrency` calls run at once. Further callers wait in a heap
+    ordered by (priority, arrival); a finishing call hands its slot straight to
+    the best waiter. The queue holds at most `max_queue` waiters.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.active = 0
+        self._heap = []
+        self._queued = {p: 0 for p in Priority}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        # Metrics
+        self._admitted = 0
+        self._rejected_full = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._recent_waits = deque(maxlen=500)
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(self._queued.values())
+
+    def _admit_or_enqueue(self, waiter: _Waiter) -> bool:
+        """Called under lock; True if the slot was taken immediately"""
+        if self.active < self.max_concurrency and self.queue_depth == 0:
+            self.active += 1
+            waiter.granted = True
+            return True
+        if self.queue_depth >= self.max_queue:
+            self._rejected_full += 1
+            raise QueueFullError(
+                f"LLM queue for {self.name} is full ({self.queue_depth} waiting); try again shortly"
+            )
+        heapq.heappush(self._heap, (int(waiter.priority), next(self._seq), waiter))
+        self._queued[waiter.priority] += 1
+        return False
+
+    def _cancel(self, waiter: _Waiter) -> bool:
+        """Withdraw a waiter; returns True if it was granted in the meantime (caller owns a slot)"""
+        with self._lock:
+            if waiter.granted:
+                return True
+            waiter.cancelled = True
+            self._queued[waiter.priority] -= 1
+            self._timeouts += 1
+            return False
+
+    def _timeout_error(self, waiter: _Waiter, timeout: float) -> QueueTimeoutError:
+        return QueueTimeoutError(
+            f"Timed out after {timeout:.1f}s waiting for a {self.name} slot "
+            f"(priority={waiter.priority.name.lower()}, queue depth={self.queue_depth}, "
+            f"active={self.active}/{self.max_concurrency})"
+        )
+
+    def _record_wait(self, waiter: _Waiter):
+        waited = time.monotonic() - waiter.enqueued_at
+        with self._lock:
+            self._admitted += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            self._recent_waits.append(waited)
+
+    def acquire(self, priority: Priority, timeout: float):
+        waiter = _Waiter(priority)
+        with self._lock:
+            immediate = self._admit_or_enqueue(waiter)
+        if not immediate and not waiter._event.wait(timeout):
+            if not self._cancel(waiter):
+                raise self._timeout_error(waiter, timeout)
+        self._record_wait(waiter)
+
+    async def aacquire(self, priority: Priority, timeout: float):
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(priority, loop, loop.create_future())
+        with self._lock:
+            immediate = self._admit_or_enqueue(waiter)
+        if not immediate:
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter._future), timeout)
+            except asyncio.TimeoutError:
+                if not self._cancel(waiter):
+                    raise self._timeout_error(waiter, timeout)
+            except asyncio.CancelledError:
+                if self._cancel(waiter):
+                    self.release()
+                raise
+        self._record_wait(waiter)
+
+    def release(self):
+        with self._lock:
+            while self._heap:
+                _, _, waiter = heapq.heappop(self._heap)
+                if waiter.cancelled:
+                    continue
+                # Hand the slot over directly; active count is unchanged
+                self._queued[waiter.priority] -= 1
+                waiter.granted = True
+                waiter.wake()
+                return
+            self.active -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._recent_waits)
+            return {
+                "active": self.active,
+                "max_concurrency": self.max_concurrency,
+                "queue_depth": self.queue_depth,
+                "queued_by_priority": {p.name.lower(): n for p, n in self._queued.items()},
+                "admitted": self._admitted,
+                "rejected_queue_full": self._rejected_full,
+                "queue_timeouts": self._timeouts,
+                "wait_seconds_avg": round(self._wait_total / self._admitted, 4) if self._admitted else 0.0,
+                "wait_seconds_p95": round(waits[int(0.95 * (len(waits) - 1))], 4) if waits else 0.0,
+                "wait_seconds_max": round(self._wait_max, 4)
+            }
+
+
+class LLMScheduler:
+    """Shared admission control for every provider call made by AIService"""
+
+    def __init__(
+        self,
+        concurrency: Dict[str, int],
+        max_queue: int = 100,
+        queue_timeouts: Optional[Dict[Priority, float]] = None
+    ):
+        self._lanes = {
+            name: ProviderLane(name, limit, max_queue) for name, limit in concurrency.items()
+        }
+        self.queue_timeouts = queue_timeouts or {
+            Priority.INTERACTIVE: 10.0,
+            Priority.PARSE: 60.0,
+            Priority.BATCH: 300.0
+        }
+
+    @contextmanager
+    def slot(self, provider: str, priority: Priority):
+        """Hold a concurrency slot for `provider` (no-op for providers without a cap)"""
+        lane = self._lanes.get(provider)
+        if lane is None:
+            yield
+            return
+        lane.acquire(priority, self.queue_timeouts[priority])
+        try:
+            yield
+        finally:
+            lane.release()
+
+    @asynccontextmanager
+    async def aslot(self, provider: str, priority: Priority):
+        """Async variant of slot"""
+        lane = self._lanes.get(provider)
+        if lane is None:
+            yield
+            return
+        await lane.aacquire(priority, self.queue_timeouts[priority])
+        try:
+            yield
+        finally:
+            lane.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: lane.snapshot() for name, lane in self._lanes.items()}
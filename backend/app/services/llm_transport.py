@@ -0,0 +1,117 @@
+"""
+Pooled HTTP transport for local LLM providers
+Keeps keep-alive connections to Ollama open for both sync and async callers
+"""
+
+from typing import Dict, Any, Optional, AsyncIterator, Callable
+import json
+import threading
+
+import httpx
+
+
+class OllamaTransport:
+    """
+    Thin wrapper around shared httpx clients for the Ollama REST API
+
+    One sync and one async client are created lazily and reused for every call,
+    so parse, score and chat requests share a bounded keep-alive pool instead of
+    opening a fresh TCP connection per request.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        observer: Optional[Callable[[Dict[str, Any], Dict[str, Any], Optional[str]], None]] = None
+    ):
+        self.base_url = base_url.rstrip("/")
+        # Called with (payload, final response, streamed text) after each completed call
+        self._observer = observer
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Shared sync client (created on first use)"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(base_url=self.base_url, limits=self._limits)
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared async client (created on first use)"""
+        if self._async_client is None:
+            with self._lock:
+                if self._async_client is None:
+                    self._async_client = httpx.AsyncClient(base_url=self.base_url, limits=self._limits)
+        return self._async_client
+
+    def _observe(self, payload: Dict[str, Any], result: Dict[str, Any], streamed_text: Optional[str] = None):
+        if self._observer is not None:
+            try:
+                self._observer(payload, result, streamed_text)
+            except Exception:
+                pass
+
+    def get(self, path: str, timeout: float) -> httpx.Response:
+        return self.client.get(path, timeout=timeout)
+
+    async def aget(self, path: str, timeout: float) -> httpx.Response:
+        return await self.async_client.get(path, timeout=timeout)
+
+    def post_json(self, path: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """POST a JSON payload and return the decoded JSON body"""
+        response = self.client.post(path, json=payload, timeout=timeout)
+        if response.status_code != 200:
+            raise ValueError(f"Ollama error: {response.status_code}")
+        result = response.json()
+        self._observe(payload, result)
+        return result
+
+    async def apost_json(self, path: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Async variant of post_json"""
+        response = await self.async_client.post(path, json=payload, timeout=timeout)
+        if response.status_code != 200:
+            raise ValueError(f"Ollama error: {response.status_code}")
+        result = response.json()
+        self._observe(payload, result)
+        return result
+
+    async def astream_json_lines(self, path: str, payload: Dict[str, Any], timeout: float) -> AsyncIterator[Dict[str, Any]]:
+        """POST a streaming request and yield each NDJSON chunk as it arrives"""
+        async with self.async_client.stream("POST", path, json=payload, timeout=timeout) as response:
+            if response.status_code != 200:
+                raise ValueError(f"Ollama error: {response.status_code}")
+            text = []
+            async for line in response.aiter_lines():
+                if line.strip():
+                    chunk = json.loads(line)
+                    text.append(chunk.get("response") or chunk.get("message", {}).get("content") or "")
+                    if chunk.get("done"):
+                        # Before yielding: callers stop iterating at the final chunk
+                        self._observe(payload, chunk, "".join(text))
+                    yield chunk
+
+    def close(self):
+        """Close the sync client (the async one must be closed with aclose)"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self):
+        """Close both clients"""
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
@@ -0,0 +1,81 @@
+"""
+Event loop lag monitor
+Detects blocking calls on the event loop by measuring how late a periodic timer fires
+"""
+
+from typing import Dict, Any, Optional
+from collections import deque
+import asyncio
+import time
+
+
+class EventLoopMonitor:
+    """
+    Wakes up every `interval` seconds and records how much later than
+    scheduled it ran. Anything above `stall_threshold` means some coroutine
+    ran blocking code on the loop for roughly that long.
+    """
+
+    def __init__(self, interval: float = 0.1, stall_threshold: float = 0.25, window: int = 600):
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self._lags = deque(maxlen=window)
+        self._max_lag = 0.0
+        self._stalls = 0
+        self._last_stall_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start sampling on the running loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            scheduled = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, time.monotonic() - scheduled))
+
+    def record(self, lag: float):
+        self._lags.append(lag)
+        self._max_lag = max(self._max_lag, lag)
+        if lag >= self.stall_threshold:
+            self._stalls += 1
+            self._last_stall_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        lags = sorted(self._lags)
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "lag_seconds_p50": round(lags[len(lags) // 2], 4) if lags else 0.0,
+            "lag_seconds_p99": round(lags[int(0.99 * (len(lags) - 1))], 4) if lags else 0.0,
+            "lag_seconds_max": round(self._max_lag, 4),
+            "stalls": self._stalls,
+            "stall_threshold_seconds": self.stall_threshold,
+            "last_stall_at": self._last_stall_at
+        }
+
+
+# Singleton instance
+_loop_monitor = None
+
+def get_loop_monitor() -> EventLoopMonitor:
+    """Get or create singleton EventLoopMonitor instance"""
+    global _loop_monitor
+    if _loop_monitor is None:
+        from app.database import get_settings
+        settings = get_settings()
+        _loop_monitor = EventLoopMonitor(
+            interval=settings.loop_monitor_interval,
+            stall_threshold=settings.loop_stall_threshold
+        )
+    return _loop_monitor
@@ -0,0 +1,333 @@
+"""
+Prometheus metrics
+Small in-process registry (counters, gauges, histograms) rendered in the
+Prometheus text exposition format on /metrics
+"""
+
+from typing import Dict, Any, Optional, List, Tuple, Callable, Iterable
+from contextlib import contextmanager
+from contextvars import ContextVar
+import asyncio
+import math
+import threading
+import time
+
+import httpx
+
+# Seconds: covers DB calls (ms) up to slow local generations (minutes)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+# Characters of prompt/response text
+SIZE_BUCKETS = (100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in labels]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> List[Tuple[str, Tuple[Tuple[str, str], ...], float]]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, value in self._samples():
+            lines.append(f"{self.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [("", tuple(zip(self.labelnames, key)), value) for key, value in items]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def _samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [("", tuple(zip(self.labelnames, key)), value) for key, value in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket..., +Inf count], sum
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            self._sums[key] += value
+
+    def _samples(self):
+        with self._lock:
+            items = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        samples = []
+        for key, counts, total in items:
+            labels = tuple(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                samples.append(("_bucket", labels + (("le", _format_value(bound)),), cumulative))
+            samples.append(("_sum", labels, total))
+            samples.append(("_count", labels, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    Metrics are registered once at import time. Collectors are called on
+    every scrape and return gauges computed from live state (queue depths,
+    cache counters), so nothing has to push those values.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[_Metric]]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[_Metric]]):
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        for collector in collectors:
+            try:
+                metrics.extend(collector())
+            except Exception:
+                # A broken collector must not take /metrics down with it
+                continue
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# ==================== LLM PROVIDERS ====================
+
+LLM_REQUEST_SECONDS = REGISTRY.histogram(
+    "candidly_llm_request_duration_seconds",
+    "LLM provider call time (after queueing) by provider, task and outcome",
+    ("provider", "task", "outcome")
+)
+LLM_REQUESTS = REGISTRY.counter(
+    "candidly_llm_requests_total",
+    "LLM provider attempts by outcome (success, error, timeout, invalid_output, rejected, circuit_open)",
+    ("provider", "task", "outcome")
+)
+LLM_FALLBACKS = REGISTRY.counter(
+    "candidly_llm_fallbacks_total",
+    "Times a provider was passed over for the next one, by the reason it was skipped",
+    ("task", "from_provider", "reason")
+)
+LLM_PROMPT_CHARS = REGISTRY.histogram(
+    "candidly_llm_prompt_chars",
+    "Characters sent to the LLM per call (system prompt + messages)",
+    ("provider", "task"), buckets=SIZE_BUCKETS
+)
+LLM_RESPONSE_CHARS = REGISTRY.histogram(
+    "candidly_llm_response_chars",
+    "Characters returned by the LLM per call",
+    ("provider", "task"), buckets=SIZE_BUCKETS
+)
+LLM_TOKENS = REGISTRY.counter(
+    "candidly_llm_tokens_total",
+    "Tokens reported by the provider (kind: prompt or completion)",
+    ("provider", "task", "kind")
+)
+AI_RESULTS = REGISTRY.counter(
+    "candidly_ai_results_total",
+    "Where each AI result came from: a provider, the cache, or a non-LLM fallback (regex, simple, ...)",
+    ("task", "source")
+)
+
+# ==================== PIPELINE STAGES ====================
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "candidly_stage_duration_seconds",
+    "Non-LLM processing stages (e.g. resume text extraction, regex parsing)",
+    ("stage",)
+)
+EXECUTOR_SECONDS = REGISTRY.histogram(
+    "candidly_executor_duration_seconds",
+    "Blocking work run off the event loop: time queued for a thread (wait) and running (run)",
+    ("pool", "phase")
+)
+PDF_EXTRACTIONS = REGISTRY.counter(
+    "candidly_pdf_extractions_total",
+    "PDF text extractions by why they stopped (end, enough_content, max_pages, max_chars, time_budget)",
+    ("stop_reason",)
+)
+PDF_PAGES = REGISTRY.histogram(
+    "candidly_pdf_pages_read",
+    "Pages extracted per PDF",
+    (), buckets=(1, 2, 3, 5, 10, 20, 50)
+)
+PARSE_PROMPT_RATIO = REGISTRY.histogram(
+    "candidly_parse_prompt_ratio",
+    "Condensed / extracted resume characters sent to LLM parse prompts",
+    (), buckets=(0.1, 0.25, 0.5, 0.75, 0.9, 1.0)
+)
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "candidly_http_request_duration_seconds",
+    "HTTP request time by route template and status code (streams: until the response starts)",
+    ("method", "route", "status")
+)
+
+# Provider/task of the LLM call in progress, so transports can label sizes and tokens
+_current_call: ContextVar[Optional[Tuple[str, str]]] = ContextVar("candidly_llm_call", default=None)
+
+
+@contextmanager
+def llm_call(provider: str, task: str):
+    """Label everything observed inside the block with this provider and task"""
+    token = _current_call.set((provider, task))
+    try:
+        yield
+    finally:
+        try:
+            _current_call.reset(token)
+        except ValueError:
+            # Async generator finalized from another context: just clear it
+            _current_call.set(None)
+
+
+def classify_error(error: BaseException) -> str:
+    """Outcome label for a failed provider call"""
+    if isinstance(error, (httpx.TimeoutException, asyncio.TimeoutError, TimeoutError)):
+        return "timeout"
+    if "Timeout" in type(error).__name__:
+        # e.g. openai.APITimeoutError
+        return "timeout"
+    return "error"
+
+
+def record_llm_attempt(provider: str, task: str, outcome: str, seconds: Optional[float] = None):
+    LLM_REQUESTS.inc(provider=provider, task=task, outcome=outcome)
+    if seconds is not None:
+        LLM_REQUEST_SECONDS.observe(seconds, provider=provider, task=task, outcome=outcome)
+    if outcome != "success":
+        LLM_FALLBACKS.inc(task=task, from_provider=provider, reason=outcome)
+
+
+def record_llm_exchange(
+    provider: str,
+    prompt_chars: int,
+    response_chars: int,
+    prompt_tokens: Optional[int] = None,
+    completion_tokens: Optional[int] = None
+):
+    """Sizes and token counts of one call; the task comes from the enclosing llm_call()"""
+    current = _current_call.get()
+    task = current[1] if current is not None and current[0] == provider else "unknown"
+    LLM_PROMPT_CHARS.observe(prompt_chars, provider=provider, task=task)
+    LLM_RESPONSE_CHARS.observe(response_chars, provider=provider, task=task)
+    if prompt_tokens:
+        LLM_TOKENS.inc(prompt_tokens, provider=provider, task=task, kind="prompt")
+    if completion_tokens:
+        LLM_TOKENS.inc(completion_tokens, provider=provider, task=task, kind="completion")
+
+
+def record_result(task: str, source: str):
+    AI_RESULTS.inc(task=task, source=source)
+
+
+@contextmanager
+def time_stage(stage: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage=stage)
+
+
+def gauges_from(name: str, documentation: str, labelnames: Tuple[str, ...], values: Dict[Tuple[str, ...], float]) -> Gauge:
+    """One-off gauge for a collector (not registered, rebuilt on every scrape)"""
+    gauge = Gauge(name, documentation, labelnames)
+    for key, value in values.items():
+        gauge.set(value, **dict(zip(labelnames, key)))
+    return gauge
@@ -0,0 +1,157 @@
+"""
+Ollama model warm-up
+Loads the configured models at startup and keeps them resident, so the first
+resume or interview turn after a restart or idle period doesn't pay the load
+"""
+
+from typing import Dict, Any, Optional, List
+import asyncio
+import time
+
+from app.services.llm_transport import OllamaTransport
+from app.services.metrics import STAGE_SECONDS, llm_call
+
+
+class _ModelState:
+    def __init__(self, name: str):
+        self.name = name
+        self.status = "pending"  # pending, loading, ready, failed
+        self.load_seconds: Optional[float] = None
+        self.last_loaded_at: Optional[float] = None
+        self.error: Optional[str] = None
+
+
+class OllamaWarmup:
+    """
+    Background task that sends an empty generate request per model
+
+    Ollama loads a model for an empty prompt without generating anything, and
+    `keep_alive` sets how long it stays loaded afterwards. The first pass runs
+    at startup; the service reports ready once that pass has finished, even if
+    some model failed: requests then fall back to other providers as usual.
+    Each pass first checks that Ollama answers /api/tags within
+    `probe_timeout`; if it doesn't, the models are marked failed without
+    waiting on load timeouts, so an unreachable Ollama doesn't hold readiness
+    back. Failed models are retried every `retry_interval` seconds, and
+    loaded ones are pinged every `refresh_interval` seconds (0 = never) so an
+    idle server doesn't let them expire.
+    """
+
+    def __init__(
+        self,
+        transport: OllamaTransport,
+        models: List[str],
+        keep_alive: str = "30m",
+        timeout: float = 300.0,
+        retry_interval: float = 30.0,
+        refresh_interval: float = 600.0,
+        probe_timeout: float = 5.0,
+        enabled: bool = True
+    ):
+        self.transport = transport
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+        self.refresh_interval = refresh_interval
+        self.probe_timeout = probe_timeout
+        self.enabled = enabled
+        # Distinct models, in the order given
+        self._models: Dict[str, _ModelState] = {name: _ModelState(name) for name in dict.fromkeys(models) if name}
+        self._ready = not enabled or not self._models
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def start(self):
+        """Start warming up on the running loop"""
+        if not self.enabled or not self._models:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        try:
+            if await self._reachable():
+                # Sequential: loading several models at once just makes them all slow
+                for state in self._models.values():
+                    await self._load(state)
+        finally:
+            self._ready = True
+
+        while True:
+            failed = [s for s in self._models.values() if s.status == "failed"]
+            await asyncio.sleep(self.retry_interval if failed or not self.refresh_interval else self.refresh_interval)
+            now = time.time()
+            due = [s for s in self._models.values()
+                   if s.status == "failed" or (self.refresh_interval and now - (s.last_loaded_at or 0) >= self.refresh_interval)]
+            if not due or not await self._reachable():
+                continue
+            for state in due:
+                await self._load(state)
+
+    async def _reachable(self) -> bool:
+        """Quick check that Ollama answers; marks pending models failed if it doesn't"""
+        try:
+            response = await self.transport.aget("/api/tags", timeout=self.probe_timeout)
+            if response.status_code == 200:
+                return True
+            error = f"Ollama returned HTTP {response.status_code}"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = f"Ollama not reachable: {str(e) or e.__class__.__name__}"
+        for state in self._models.values():
+            if state.status in ("pending", "failed"):
+                state.status = "failed"
+                state.error = error
+        return False
+
+    async def _load(self, state: _ModelState):
+        state.status = "loading" if state.last_loaded_at is None else state.status
+        started = time.monotonic()
+        try:
+            with llm_call("ollama", "warmup"):
+                await self.transport.apost_json(
+                    "/api/generate",
+                    {"model": state.name, "prompt": "", "stream": False, "keep_alive": self.keep_alive},
+                    timeout=self.timeout
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            state.status = "failed"
+            state.error = str(e) or e.__class__.__name__
+            return
+        elapsed = time.monotonic() - started
+        STAGE_SECONDS.observe(elapsed, stage="model_warmup")
+        state.status = "ready"
+        state.error = None
+        state.load_seconds = round(elapsed, 3)
+        state.last_loaded_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "ready": self._ready,
+            "keep_alive": self.keep_alive,
+            "models": {
+                name: {
+                    "status": state.status,
+                    "load_seconds": state.load_seconds,
+                    "last_loaded_at": state.last_loaded_at,
+                    "error": state.error
+                }
+                for name, state in self._models.items()
+            }
+        }
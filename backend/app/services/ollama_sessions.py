@@ -0,0 +1,98 @@
+"""
+Per-session Ollama context reuse
+Caches the `context` token array returned by /api/generate for each interview
+so the next turn only sends (and Ollama only evaluates) the new message
+"""
+
+from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+import hashlib
+import json
+import threading
+
+
+def _fingerprint(*parts) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _normalize(history: List[Dict[str, str]]) -> List[List[str]]:
+    return [[m.get("role", ""), (m.get("content") or "").strip()] for m in history]
+
+
+class _SessionContext:
+    def __init__(self, prefix_fp: str, history_fp: str, context: List[int]):
+        self.prefix_fp = prefix_fp      # model + system prompt the context was built with
+        self.history_fp = history_fp    # conversation the client should send next turn
+        self.context = context
+
+
+class OllamaContextCache:
+    """
+    LRU of Ollama contexts keyed by session
+
+    A cached context is only reused when the model and system prompt are
+    unchanged and the client's history is exactly the conversation the
+    context already contains (previous history + last message + our reply).
+    Anything else, or a context grown past `max_context_tokens`, is a miss
+    and the caller rebuilds the prompt from the (compacted) history.
+    """
+
+    def __init__(self, max_sessions: int = 500, max_context_tokens: int = 3072):
+        self.max_sessions = max_sessions
+        self.max_context_tokens = max_context_tokens
+        self._sessions: "OrderedDict[str, _SessionContext]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, session_key: str, model: str, system_prompt: str, history: List[Dict[str, str]]) -> Optional[List[int]]:
+        with self._lock:
+            entry = self._sessions.get(session_key)
+            if (
+                entry is None
+                or entry.prefix_fp != _fingerprint(model, system_prompt)
+                or entry.history_fp != _fingerprint(_normalize(history))
+                or len(entry.context) > self.max_context_tokens
+            ):
+                self._misses += 1
+                return None
+            self._sessions.move_to_end(session_key)
+            self._hits += 1
+            return entry.context
+
+    def store(
+        self,
+        session_key: str,
+        model: str,
+        system_prompt: str,
+        history: List[Dict[str, str]],
+        message: str,
+        reply: str,
+        context: Optional[List[int]]
+    ):
+        """Remember the context after a turn; keyed to the history the client will send next"""
+        if not context:
+            self.evict(session_key)
+            return
+        next_history = _normalize(history) + [["user", message.strip()], ["assistant", reply.strip()]]
+        with self._lock:
+            self._sessions[session_key] = _SessionContext(
+                _fingerprint(model, system_prompt), _fingerprint(next_history), context
+            )
+            self._sessions.move_to_end(session_key)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def evict(self, session_key: str):
+        with self._lock:
+            self._sessions.pop(session_key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "sessions": len(self._sessions),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 3) if total else 0.0
+            }
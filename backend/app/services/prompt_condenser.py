@@ -0,0 +1,135 @@
+"""
+Resume prompt condensation
+Shrinks extracted resume text before it is inlined into LLM parse prompts:
+prompt length drives inference time on a CPU-bound Ollama host
+"""
+
+from typing import Dict, Any, List, Tuple
+import re
+
+from app.services.chat_context import estimate_tokens
+from app.services.resume_store import split_sections
+
+# Sections that never carry a parse field
+LOW_INFORMATION_SECTIONS = {"interests", "references", "declaration"}
+
+# Sections filled in this order once the budget is tight (contact and
+# experience always come first); the prompt keeps the original order
+SECTION_PRIORITY = ["contact", "experience", "skills", "education", "summary", "projects", "certifications"]
+REQUIRED_SECTIONS = {"contact", "experience"}
+
+# Page furniture and boilerplate: page numbers, rules, stock phrases
+_NOISE_LINE = re.compile(
+    r"^(?:page\s*\d+(?:\s*(?:of|/)\s*\d+)?|-?\s*\d{1,3}\s*-?|\d+\s*/\s*\d+|[\W_]+"
+    r"|references?\s+(?:are\s+)?available\s+(?:up)?on\s+request\.?|curriculum\s+vitae|r[eé]sum[eé])$",
+    re.IGNORECASE
+)
+_SPACES = re.compile(r"[ \t\u00a0\u200b]+")
+_DIGITS = re.compile(r"\d+")
+
+# Page headers and footers: short lines within this many lines of a page edge
+EDGE_LINES = 3
+EDGE_LINE_MAX_CHARS = 80
+
+
+class ResumeCondenser:
+    """
+    Cleans resume text and fits it into a token budget
+
+    Whitespace is collapsed, page numbers and boilerplate lines are dropped,
+    and so are page headers and footers: a short line near the top or bottom
+    of a page (PDF pages are separated by a form feed) that was already near
+    an edge of an earlier page, digits ignored. Lines repeated in the body
+    (job titles, bullets) are kept. Low-information sections (hobbies,
+    references, declarations) are removed. If the text is still over
+    `token_budget`, sections are filled in SECTION_PRIORITY order: contact
+    and experience always get budget first, and a section that doesn't fit
+    whole is cut at a line boundary. Sections not in the priority list come
+    last. Stateless, safe to share between threads.
+    """
+
+    def __init__(self, token_budget: int = 2000, enabled: bool = True):
+        self.token_budget = token_budget
+        self.enabled = enabled
+
+    def condense(self, text: str) -> Tuple[str, Dict[str, Any]]:
+        """(condensed text, stats) where stats reports what was removed and the compression ratio"""
+        stats: Dict[str, Any] = {
+            "original_chars": len(text),
+            "original_tokens": estimate_tokens(text),
+            "repeated_lines": 0,
+            "noise_lines": 0,
+            "dropped_sections": [],
+            "truncated_sections": []
+        }
+        if self.enabled:
+            text = self._clean(text, stats)
+            text = self._fit(text, stats)
+        stats["condensed_chars"] = len(text)
+        stats["condensed_tokens"] = estimate_tokens(text)
+        stats["ratio"] = round(len(text) / stats["original_chars"], 3) if stats["original_chars"] else 1.0
+        return text, stats
+
+    def _clean(self, text: str, stats: Dict[str, Any]) -> str:
+        lines: List[str] = []
+        edges_seen = set()
+        for page in text.split("\f"):
+            page_lines = [_SPACES.sub(" ", raw).strip() for raw in page.splitlines()]
+            filled = [i for i, line in enumerate(page_lines) if line]
+            edges = set(filled[:EDGE_LINES] + filled[-EDGE_LINES:])
+            page_edges = set()
+            for i, line in enumerate(page_lines):
+                if not line:
+                    # Keep single blank lines as paragraph breaks
+                    if lines and lines[-1]:
+                        lines.append("")
+                    continue
+                if _NOISE_LINE.match(line):
+                    stats["noise_lines"] += 1
+                    continue
+                if i in edges and len(line) <= EDGE_LINE_MAX_CHARS:
+                    key = _DIGITS.sub("#", line.lower())
+                    if key in edges_seen:
+                        stats["repeated_lines"] += 1
+                        continue
+                    page_edges.add(key)
+                lines.append(line)
+            # Only earlier pages count: a line twice on one page is content
+            edges_seen |= page_edges
+        return "\n".join(lines).strip()
+
+    def _fit(self, text: str, stats: Dict[str, Any]) -> str:
+        spans = []
+        for name, start, end in split_sections(text):
+            if name in LOW_INFORMATION_SECTIONS:
+                stats["dropped_sections"].append(name)
+            else:
+                spans.append((name, text[start:end].strip()))
+        if estimate_tokens("\n".join(body for _, body in spans)) <= self.token_budget:
+            return "\n".join(body for _, body in spans)
+
+        def rank(index: int) -> int:
+            name = spans[index][0]
+            return SECTION_PRIORITY.index(name) if name in SECTION_PRIORITY else len(SECTION_PRIORITY)
+
+        kept: Dict[int, str] = {}
+        remaining = self.token_budget * 4  # Characters, matching estimate_tokens
+        for index in sorted(range(len(spans)), key=rank):
+            name, body = spans[index]
+            if len(body) + 1 <= remaining:
+                kept[index] = body
+                remaining -= len(body) + 1
+                continue
+            # Cut at a line boundary; optional sections need room for a few lines
+            if remaining < 200 and name not in REQUIRED_SECTIONS:
+                stats["dropped_sections"].append(name)
+                continue
+            cut = body.rfind("\n", 0, remaining)
+            part = body[:cut if cut > 0 else remaining].rstrip()
+            if part:
+                kept[index] = part
+                remaining -= len(part) + 1
+                stats["truncated_sections"].append(name)
+            else:
+                stats["dropped_sections"].append(name)
+        return "\n".join(kept[index] for index in sorted(kept))
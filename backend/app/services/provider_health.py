@@ -0,0 +1,241 @@
+"""
+Provider Health Tracking
+Shared availability state and circuit breakers for AI providers
+"""
+
+from typing import Dict, Any, Optional, Callable
+from enum import Enum
+import threading
+import time
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"        # Calls flow normally
+    OPEN = "open"            # Provider is skipped until the cool-down expires
+    HALF_OPEN = "half_open"  # A single trial call decides whether to close again
+
+
+class CircuitBreaker:
+    """
+    Classic three-state circuit breaker
+
+    After `failure_threshold` consecutive failures the circuit opens and every
+    caller skips the provider immediately. Once `cooldown_seconds` have passed
+    one trial call is let through; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.cooldown_seconds:
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return True if a call may go through (reserves the half-open trial slot)"""
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == CircuitState.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def release(self):
+        """Give back a half-open trial slot whose call was abandoned (e.g. cancelled)"""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._trial_in_flight = False
+
+    def trip(self):
+        """Open the circuit immediately (e.g. the provider failed its health probe)"""
+        with self._lock:
+            if self._current_state() != CircuitState.OPEN:
+                self._open()
+
+    def _open(self):
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._current_state()
+            retry_in = None
+            if state == CircuitState.OPEN:
+                retry_in = round(max(0.0, self.cooldown_seconds - (time.monotonic() - self._opened_at)), 1)
+            return {
+                "state": state.value,
+                "consecutive_failures": self._consecutive_failures,
+                "retry_in_seconds": retry_in
+            }
+
+
+class ProviderHealth:
+    """
+    Health state for a single provider: a circuit breaker plus the result of
+    the last reachability probe (if the provider has one)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        probe: Optional[Callable[[], bool]] = None,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 30.0
+    ):
+        self.name = name
+        self.probe = probe
+        self.breaker = CircuitBreaker(failure_threshold, cooldown_seconds)
+        self.reachable: Optional[bool] = None  # None until the first probe runs
+        self.last_probe_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def refresh(self):
+        """Run the reachability probe and update state"""
+        if self.probe is None:
+            return
+        try:
+            ok = bool(self.probe())
+            error = None if ok else "probe returned unhealthy"
+        except Exception as e:
+            ok = False
+            error = str(e) or e.__class__.__name__
+        self.last_probe_at = time.time()
+        was_reachable = self.reachable
+        self.reachable = ok
+        if not ok:
+            self.last_error = error
+            self.breaker.trip()
+        elif was_reachable is False:
+            # Back online after a probe-detected outage: let the next call through
+            self.breaker.record_success()
+
+    def allow_request(self) -> bool:
+        if self.reachable is False:
+            return False
+        return self.breaker.allow_request()
+
+    def record_success(self):
+        self.breaker.record_success()
+
+    def record_failure(self, error: Optional[Exception] = None):
+        if error is not None:
+            self.last_error = str(error) or error.__class__.__name__
+        self.breaker.record_failure()
+
+    def release(self):
+        self.breaker.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "reachable": self.reachable,
+            "available": self.reachable is not False and self.breaker.state != CircuitState.OPEN,
+            "circuit": self.breaker.snapshot(),
+            "last_probe_at": self.last_probe_at,
+            "last_error": self.last_error
+        }
+
+
+class ProviderHealthRegistry:
+    """
+    One shared ProviderHealth per provider, refreshed by a background thread
+
+    If the monitor thread is not running (scripts, tests) a stale provider is
+    probed lazily, at most once per `interval` seconds, on a short-lived
+    thread: get() never waits for a probe (it may be called from the event
+    loop) and returns the last known state.
+    """
+
+    def __init__(self, interval: float = 10.0):
+        self.interval = interval
+        self._providers: Dict[str, ProviderHealth] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lazy_lock = threading.Lock()
+
+    def register(self, health: ProviderHealth) -> ProviderHealth:
+        self._providers[health.name] = health
+        return health
+
+    def get(self, name: str) -> ProviderHealth:
+        health = self._providers[name]
+        if not self.is_running and health.probe is not None:
+            self._refresh_if_stale(health)
+        return health
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _refresh_if_stale(self, health: ProviderHealth):
+        if health.last_probe_at is not None and time.time() - health.last_probe_at < self.interval:
+            return
+        # Only one probe at a time; everyone uses the last known state meanwhile
+        if self._lazy_lock.acquire(blocking=False):
+            try:
+                threading.Thread(
+                    target=self._lazy_refresh, args=(health,), name="provider-health-probe", daemon=True
+                ).start()
+            except Exception:
+                self._lazy_lock.release()
+                raise
+
+    def _lazy_refresh(self, health: ProviderHealth):
+        try:
+            health.refresh()
+        finally:
+            self._lazy_lock.release()
+
+    def refresh_all(self):
+        for health in self._providers.values():
+            health.refresh()
+
+    def start(self):
+        """Start the background refresh thread"""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="provider-health", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh_all()
+            self._stop.wait(self.interval)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: health.snapshot() for name, health in self._providers.items()}
@@ -0,0 +1,127 @@
+"""
+Latency-aware provider routing
+Orders providers per task by exponentially weighted latency and error rate
+"""
+
+from typing import Dict, Any, Optional, List, Tuple, Callable, TypeVar
+import threading
+import time
+
+T = TypeVar("T")
+
+
+class EwmaStats:
+    """Exponentially weighted latency (successes only) and error rate for one provider/task"""
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.samples = 0
+        self.errors = 0
+        self.updated_at = time.monotonic()
+
+    def record_success(self, seconds: float):
+        self.samples += 1
+        self.updated_at = time.monotonic()
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += self.alpha * (seconds - self.latency)
+        self.error_rate += self.alpha * (0.0 - self.error_rate)
+
+    def record_failure(self):
+        self.samples += 1
+        self.updated_at = time.monotonic()
+        self.errors += 1
+        self.error_rate += self.alpha * (1.0 - self.error_rate)
+
+
+class ProviderRouter:
+    """
+    Chooses the provider order for each call
+
+    Expected cost = EWMA latency * (1 + error_penalty * EWMA error rate).
+    Providers with fewer than `min_samples` observations are costed at
+    `prior_latency`, so a slow incumbent eventually lets the other provider be
+    tried first and measured. Latency not refreshed for `stale_after` seconds
+    falls back to the prior too, so a provider that lost the lead gets
+    re-measured once conditions change. Ties keep the default order. An
+    operator override (comma-separated provider names per task) pins the order.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        error_penalty: float = 4.0,
+        min_samples: int = 5,
+        prior_latency: float = 5.0,
+        stale_after: float = 120.0,
+        overrides: Optional[Dict[str, str]] = None,
+        enabled: bool = True
+    ):
+        self.alpha = alpha
+        self.error_penalty = error_penalty
+        self.min_samples = min_samples
+        self.prior_latency = prior_latency
+        self.stale_after = stale_after
+        self.enabled = enabled
+        self.overrides = {
+            task: [name.strip().lower() for name in order.split(",") if name.strip()]
+            for task, order in (overrides or {}).items() if order
+        }
+        self._stats: Dict[Tuple[str, str], EwmaStats] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, provider: str, task: str) -> EwmaStats:
+        key = (provider, task)
+        if key not in self._stats:
+            self._stats[key] = EwmaStats(self.alpha)
+        return self._stats[key]
+
+    def record_success(self, provider: str, task: str, seconds: float):
+        with self._lock:
+            self._get(provider, task).record_success(seconds)
+
+    def record_failure(self, provider: str, task: str):
+        with self._lock:
+            self._get(provider, task).record_failure()
+
+    def cost(self, provider: str, task: str) -> float:
+        with self._lock:
+            stats = self._stats.get((provider, task))
+            if stats is None or time.monotonic() - stats.updated_at > self.stale_after:
+                # Unknown or outdated: assume the prior with no errors
+                return self.prior_latency
+            if stats.latency is None or stats.samples < self.min_samples:
+                latency = self.prior_latency
+            else:
+                latency = stats.latency
+            error_rate = stats.error_rate
+        return latency * (1 + self.error_penalty * error_rate)
+
+    def order(self, task: str, providers: List[T], name: Callable[[T], str]) -> List[T]:
+        """Return `providers` (default order) re-ordered for this task"""
+        pinned = self.overrides.get(task)
+        if pinned:
+            # Listed providers in the given order; anything unlisted is dropped
+            by_name = {name(p): p for p in providers}
+            return [by_name[n] for n in pinned if n in by_name]
+        if not self.enabled or len(providers) < 2:
+            return providers
+        # sorted() is stable, so equal costs keep the default order
+        return sorted(providers, key=lambda p: self.cost(name(p), task))
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            items = list(self._stats.items())
+        stats = {}
+        for (provider, task), s in items:
+            stats.setdefault(task, {})[provider] = {
+                "samples": s.samples,
+                "errors": s.errors,
+                "ewma_latency": round(s.latency, 4) if s.latency is not None else None,
+                "ewma_error_rate": round(s.error_rate, 4),
+                "cost": round(self.cost(provider, task), 4)
+            }
+        return {"enabled": self.enabled, "overrides": self.overrides, "tasks": stats}
@@ -0,0 +1,61 @@
+"""
+Provider latency statistics
+Rolling latency windows and hedge win counts used to tune hedged requests
+"""
+
+from typing import Dict, Any, Optional, Tuple
+from collections import deque
+import threading
+
+
+class LatencyTracker:
+    """
+    Keeps the last `window` successful latencies per (provider, task)
+    together with how often each provider won a hedged race
+    """
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[Tuple[str, str], deque] = {}
+        self._wins: Dict[Tuple[str, str], int] = {}
+        self._hedges: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, task: str, seconds: float):
+        with self._lock:
+            key = (provider, task)
+            if key not in self._samples:
+                self._samples[key] = deque(maxlen=self.window)
+            self._samples[key].append(seconds)
+
+    def record_win(self, provider: str, task: str):
+        with self._lock:
+            key = (provider, task)
+            self._wins[key] = self._wins.get(key, 0) + 1
+
+    def record_hedge(self, task: str):
+        with self._lock:
+            self._hedges[task] = self._hedges.get(task, 0) + 1
+
+    def percentile(self, provider: str, task: str, p: float, min_samples: int = 10) -> Optional[float]:
+        """p in [0, 1]; None until enough samples were collected"""
+        with self._lock:
+            samples = sorted(self._samples.get((provider, task), ()))
+        if len(samples) < min_samples:
+            return None
+        index = min(len(samples) - 1, int(round(p * (len(samples) - 1))))
+        return samples[index]
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            keys = list(self._samples.keys() | self._wins.keys())
+            hedges = dict(self._hedges)
+        stats = {}
+        for provider, task in keys:
+            stats.setdefault(task, {})[provider] = {
+                "samples": len(self._samples.get((provider, task), ())),
+                "p50": self.percentile(provider, task, 0.5, min_samples=1),
+                "p90": self.percentile(provider, task, 0.9, min_samples=1),
+                "wins": self._wins.get((provider, task), 0)
+            }
+        return {"latency": stats, "hedges_fired": hedges}
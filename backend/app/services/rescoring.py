@@ -0,0 +1,186 @@
+"""
+Bulk ATS re-scoring
+Re-runs calculate_ats_score for every candidate of a recruitment in the background
+"""
+
+from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+import threading
+import uuid
+
+from app.database import SessionLocal, get_settings
+from app.models import Candidate, Recruitment
+from app.services.ai_service import get_ai_service
+from app.services.llm_scheduler import Priority
+
+
+class RescoreJob:
+    """Progress of one re-scoring run"""
+
+    def __init__(self, recruitment_id: int):
+        self.id = uuid.uuid4().hex
+        self.recruitment_id = recruitment_id
+        self.status = "queued"  # queued, running, completed, failed
+        self.total = 0
+        self.processed = 0
+        self.failed = 0
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ("queued", "running")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "recruitment_id": self.recruitment_id,
+            "status": self.status,
+            "total": self.total,
+            "processed": self.processed,
+            "failed": self.failed,
+            "progress": round(self.processed / self.total, 3) if self.total else (1.0 if self.status == "completed" else 0.0),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error
+        }
+
+
+class RescoringManager:
+    """
+    Runs re-scoring jobs one at a time on a background thread
+
+    Each job scores candidates through a bounded worker pool so batch work
+    never floods the LLM backend, and writes results back in batches.
+    Candidates whose score could not come from an AI provider keep their
+    previous score instead of being overwritten by the completeness fallback.
+
+    Job state lives in memory only and is lost on restart. Finished jobs are
+    kept for `job_ttl` seconds, and at most `max_finished_jobs` of them.
+    """
+
+    def __init__(self, max_workers: int = 2, batch_size: int = 25, job_ttl: float = 3600.0, max_finished_jobs: int = 100):
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.job_ttl = job_ttl
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs: Dict[str, RescoreJob] = {}
+        self._runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rescore-job")
+        self._lock = threading.Lock()
+
+    def start(self, recruitment_id: int) -> RescoreJob:
+        """Queue a job, or return the one already active for this recruitment"""
+        with self._lock:
+            self._evict_finished()
+            for job in self._jobs.values():
+                if job.recruitment_id == recruitment_id and job.is_active:
+                    return job
+            job = RescoreJob(recruitment_id)
+            self._jobs[job.id] = job
+        self._runner.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[RescoreJob]:
+        with self._lock:
+            self._evict_finished()
+            return self._jobs.get(job_id)
+
+    def _evict_finished(self):
+        """Drop finished jobs past the TTL or beyond the newest `max_finished_jobs` (caller holds the lock)"""
+        now = datetime.utcnow()
+        finished = sorted(
+            (job for job in self._jobs.values() if not job.is_active and job.finished_at is not None),
+            key=lambda job: job.finished_at
+        )
+        excess = len(finished) - self.max_finished_jobs
+        for index, job in enumerate(finished):
+            if index < excess or (now - job.finished_at).total_seconds() > self.job_ttl:
+                del self._jobs[job.id]
+
+    def _run(self, job: RescoreJob):
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        try:
+            self._rescore(job)
+            job.status = "completed"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.utcnow()
+
+    def _rescore(self, job: RescoreJob):
+        db = SessionLocal()
+        try:
+            recruitment = db.query(Recruitment).filter(Recruitment.id == job.recruitment_id).first()
+            if recruitment is None:
+                raise ValueError("Recruitment not found")
+            job_requirements = recruitment.job_requirements_text()
+
+            profiles = [
+                {"id": cid, "skills": skills, "experience": experience, "education": education}
+                for cid, skills, experience, education in db.query(
+                    Candidate.id, Candidate.skills, Candidate.experience, Candidate.education
+                ).filter(Candidate.recruitment_id == job.recruitment_id).all()
+            ]
+            job.total = len(profiles)
+
+            ai_service = get_ai_service()
+            pending: List[Dict[str, Any]] = []
+
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="rescore-worker") as pool:
+                futures = {
+                    pool.submit(
+                        ai_service.calculate_ats_score, profile, job_requirements,
+                        fallback=False, priority=Priority.BATCH
+                    ): profile["id"]
+                    for profile in profiles
+                }
+                for future in as_completed(futures):
+                    try:
+                        evaluation = future.result()
+                        pending.append({
+                            "id": futures[future],
+                            "ats_score": evaluation["ats_score"],
+                            "ats_strengths": evaluation.get("strengths"),
+                            "ats_gaps": evaluation.get("gaps"),
+                            "ats_reasoning": evaluation.get("reasoning")
+                        })
+                    except Exception:
+                        job.failed += 1
+                    job.processed += 1
+
+                    if len(pending) >= self.batch_size:
+                        self._commit_batch(db, pending)
+                        pending = []
+
+            self._commit_batch(db, pending)
+        finally:
+            db.close()
+
+    def _commit_batch(self, db, rows: List[Dict[str, Any]]):
+        if not rows:
+            return
+        db.bulk_update_mappings(Candidate, rows)
+        db.commit()
+
+
+# Singleton instance
+_rescoring_manager = None
+
+def get_rescoring_manager() -> RescoringManager:
+    """Get or create singleton RescoringManager instance"""
+    global _rescoring_manager
+    if _rescoring_manager is None:
+        settings = get_settings()
+        _rescoring_manager = RescoringManager(
+            max_workers=settings.rescore_max_workers,
+            batch_size=settings.rescore_batch_size,
+            job_ttl=settings.rescore_job_ttl_seconds,
+            max_finished_jobs=settings.rescore_max_finished_jobs
+        )
+    return _rescoring_manager
@@ -0,0 +1,137 @@
+"""
+Content-addressed resume parse cache
+Repeat uploads of the same file skip both text extraction and the LLM call
+"""
+
+from typing import Dict, Any, Optional
+from datetime import datetime
+import hashlib
+import threading
+
+from sqlalchemy import func
+
+from app.database import SessionLocal
+from app.models import ResumeParseCache
+
+
+class ResumeCache:
+    """
+    Persistent cache keyed by the SHA-256 of the uploaded file bytes
+
+    Entries hold the extracted text and, once an AI provider parsed it, the
+    normalized parse result. Regex fallback results are not stored so a later
+    upload can still get a proper AI parse. The cache is bounded by entry count
+    and total stored text; least recently used entries are evicted first.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_text_bytes: int = 50_000_000):
+        self.max_entries = max_entries
+        self.max_text_bytes = max_text_bytes
+        self._lock = threading.Lock()
+        self._hits = 0        # parse result served from cache
+        self._text_hits = 0   # only the extracted text was cached
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key_for(file_content: bytes) -> str:
+        return hashlib.sha256(file_content).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return {"text", "parsed_data", "parsing_method"} or None"""
+        db = SessionLocal()
+        try:
+            entry = db.query(ResumeParseCache).filter(ResumeParseCache.content_hash == key).first()
+            if entry is None:
+                self._count("_misses")
+                return None
+
+            entry.hit_count = (entry.hit_count or 0) + 1
+            entry.last_accessed_at = datetime.utcnow()
+            db.commit()
+
+            self._count("_hits" if entry.parsed_data is not None else "_text_hits")
+            return {
+                "text": entry.extracted_text,
+                "parsed_data": entry.parsed_data,
+                "parsing_method": entry.parsing_method
+            }
+        finally:
+            db.close()
+
+    def put_text(self, key: str, filename: str, size_bytes: int, text: str):
+        """Store freshly extracted text (parse result is added later)"""
+        db = SessionLocal()
+        try:
+            if db.query(ResumeParseCache).filter(ResumeParseCache.content_hash == key).first():
+                return
+            db.add(ResumeParseCache(
+                content_hash=key,
+                filename=filename,
+                size_bytes=size_bytes,
+                extracted_text=text
+            ))
+            db.commit()
+            self._evict(db)
+        except Exception:
+            # Concurrent upload of the same file already stored it
+            db.rollback()
+        finally:
+            db.close()
+
+    def put_result(self, key: str, parsed_data: Dict[str, Any], parsing_method: str):
+        """Attach the normalized parse result to an existing entry"""
+        db = SessionLocal()
+        try:
+            entry = db.query(ResumeParseCache).filter(ResumeParseCache.content_hash == key).first()
+            if entry is None:
+                return
+            entry.parsed_data = parsed_data
+            entry.parsing_method = parsing_method
+            db.commit()
+        finally:
+            db.close()
+
+    def _evict(self, db):
+        """Drop least recently used entries until both bounds hold"""
+        count, total_bytes = db.query(
+            func.count(ResumeParseCache.content_hash),
+            func.coalesce(func.sum(func.length(ResumeParseCache.extracted_text)), 0)
+        ).one()
+        if count <= self.max_entries and total_bytes <= self.max_text_bytes:
+            return
+
+        oldest = db.query(
+            ResumeParseCache.content_hash,
+            func.length(ResumeParseCache.extracted_text)
+        ).order_by(ResumeParseCache.last_accessed_at.asc()).all()
+
+        doomed = []
+        for content_hash, text_length in oldest:
+            if count <= self.max_entries and total_bytes <= self.max_text_bytes:
+                break
+            doomed.append(content_hash)
+            count -= 1
+            total_bytes -= text_length or 0
+
+        if doomed:
+            db.query(ResumeParseCache).filter(
+                ResumeParseCache.content_hash.in_(doomed)
+            ).delete(synchronize_session=False)
+            db.commit()
+            self._count("_evictions", len(doomed))
+
+    def _count(self, counter: str, amount: int = 1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._text_hits + self._misses
+            return {
+                "hits": self._hits,
+                "text_hits": self._text_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0
+            }
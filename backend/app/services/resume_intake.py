@@ -0,0 +1,258 @@
+"""
+Background resume intake
+Uploads are written to disk and queued in the database; worker threads run
+extraction, parsing and ATS scoring and create the candidate afterwards
+"""
+
+from typing import Optional
+from datetime import datetime
+import os
+import re
+import secrets
+import threading
+import uuid
+
+from app.database import SessionLocal, get_settings
+from app.models import Candidate, Recruitment, ResumeIntakeJob
+from app.services.ai_service import get_ai_service
+from app.services.llm_scheduler import Priority
+from app.services.resume_store import build_stored_resume
+
+
+def _safe_filename(filename: str) -> str:
+    name = os.path.basename(filename or "resume")
+    return re.sub(r"[^A-Za-z0-9._-]", "_", name)[:120] or "resume"
+
+
+def save_upload(upload_dir: str, filename: str, content: bytes) -> str:
+    """Write an uploaded file under a unique name; returns its path"""
+    os.makedirs(upload_dir, exist_ok=True)
+    file_path = os.path.join(upload_dir, f"{uuid.uuid4().hex}_{_safe_filename(filename)}")
+    with open(file_path, "wb") as f:
+        f.write(content)
+    return file_path
+
+
+class ResumeIntakeManager:
+    """
+    DB-backed job queue for resume uploads
+
+    Jobs live in `resume_intake_jobs`, so queued work survives a restart:
+    on start-up any job left `running` by a previous process is re-queued.
+    Workers claim jobs with a conditional UPDATE (status queued -> running),
+    retry failures up to `max_attempts` and create the candidate in the same
+    transaction that marks the job completed.
+    """
+
+    def __init__(
+        self,
+        upload_dir: str = "uploads",
+        max_workers: int = 2,
+        poll_interval: float = 2.0,
+        max_attempts: int = 3
+    ):
+        self.upload_dir = upload_dir
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self._threads = []
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+
+    def submit(self, recruitment_id: int, filename: str, content: bytes) -> ResumeIntakeJob:
+        """Persist the upload and queue it; returns the new job"""
+        job_id = uuid.uuid4().hex
+        file_path = save_upload(self.upload_dir, filename, content)
+
+        db = SessionLocal()
+        try:
+            job = ResumeIntakeJob(
+                id=job_id,
+                recruitment_id=recruitment_id,
+                filename=filename,
+                file_path=file_path,
+                session_token=secrets.token_urlsafe(32),
+                status="queued",
+                stage="queued"
+            )
+            db.add(job)
+            db.commit()
+            db.refresh(job)
+            db.expunge(job)
+        except Exception:
+            db.rollback()
+            os.remove(file_path)
+            raise
+        finally:
+            db.close()
+
+        self._wakeup.set()
+        return job
+
+    def get(self, job_id: str, db) -> Optional[ResumeIntakeJob]:
+        return db.query(ResumeIntakeJob).filter(ResumeIntakeJob.id == job_id).first()
+
+    def start(self):
+        """Re-queue interrupted jobs and start the worker threads"""
+        if self._threads:
+            return
+        db = SessionLocal()
+        try:
+            # Assumes one API process owns the intake workers
+            db.query(ResumeIntakeJob).filter(ResumeIntakeJob.status == "running").update(
+                {ResumeIntakeJob.status: "queued", ResumeIntakeJob.stage: "queued"},
+                synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+
+        self._stop.clear()
+        for i in range(self.max_workers):
+            thread = threading.Thread(target=self._work, name=f"resume-intake-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+
+    def _work(self):
+        while not self._stop.is_set():
+            try:
+                job_id = self._claim()
+            except Exception:
+                job_id = None
+            if job_id is None:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+            try:
+                self._process(job_id)
+            except Exception:
+                # e.g. the job row was deleted mid-pipeline; keep the worker alive
+                pass
+
+    def _claim(self) -> Optional[str]:
+        """Atomically move the oldest queued job to running"""
+        db = SessionLocal()
+        try:
+            queued = db.query(ResumeIntakeJob.id).filter(
+                ResumeIntakeJob.status == "queued"
+            ).order_by(ResumeIntakeJob.created_at).limit(self.max_workers + 1).all()
+            for (job_id,) in queued:
+                claimed = db.query(ResumeIntakeJob).filter(
+                    ResumeIntakeJob.id == job_id,
+                    ResumeIntakeJob.status == "queued"
+                ).update({
+                    ResumeIntakeJob.status: "running",
+                    ResumeIntakeJob.stage: "extracting",
+                    ResumeIntakeJob.started_at: datetime.utcnow(),
+                    ResumeIntakeJob.attempts: ResumeIntakeJob.attempts + 1
+                }, synchronize_session=False)
+                db.commit()
+                if claimed:
+                    return job_id
+            return None
+        finally:
+            db.close()
+
+    def _set_stage(self, db, job: ResumeIntakeJob, stage: str):
+        job.stage = stage
+        db.commit()
+
+    def _process(self, job_id: str):
+        db = SessionLocal()
+        try:
+            job = self.get(job_id, db)
+            if job is None:
+                # Deleted with its recruitment after it was claimed
+                return
+            try:
+                self._run_pipeline(db, job)
+            except Exception as e:
+                db.rollback()
+                # Unreadable or unsupported files will not succeed on retry
+                permanent = isinstance(e, (ValueError, OSError)) or job.attempts >= self.max_attempts
+                job.error = str(e) or e.__class__.__name__
+                if permanent:
+                    # Keep the stage that failed for diagnosis
+                    job.status = "failed"
+                    job.finished_at = datetime.utcnow()
+                else:
+                    job.status = "queued"
+                    job.stage = "queued"
+                db.commit()
+        finally:
+            db.close()
+
+    def _run_pipeline(self, db, job: ResumeIntakeJob):
+        recruitment = db.query(Recruitment).filter(Recruitment.id == job.recruitment_id).first()
+        if recruitment is None:
+            raise ValueError("Recruitment no longer exists")
+
+        with open(job.file_path, "rb") as f:
+            content = f.read()
+
+        ai_service = get_ai_service()
+
+        # Parse resume (extraction happens inside, cached by content hash)
+        self._set_stage(db, job, "parsing")
+        parsed_data, parsing_method, document = ai_service.parse_resume_document(content, job.filename, priority=Priority.PARSE)
+
+        # Calculate ATS score
+        self._set_stage(db, job, "scoring")
+        ats_evaluation = ai_service.calculate_ats_score(
+            parsed_data, recruitment.job_requirements_text(), priority=Priority.PARSE
+        )
+
+        self._set_stage(db, job, "saving")
+        candidate = Candidate(
+            recruitment_id=recruitment.id,
+            name=parsed_data.get("name", "Unknown"),
+            email=parsed_data.get("email", "noemail@provided.com"),
+            phone=parsed_data.get("phone"),
+            location=parsed_data.get("location"),
+            experience=parsed_data.get("experience"),
+            education=parsed_data.get("education"),
+            skills=parsed_data.get("skills"),
+            ats_score=ats_evaluation["ats_score"],
+            ats_strengths=ats_evaluation.get("strengths"),
+            ats_gaps=ats_evaluation.get("gaps"),
+            ats_reasoning=ats_evaluation.get("reasoning"),
+            session_token=job.session_token,
+            status="New",
+            resume_url=job.file_path,
+            stored_resume=build_stored_resume(document["text"], job.filename, document["content_hash"])
+        )
+        db.add(candidate)
+        db.flush()
+
+        # Candidate and job completion commit together
+        job.candidate_id = candidate.id
+        job.parsing_method = parsing_method
+        job.status = "completed"
+        job.stage = "done"
+        job.error = None
+        job.finished_at = datetime.utcnow()
+        db.commit()
+
+
+# Singleton instance
+_intake_manager = None
+
+def get_intake_manager() -> ResumeIntakeManager:
+    """Get or create singleton ResumeIntakeManager instance"""
+    global _intake_manager
+    if _intake_manager is None:
+        settings = get_settings()
+        _intake_manager = ResumeIntakeManager(
+            upload_dir=settings.upload_dir,
+            max_workers=settings.intake_max_workers,
+            poll_interval=settings.intake_poll_interval,
+            max_attempts=settings.intake_max_attempts
+        )
+    return _intake_manager
@@ -1,8 +1,14 @@
 import PyPDF2
 import docx
 import io
+import multiprocessing
+import os
 import re
-from typing import Dict, Any, List
+import threading
+import time
+from typing import Dict, Any, List, Iterator, Optional, Tuple
+
+from app.services.skill_matcher import get_skill_matcher
 
 def parse_resume(file_content: bytes, filename: str) -> Dict[str, Any]:
     """
@@ -19,31 +25,109 @@ def parse_resume(file_content: bytes, filename: str) -> Dict[str, Any]:
     else:
         raise ValueError("Unsupported file format")
     
-    # Parse structured data from text
-    parsed_data = {
-        "name": extract_name(text),
-        "email": extract_email(text),
-        "phone": extract_phone(text),
-        "location": extract_location(text),
-        "current_company": extract_current_company(text),
-        "experience": extract_experience_years(text),
-        "education": extract_education(text),
-        "skills": extract_skills(text)
-    }
+    return parse_resume_text(text)
+
+def parse_resume_text(text: str) -> Dict[str, Any]:
+    """Extract candidate information from already-extracted resume text"""
+    # Parse structured data from text (precompiled, same results as the extract_* functions)
+    parsed_data = get_field_extractor().extract(text)
+    parsed_data["skills"] = extract_skills(text)
     
     return parsed_data
 
-def extract_text_from_pdf(file_content: bytes) -> str:
-    """Extract text from PDF file"""
+# Budgets for PDF extraction: a resume is a few pages, anything far bigger is
+# a scanned book or a hostile file and only the first pages matter
+PDF_MAX_PAGES = 20
+PDF_MAX_CHARS = 100_000     # Hard cap, the last page is cut to fit
+PDF_ENOUGH_CHARS = 30_000   # Stop at the next page boundary once this much text is in
+PDF_TIME_BUDGET = 10.0      # Seconds; checked between pages
+PAGE_BREAK = "\n\f\n"       # Between pages, so page headers and footers can be told apart later
+
+def _open_pdf(file_content: bytes):
+    """Lazy page list of a PDF (pages are parsed when accessed)"""
     try:
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        pages = PyPDF2.PdfReader(io.BytesIO(file_content), strict=False).pages
+        len(pages)
+        return pages
     except Exception as e:
         raise ValueError(f"Error reading PDF: {str(e)}")
 
+def iter_pdf_pages(pages) -> Iterator[Optional[str]]:
+    """
+    Yield the text of each page as it is extracted (None for a page that fails)
+    Nothing is decoded until the consumer asks for the next page
+    """
+    for index in range(len(pages)):
+        try:
+            yield pages[index].extract_text() or ""
+        except Exception:
+            # One broken page shouldn't lose the rest of the resume
+            yield None
+
+def extract_pdf_text(
+    file_content: bytes,
+    max_pages: int = PDF_MAX_PAGES,
+    max_chars: int = PDF_MAX_CHARS,
+    enough_chars: int = PDF_ENOUGH_CHARS,
+    time_budget: float = PDF_TIME_BUDGET
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Extract PDF text within page, character and time budgets
+    Returns (text, stats); stats["stop_reason"] is "end" when every page was read,
+    otherwise the budget that stopped extraction early
+    """
+    started = time.perf_counter()
+    pages = _open_pdf(file_content)
+    page_count = len(pages)
+    parts: List[str] = []
+    chars = 0
+    pages_read = 0
+    pages_failed = 0
+    stop_reason = "end"
+    
+    for page_text in iter_pdf_pages(pages):
+        pages_read += 1
+        if page_text is None:
+            pages_failed += 1
+        elif chars + len(page_text) > max_chars:
+            parts.append(page_text[:max_chars - chars])
+            chars = max_chars
+            stop_reason = "max_chars"
+            break
+        else:
+            parts.append(page_text)
+            chars += len(page_text) + len(PAGE_BREAK)
+        
+        if pages_read >= page_count:
+            break
+        if chars >= enough_chars:
+            stop_reason = "enough_content"
+        elif pages_read >= max_pages:
+            stop_reason = "max_pages"
+        elif time.perf_counter() - started > time_budget:
+            stop_reason = "time_budget"
+        else:
+            continue
+        break
+    
+    if pages_read and pages_failed == pages_read:
+        raise ValueError("Error reading PDF: no page could be extracted")
+    
+    stats = {
+        "pages_total": page_count,
+        "pages_read": pages_read,
+        "pages_failed": pages_failed,
+        "chars": min(chars, max_chars),
+        "stop_reason": stop_reason,
+        "seconds": round(time.perf_counter() - started, 4)
+    }
+    return PAGE_BREAK.join(parts), stats
+
+def extract_text_from_pdf(file_content: bytes) -> str:
+    """Extract text from PDF file (default budgets)"""
+    text, _ = extract_pdf_text(file_content)
+    return text
+
 def extract_text_from_docx(file_content: bytes) -> str:
     """Extract text from DOCX file"""
     try:
@@ -53,6 +137,230 @@ def extract_text_from_docx(file_content: bytes) -> str:
     except Exception as e:
         raise ValueError(f"Error reading DOCX: {str(e)}")
 
+def extract_document_text(file_content: bytes, filename: str, pdf_limits: Optional[Dict[str, Any]] = None) -> Tuple[str, Dict[str, Any]]:
+    """Extract text from a PDF/DOCX upload; returns (text, stats)"""
+    started = time.perf_counter()
+    if filename.lower().endswith('.pdf'):
+        return extract_pdf_text(file_content, **(pdf_limits or {}))
+    if filename.lower().endswith(('.docx', '.doc')):
+        text = extract_text_from_docx(file_content)
+        return text, {"chars": len(text), "stop_reason": "end", "seconds": round(time.perf_counter() - started, 4)}
+    raise ValueError("Unsupported file format")
+
+# ==================== EXTRACTION SERVICE ====================
+
+def _extraction_worker_main(conn, memory_limit_mb: int):
+    """Worker process loop: receive (content, filename, pdf_limits), send back the result"""
+    if memory_limit_mb:
+        try:
+            import resource
+            limit = memory_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError):
+            # No rlimits on this platform: only the wall-clock timeout applies
+            pass
+    # Imports are done: document timeouts start from here
+    conn.send(("ready",))
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+        if job is None:
+            return
+        file_content, filename, pdf_limits = job
+        try:
+            conn.send(("ok",) + extract_document_text(file_content, filename, pdf_limits))
+        except MemoryError:
+            conn.send(("memory", "Resume is too large to extract"))
+        except Exception as e:
+            conn.send(("error", str(e) or e.__class__.__name__))
+
+class _ExtractionWorker:
+    # Interpreter start-up and imports, not counted against a document's timeout
+    STARTUP_TIMEOUT = 30.0
+
+    def __init__(self, context, memory_limit_mb: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_extraction_worker_main,
+            args=(child_conn, memory_limit_mb),
+            name="resume-extractor",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+        try:
+            started = self.conn.poll(self.STARTUP_TIMEOUT) and self.conn.recv() == ("ready",)
+        except (EOFError, OSError):
+            started = False
+        if not started:
+            self.stop(kill=True)
+            raise ValueError("Resume extraction failed: worker process did not start")
+
+    def stop(self, kill: bool = False):
+        if not kill and self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except OSError:
+                kill = True
+        if kill and self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=1)
+        self.conn.close()
+
+class DocumentExtractor:
+    """
+    Runs PDF/DOCX text extraction in a pool of worker processes
+
+    Extraction is pure Python and holds the GIL, so in threads a burst of
+    uploads runs one document at a time; separate processes use every core.
+    Each document gets a wall-clock `timeout`: a worker that overruns it is
+    killed and replaced, and the caller gets a ValueError like for any other
+    unreadable file. Workers run under an address-space limit of
+    `memory_limit_mb` (Linux/macOS, 0 = none), so a hostile file fails with
+    MemoryError instead of swapping the host, and are recycled after
+    `max_jobs_per_worker` documents to bound slow leaks.
+
+    Workers start on first use. `processes=0` extracts in the calling thread
+    (no isolation, no timeout).
+    """
+
+    def __init__(
+        self,
+        processes: int,
+        timeout: float = 30.0,
+        memory_limit_mb: int = 1024,
+        max_jobs_per_worker: int = 200,
+        pdf_limits: Optional[Dict[str, Any]] = None,
+        start_method: str = "spawn"
+    ):
+        self.processes = max(0, processes)
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.pdf_limits = pdf_limits or {}
+        self._context = multiprocessing.get_context(start_method)
+        self._slots = threading.BoundedSemaphore(self.processes or 1)
+        self._idle: List[_ExtractionWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._counts = {"started": 0, "recycled": 0, "completed": 0, "failed": 0, "timeouts": 0, "killed": 0}
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counts[name] += 1
+
+    def _checkout(self) -> _ExtractionWorker:
+        with self._lock:
+            if self._closed:
+                raise ValueError("Resume extraction is shutting down")
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.is_alive():
+                    return worker
+                worker.stop(kill=True)
+            self._counts["started"] += 1
+        return _ExtractionWorker(self._context, self.memory_limit_mb)
+
+    def _checkin(self, worker: _ExtractionWorker):
+        with self._lock:
+            if not self._closed and worker.jobs < self.max_jobs_per_worker:
+                self._idle.append(worker)
+                return
+            self._counts["recycled"] += 1
+        worker.stop()
+
+    def extract(self, file_content: bytes, filename: str) -> Tuple[str, Dict[str, Any]]:
+        """Extract text in a worker process; raises ValueError on failure or timeout"""
+        if not self.processes:
+            return extract_document_text(file_content, filename, self.pdf_limits)
+
+        with self._slots:
+            worker = self._checkout()
+            try:
+                worker.conn.send((file_content, filename, self.pdf_limits))
+                ready = worker.conn.poll(self.timeout)
+                reply = worker.conn.recv() if ready else None
+            except (EOFError, OSError):
+                # Worker died mid-document (crash, or killed by the memory limit)
+                self._count("failed")
+                self._count("killed")
+                worker.stop(kill=True)
+                raise ValueError("Resume extraction failed: worker process exited")
+            except BaseException:
+                worker.stop(kill=True)
+                raise
+
+            if reply is None:
+                self._count("timeouts")
+                self._count("killed")
+                worker.stop(kill=True)
+                raise ValueError(f"Resume extraction timed out after {self.timeout:g}s")
+
+            worker.jobs += 1
+            if reply[0] == "ok":
+                self._count("completed")
+                self._checkin(worker)
+                return reply[1], reply[2]
+
+            self._count("failed")
+            if reply[0] == "memory":
+                # Heap may be fragmented or half-freed: start from a clean process
+                self._count("killed")
+                worker.stop(kill=True)
+            else:
+                self._checkin(worker)
+            raise ValueError(reply[1])
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "processes": self.processes,
+                "idle": len(self._idle),
+                "timeout": self.timeout,
+                "memory_limit_mb": self.memory_limit_mb,
+                **self._counts
+            }
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+# Singleton instance
+_document_extractor: Optional[DocumentExtractor] = None
+_document_extractor_lock = threading.Lock()
+
+def get_document_extractor() -> DocumentExtractor:
+    global _document_extractor
+    if _document_extractor is None:
+        with _document_extractor_lock:
+            if _document_extractor is None:
+                from app.database import get_settings
+                settings = get_settings()
+                processes = settings.extraction_processes or os.cpu_count() or 1
+                _document_extractor = DocumentExtractor(
+                    processes=processes if settings.extraction_process_pool else 0,
+                    timeout=settings.extraction_timeout,
+                    memory_limit_mb=settings.extraction_memory_limit_mb,
+                    max_jobs_per_worker=settings.extraction_max_jobs_per_worker,
+                    pdf_limits={
+                        "max_pages": settings.pdf_max_pages,
+                        "max_chars": settings.pdf_max_chars,
+                        "enough_chars": settings.pdf_enough_chars,
+                        "time_budget": settings.pdf_time_budget
+                    }
+                )
+    return _document_extractor
+
+def shutdown_document_extractor():
+    if _document_extractor is not None:
+        _document_extractor.shutdown()
+
 def extract_name(text: str) -> str:
     """Extract candidate name (usually at the top of resume)"""
     lines = text.strip().split('\n')
@@ -146,22 +454,140 @@ def extract_education(text: str) -> str:
     return None
 
 def extract_skills(text: str) -> List[str]:
-    """Extract skills from resume"""
-    # Common technical skills to look for
-    common_skills = [
-        'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js', 'django', 'flask',
-        'sql', 'mongodb', 'postgresql', 'mysql', 'aws', 'azure', 'gcp', 'docker', 'kubernetes',
-        'machine learning', 'deep learning', 'ai', 'data science', 'tensorflow', 'pytorch',
-        'html', 'css', 'typescript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin',
-        'git', 'agile', 'scrum', 'rest api', 'graphql', 'microservices'
-    ]
-    
-    text_lower = text.lower()
-    found_skills = []
-    
-    for skill in common_skills:
-        if skill in text_lower:
-            found_skills.append(skill.title())
-    
-    # Remove duplicates and return
-    return list(set(found_skills))[:15]  # Limit to 15 skills
+    """Extract skills from resume (canonical taxonomy names, most mentioned first)"""
+    return get_skill_matcher().extract(text, limit=15)  # Limit to 15 skills
+
+# ==================== FIELD EXTRACTOR ====================
+
+# Same patterns as the extract_* functions above, compiled once
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'[\+\(]?[1-9][0-9 .\-\(\)]{8,}[0-9]')
+_NAME_DIGITS = re.compile(r'\d{3,}')
+_LOCATION_KEYWORDS = ['location:', 'address:', 'city:', 'based in']
+_LOCATION_PATTERNS = [re.compile(rf'{keyword}\s*([A-Za-z\s,]+)', re.IGNORECASE) for keyword in _LOCATION_KEYWORDS]
+_COMPANY_PATTERNS = [
+    re.compile(r'(?:currently|presently)\s+(?:at|with)\s+([A-Z][A-Za-z\s&]+)', re.IGNORECASE),
+    re.compile(r'(?:working|employed)\s+at\s+([A-Z][A-Za-z\s&]+)', re.IGNORECASE)
+]
+_EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience', re.IGNORECASE),
+    re.compile(r'experience[:\s]+(\d+)\+?\s*years?', re.IGNORECASE)
+]
+_DATE_RANGE = re.compile(r'20\d{2}\s*[-–]\s*(?:20\d{2}|present|current)', re.IGNORECASE)
+_EDUCATION_KEYWORDS = ['bachelor', 'master', 'phd', 'mba', 'b.tech', 'm.tech', 'b.e', 'm.e', 'bsc', 'msc']
+_CITY_NAMES = ['bangalore', 'mumbai', 'delhi', 'hyderabad', 'pune', 'chennai']
+_COMPANY_KEYWORDS = [('currently', 'presently'), ('working', 'employed')]
+
+def _first(low: str, words, end: Optional[int] = None) -> int:
+    """Earliest position of any of `words` in `low`, -1 if none"""
+    positions = [p for p in (low.find(word, 0, end) for word in words) if p >= 0]
+    return min(positions) if positions else -1
+
+def _line_at(text: str, position: int) -> str:
+    """The line of `text` that contains `position`"""
+    end = text.find('\n', position)
+    return text[text.rfind('\n', 0, position) + 1:end if end >= 0 else len(text)]
+
+class ResumeFieldExtractor:
+    """
+    Regex resume fields from precompiled patterns and one lowercase copy
+
+    Gives the same results as the extract_* functions, which compile
+    patterns per call, lowercase and split the text again per field and run
+    each pattern over the whole text. Here the text is lowercased once and
+    keywords are located with plain substring search; a field's full
+    pattern then only runs from where its keyword first occurs (a pattern
+    can't match before its keyword does). Email and phone are single
+    searches that stop at the first hit, and only the first lines are split
+    for the name. The object holds no per-call state and can be shared
+    between threads.
+    """
+
+    def extract(self, text: str) -> Dict[str, Any]:
+        low = text.lower()
+        if len(low) != len(text) or 'ı' in text or 'ſ' in text:
+            # Some non-ASCII characters change length when lowercased (so
+            # positions in `low` wouldn't match `text`), and "ı"/"ſ" match
+            # "i"/"s" in IGNORECASE patterns but don't lowercase to them: use
+            # the plain functions
+            return {
+                "name": extract_name(text),
+                "email": extract_email(text),
+                "phone": extract_phone(text),
+                "location": extract_location(text),
+                "current_company": extract_current_company(text),
+                "experience": extract_experience_years(text),
+                "education": extract_education(text)
+            }
+
+        email = EMAIL_PATTERN.search(text) if '@' in text else None
+        phone = PHONE_PATTERN.search(text)
+        education = _first(low, _EDUCATION_KEYWORDS)
+        return {
+            "name": self._name(text),
+            "email": email.group(0) if email else "",
+            "phone": phone.group(0).strip() if phone else None,
+            "location": self._location(text, low),
+            "current_company": self._company(text, low),
+            "experience": self._experience(text, low),
+            "education": _line_at(low, education).strip() if education >= 0 else None
+        }
+
+    def _name(self, text: str) -> str:
+        for line in text.strip().split('\n', 5)[:5]:
+            line = line.strip()
+            if line and len(line.split()) <= 4 and len(line) > 5:
+                if '@' not in line and not _NAME_DIGITS.search(line):
+                    return line
+        return "Unknown"
+
+    def _location(self, text: str, low: str) -> Optional[str]:
+        for keyword, pattern in zip(_LOCATION_KEYWORDS, _LOCATION_PATTERNS):
+            start = low.find(keyword)
+            if start >= 0:
+                found = pattern.search(text, start)
+                if found:
+                    return found.group(1).strip()
+        # Fallback: a line naming a city within the first 10 lines
+        end = -1
+        for _ in range(10):
+            end = text.find('\n', end + 1)
+            if end < 0:
+                end = len(text)
+                break
+        city = _first(low, _CITY_NAMES, end)
+        return _line_at(text, city).strip() if city >= 0 else None
+
+    def _company(self, text: str, low: str) -> Optional[str]:
+        for keywords, pattern in zip(_COMPANY_KEYWORDS, _COMPANY_PATTERNS):
+            start = _first(low, keywords)
+            if start >= 0:
+                found = pattern.search(text, start)
+                if found:
+                    return found.group(1).strip()
+        return None
+
+    def _experience(self, text: str, low: str) -> Optional[int]:
+        keyword = low.find('experience')
+        year = low.find('year')
+        if keyword >= 0 and year >= 0:
+            # "5+ years of experience": the earliest match starts at the number
+            # just before the first "year" (only "+" and spaces in between)
+            start = year
+            while start > 0 and (text[start - 1] == '+' or text[start - 1].isspace()):
+                start -= 1
+            while start > 0 and text[start - 1].isdecimal():
+                start -= 1
+            found = _EXPERIENCE_PATTERNS[0].search(text, start) or _EXPERIENCE_PATTERNS[1].search(text, keyword)
+            if found:
+                return int(found.group(1))
+        matches = _DATE_RANGE.findall(text)
+        if matches:
+            return len(matches)  # Rough estimate
+        return None
+
+# Singleton instance
+_field_extractor = ResumeFieldExtractor()
+
+def get_field_extractor() -> ResumeFieldExtractor:
+    return _field_extractor
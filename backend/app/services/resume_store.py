@@ -0,0 +1,95 @@
+"""
+Stored resume text
+The extracted text of every candidate's resume is kept compressed next to
+the candidate, with section offsets computed once at ingest, so re-scoring,
+search and re-parsing never need the original file again
+"""
+
+from typing import Dict, List, Optional, Tuple
+import re
+import zlib
+
+from app.models import CandidateResume
+
+# Heading line -> section name. Text before the first heading is "contact".
+SECTION_HEADINGS = {
+    "summary": ["summary", "professional summary", "profile", "about", "about me", "objective", "career objective"],
+    "experience": [
+        "experience", "work experience", "professional experience", "employment", "employment history",
+        "work history", "career history", "internships", "internship"
+    ],
+    "education": ["education", "academic background", "academics", "qualifications", "educational qualifications"],
+    "skills": ["skills", "technical skills", "key skills", "core competencies", "technologies", "tech stack", "tools"],
+    "projects": ["projects", "personal projects", "academic projects", "key projects"],
+    "certifications": ["certifications", "certificates", "courses", "licenses and certifications"],
+    "interests": ["interests", "hobbies", "hobbies and interests", "extracurricular activities"],
+    "references": ["references", "referees"],
+    "declaration": ["declaration"],
+}
+
+_HEADINGS = {heading: name for name, headings in SECTION_HEADINGS.items() for heading in headings}
+_HEADING_LINE = re.compile(r"^[ \t#*•\-]*([A-Za-z][A-Za-z &/]{1,40}?)[ \t]*:?[ \t]*$", re.MULTILINE)
+
+COMPRESSION_LEVEL = 6
+
+
+def compress_text(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"), COMPRESSION_LEVEL)
+
+
+def decompress_text(data: bytes) -> str:
+    return zlib.decompress(data).decode("utf-8")
+
+
+def split_sections(text: str) -> List[Tuple[str, int, int]]:
+    """
+    (section name, start, end) for every section of `text`, in text order
+
+    A section starts at a line that holds nothing but a known heading
+    ("Work Experience", "SKILLS:") and runs to the next heading. Text before
+    the first heading is "contact".
+    """
+    starts = []
+    for found in _HEADING_LINE.finditer(text):
+        name = _HEADINGS.get(" ".join(found.group(1).lower().replace("&", "and").split()))
+        if name:
+            starts.append((found.start(), name))
+
+    spans = []
+    first = starts[0][0] if starts else len(text)
+    if text[:first].strip():
+        spans.append(("contact", 0, first))
+    for i, (start, name) in enumerate(starts):
+        end = starts[i + 1][0] if i + 1 < len(starts) else len(text)
+        spans.append((name, start, end))
+    return spans
+
+
+def segment_sections(text: str) -> Dict[str, List[int]]:
+    """Section name -> [start, end) offsets; if a heading repeats, the first occurrence is kept"""
+    sections: Dict[str, List[int]] = {}
+    for name, start, end in split_sections(text):
+        sections.setdefault(name, [start, end])
+    return sections
+
+
+def build_stored_resume(text: str, filename: Optional[str] = None, content_hash: Optional[str] = None) -> CandidateResume:
+    """Compressed text plus section index, ready to attach to a candidate"""
+    compressed = compress_text(text)
+    return CandidateResume(
+        content_hash=content_hash,
+        filename=filename,
+        text_compressed=compressed,
+        text_chars=len(text),
+        compressed_bytes=len(compressed),
+        sections=segment_sections(text)
+    )
+
+
+def resume_text(stored: CandidateResume, section: Optional[str] = None) -> Optional[str]:
+    """Full stored text, or one section of it (None if the resume has no such section)"""
+    text = decompress_text(stored.text_compressed)
+    if section is None:
+        return text
+    span = (stored.sections or {}).get(section)
+    return text[span[0]:span[1]] if span else None
@@ -0,0 +1,92 @@
+"""
+ATS score memoization
+Identical profiles scored against unchanged requirements never touch the LLM
+"""
+
+from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import copy
+import hashlib
+import re
+import threading
+
+
+def _normalize_text(value: Any) -> str:
+    return re.sub(r"\s+", " ", str(value or "")).strip().lower()
+
+
+def _normalize_skills(value: Any) -> str:
+    items = value if isinstance(value, list) else str(value or "").split(",")
+    return ",".join(sorted({_normalize_text(item) for item in items if _normalize_text(item)}))
+
+
+class ScoreCache:
+    """
+    In-memory LRU cache of ATS results
+
+    Keys are a fingerprint of the normalized candidate profile (skills,
+    experience, education), the normalized job requirements text and the
+    model id. Entries are grouped by requirements fingerprint so everything
+    scored against an old requirements text can be dropped at once.
+    """
+
+    def __init__(self, max_entries: int = 5000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def fingerprint_requirements(job_requirements: str) -> str:
+        return hashlib.sha256(_normalize_text(job_requirements).encode("utf-8")).hexdigest()
+
+    def key_for(self, candidate_data: Dict[str, Any], job_requirements: str, model: str) -> Tuple[str, str]:
+        """Return (cache_key, requirements_fingerprint)"""
+        requirements_fp = self.fingerprint_requirements(job_requirements)
+        profile = "\x1f".join([
+            _normalize_skills(candidate_data.get("skills")),
+            _normalize_text(candidate_data.get("experience")),
+            _normalize_text(candidate_data.get("education")),
+        ])
+        key = hashlib.sha256(f"{model}\x1e{requirements_fp}\x1e{profile}".encode("utf-8")).hexdigest()
+        return key, requirements_fp
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return copy.deepcopy(entry[1])
+
+    def put(self, key: str, requirements_fp: str, result: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = (requirements_fp, copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_requirements(self, job_requirements: str) -> int:
+        """Drop every result scored against this requirements text"""
+        requirements_fp = self.fingerprint_requirements(job_requirements)
+        with self._lock:
+            stale = [key for key, (fp, _) in self._entries.items() if fp == requirements_fp]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+            return len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0
+            }
@@ -0,0 +1,131 @@
+"""
+Skill matcher
+Finds taxonomy skills (canonical names plus aliases) in resume and
+requirement text with one compiled pattern and a single pass over the text
+"""
+
+from typing import Dict, Any, Optional, List, Iterable
+import json
+import os
+import re
+import threading
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "skills_taxonomy.json")
+
+# A skill starts where the previous character can't be part of a token
+# ("git" not in "digital", "js" not in "node.js") and ends before the next word
+# character or a token suffix ("c" not in "c++", "node" not in "node.js", but
+# "python." at the end of a sentence still counts). "/" and "-" separate skills
+# ("Python/Django", "React-Redux"); compound tokens that contain them ("ci/cd",
+# "pl/sql", "react-native") are listed as aliases, and the longest alias wins.
+_LEFT = r"(?<![\w+#.])"
+_RIGHT = r"(?![\w+#])(?!\.\w)"
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """
+    Alternation factored on shared prefixes ("java|javascript" becomes
+    "java(?:script)?"), so the regex engine doesn't retry every alias at each
+    position; longer alternatives are tried first
+    """
+    trie: Dict[str, Any] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: Dict[str, Any]) -> str:
+        end = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if end:
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class SkillMatcher:
+    """
+    Matches a skills taxonomy against free text
+
+    `taxonomy` maps each canonical skill name to its aliases. Matching is
+    case-insensitive on normalized whitespace, and every alias counts towards
+    its canonical name. Words in `ignore` are never matched on their own, for
+    names that are also common words ("Go", "Spring"); such skills are found
+    through their longer aliases ("golang", "spring boot") instead.
+    The aliases are compiled once into a single regex; the matcher is
+    immutable afterwards and safe to share between threads.
+    """
+
+    def __init__(self, taxonomy: Dict[str, List[str]], ignore: Iterable[str] = ()):
+        ignored = {_normalize(word) for word in ignore}
+        self._canonical: Dict[str, str] = {}
+        for name, aliases in taxonomy.items():
+            for alias in [name, *aliases]:
+                key = _normalize(alias)
+                if key and key not in ignored:
+                    # First definition wins if two skills share an alias
+                    self._canonical.setdefault(key, name)
+        self.skill_count = len(taxonomy)
+        self._pattern = re.compile(_LEFT + "(" + _trie_pattern(self._canonical) + ")" + _RIGHT) if self._canonical else None
+
+    @classmethod
+    def from_file(cls, path: str) -> "SkillMatcher":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if "skills" not in data:
+            # Bare {name: [aliases]} mapping
+            return cls(data)
+        return cls(data["skills"], data.get("ignore", ()))
+
+    def match(self, text: Optional[str]) -> Dict[str, int]:
+        """Canonical skill -> number of mentions, in order of first mention"""
+        counts: Dict[str, int] = {}
+        if not text or self._pattern is None:
+            return counts
+        for found in self._pattern.finditer(_normalize(text)):
+            name = self._canonical[found.group(1)]
+            counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    def extract(self, text: Optional[str], limit: Optional[int] = None) -> List[str]:
+        """Canonical skills, most mentioned first (ties keep text order)"""
+        counts = self.match(text)
+        ranked = sorted(counts, key=lambda name: -counts[name])
+        return ranked[:limit] if limit is not None else ranked
+
+    def match_batch(self, texts: Iterable[Optional[str]]) -> List[Dict[str, int]]:
+        return [self.match(text) for text in texts]
+
+    def overlap(self, text: Optional[str], required: Optional[str]) -> Dict[str, List[str]]:
+        """Skills named in `required` that `text` does / doesn't mention"""
+        have = self.match(text)
+        wanted = list(self.match(required))
+        return {
+            "matched": [name for name in wanted if name in have],
+            "missing": [name for name in wanted if name not in have]
+        }
+
+
+# Singleton instance
+_skill_matcher: Optional[SkillMatcher] = None
+_skill_matcher_lock = threading.Lock()
+
+
+def get_skill_matcher() -> SkillMatcher:
+    global _skill_matcher
+    if _skill_matcher is None:
+        with _skill_matcher_lock:
+            if _skill_matcher is None:
+                from app.database import get_settings
+                settings = get_settings()
+                _skill_matcher = SkillMatcher.from_file(settings.skills_taxonomy_path or DEFAULT_TAXONOMY_PATH)
+    return _skill_matcher
@@ -0,0 +1,29 @@
+"""
+Test setup: the app reads its settings at import time, so point it at a
+throwaway SQLite database and upload directory before anything imports it
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+_TMP = tempfile.mkdtemp(prefix="candidly-tests-")
+
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{os.path.join(_TMP, 'test.db')}",
+    "UPLOAD_DIR": os.path.join(_TMP, "uploads"),
+    "OLLAMA_BASE_URL": "http://127.0.0.1:9",  # Nothing listens here: no test talks to a model
+    "OLLAMA_WARMUP_ENABLED": "false",
+    "EXTRACTION_PROCESS_POOL": "false",
+    "LLM_RECORD_MODE": "off",
+})
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database_tables():
+    """Create the tables (app.main does it on import) so any test file can run on its own"""
+    import app.main  # noqa: F401
@@ -0,0 +1,77 @@
+"""
+Bulk import of several zips into one recruitment, and eviction of finished jobs
+"""
+
+from datetime import datetime, timedelta
+import io
+import time
+import zipfile
+
+from app.database import SessionLocal
+from app.models import Candidate, Recruitment
+from app.services import bulk_import
+from app.services.bulk_import import BulkImportManager
+
+
+class StubAIService:
+    """Sync AIService surface used by the import pipeline; the parsed name is the file's content"""
+
+    def parse_resume_document(self, file_content, filename, priority=None):
+        text = file_content.decode()
+        return {"name": text, "email": "bulk@example.com"}, "ollama", {"text": text, "content_hash": None}
+
+    def calculate_ats_score(self, candidate_data, job_requirements, priority=None):
+        return {"ats_score": 50, "strengths": [], "gaps": [], "reasoning": "stub"}
+
+
+def _zip(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+def test_zips_with_the_same_layout_keep_every_document(tmp_path, monkeypatch):
+    monkeypatch.setattr(bulk_import, "get_ai_service", lambda: StubAIService())
+    db = SessionLocal()
+    try:
+        recruitment = Recruitment(
+            title="Data Engineer", department="Data", location="Remote",
+            requirements="SQL", interview_code=f"BLK{time.monotonic_ns() % 10**6:06d}"
+        )
+        db.add(recruitment)
+        db.commit()
+        manager = BulkImportManager(upload_dir=str(tmp_path), max_workers=2, batch_size=2)
+        job = manager.create(recruitment.id)
+        # Same member names in both archives, different people
+        manager.store_upload(job, 0, "team-a.zip", _zip({"cvs/one.pdf": "Alice", "cvs/two.pdf": "Bob"}))
+        manager.store_upload(job, 1, "team-b.zip", _zip({"cvs/one.pdf": "Carol", "cvs/two.pdf": "Dan"}))
+
+        manager._run(job)
+
+        assert (job.status, job.imported, job.failed, job.skipped) == ("completed", 4, 0, 0)
+        candidates = db.query(Candidate).filter(Candidate.recruitment_id == recruitment.id).all()
+        assert sorted(c.name for c in candidates) == ["Alice", "Bob", "Carol", "Dan"]
+        assert len({c.resume_url for c in candidates}) == 4
+        for candidate in candidates:
+            with open(candidate.resume_url) as f:
+                assert f.read() == candidate.name
+    finally:
+        db.close()
+
+
+def test_finished_jobs_are_evicted(tmp_path):
+    manager = BulkImportManager(upload_dir=str(tmp_path), job_ttl=60, max_finished_jobs=1)
+    jobs = [manager.create(recruitment_id=1) for _ in range(4)]
+    running, expired, older, newest = jobs
+    running.status = "running"
+    for job, seconds_ago in ((expired, 120), (older, 30), (newest, 10)):
+        job.status = "completed"
+        job.finished_at = datetime.utcnow() - timedelta(seconds=seconds_ago)
+
+    assert manager.get(expired.id) is None
+    assert manager.get(older.id) is None
+    assert manager.get(newest.id) is newest
+    assert manager.get(running.id) is running
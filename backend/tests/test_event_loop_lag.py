@@ -0,0 +1,107 @@
+"""
+Regression test: async endpoints must keep blocking work off the event loop
+
+Drives resume upload and interview chat concurrently against the ASGI app
+with a stubbed AIService and a deliberately slow database, while an
+EventLoopMonitor samples the loop. Any DB query or file write done on the
+loop itself shows up as lag of at least SLOW_QUERY_SECONDS.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+from app.database import SessionLocal, engine
+from app.main import app
+from app.models import Candidate, Recruitment
+from app.routers import interview
+from app.services.loop_monitor import EventLoopMonitor
+
+SLOW_QUERY_SECONDS = 0.05
+LAG_THRESHOLD = 0.03
+CONCURRENCY = 8
+PDF = b"%PDF-1.4 stub"
+
+
+class StubAIService:
+    """Async AIService surface used by the chat endpoint, no provider calls"""
+
+    async def achat(self, message, system_prompt, conversation_history=None, **kwargs):
+        await asyncio.sleep(0.01)
+        return "Tell me about a recent project."
+
+
+@pytest.fixture
+def slow_database():
+    """Every SQL statement blocks its thread, like a loaded database server"""
+    def sleep(*args):
+        time.sleep(SLOW_QUERY_SECONDS)
+
+    event.listen(engine, "before_cursor_execute", sleep)
+    try:
+        yield
+    finally:
+        event.remove(engine, "before_cursor_execute", sleep)
+
+
+@pytest.fixture
+def recruitment():
+    db = SessionLocal()
+    try:
+        row = Recruitment(
+            title="Backend Engineer", department="Engineering", location="Remote",
+            requirements="Python and SQL", interview_code=f"LAG{time.monotonic_ns() % 10**6:06d}"
+        )
+        db.add(row)
+        db.commit()
+        candidates = []
+        for i in range(CONCURRENCY):
+            candidate = Candidate(
+                recruitment_id=row.id, name=f"Chat Candidate {i}", email=f"chat{i}@example.com",
+                session_token=f"lag-session-{row.id}-{i}", interview_question_index=0
+            )
+            db.add(candidate)
+            candidates.append(candidate)
+        db.commit()
+        yield row.interview_code, [c.session_token for c in candidates]
+    finally:
+        db.close()
+
+
+def test_upload_and_chat_do_not_block_event_loop(monkeypatch, slow_database, recruitment):
+    interview_code, session_tokens = recruitment
+    monkeypatch.setattr(interview, "get_ai_service", lambda: StubAIService())
+
+    def upload(client, i):
+        return client.post(
+            "/api/interview/upload-resume",
+            params={"interview_code": interview_code},
+            files={"resume": (f"resume{i}.pdf", PDF, "application/pdf")}
+        )
+
+    def chat(client, token):
+        return client.post("/api/interview/chat", json={"session_token": token, "message": "Hello"})
+
+    async def drive():
+        monitor = EventLoopMonitor(interval=0.005, stall_threshold=LAG_THRESHOLD)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            # Warm-up: first requests pay one-off lazy imports on the loop thread
+            await upload(client, "warmup")
+            await chat(client, session_tokens[0])
+            monitor.start()
+            responses = await asyncio.gather(
+                *(upload(client, i) for i in range(CONCURRENCY)),
+                *(chat(client, token) for token in session_tokens)
+            )
+            await monitor.stop()
+        return responses, monitor.snapshot()
+
+    responses, lag = asyncio.run(drive())
+
+    # Uploads are queued (202); parsing runs on the intake workers, not in the request
+    assert [r.status_code for r in responses] == [202] * CONCURRENCY + [200] * CONCURRENCY, [r.text for r in responses]
+    assert lag["lag_seconds_max"] < LAG_THRESHOLD, lag
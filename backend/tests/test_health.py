@@ -0,0 +1,48 @@
+"""
+/health is a liveness check; /ready waits for the model warm-up pass
+"""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.ai_service import get_ai_service
+from app.services.llm_recording import build_ollama_transport
+from app.services.model_warmup import OllamaWarmup
+
+
+def test_health_is_200_while_warming_up_and_ready_is_503(monkeypatch):
+    monkeypatch.setattr(get_ai_service()._warmup, "_ready", False)
+    client = TestClient(app)
+
+    health = client.get("/health")
+    assert health.status_code == 200
+    assert health.json()["ready"] is False
+    assert client.get("/ready").status_code == 503
+
+    monkeypatch.setattr(get_ai_service()._warmup, "_ready", True)
+    assert client.get("/ready").status_code == 200
+
+
+def test_warmup_becomes_ready_when_ollama_is_unreachable():
+    # Nothing listens on port 9; the load timeout is never reached
+    transport = build_ollama_transport("http://127.0.0.1:9")
+    warmup = OllamaWarmup(transport, ["phi3", "llama3"], timeout=300.0, probe_timeout=1.0)
+
+    async def run():
+        warmup.start()
+        for _ in range(100):
+            if warmup.ready:
+                break
+            await asyncio.sleep(0.05)
+        await warmup.stop()
+        await transport.aclose()
+
+    asyncio.run(run())
+    assert warmup.ready
+    assert {m["status"] for m in warmup.snapshot()["models"].values()} == {"failed"}
+
+
+def test_warmup_without_models_is_ready():
+    assert OllamaWarmup(build_ollama_transport("http://127.0.0.1:9"), []).ready
@@ -0,0 +1,74 @@
+"""
+Startup schema upgrade: a database created before a column was added keeps working
+"""
+
+from sqlalchemy import Column, MetaData, Table, create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.migrations import ADDED_COLUMNS, add_missing_columns
+from app.models import Candidate, Recruitment
+
+
+def _legacy_engine(tmp_path):
+    """SQLite database whose candidates table predates every ADDED_COLUMNS entry"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    added = {column for table, column in ADDED_COLUMNS if table == "candidates"}
+    legacy = MetaData()
+    Table("candidates", legacy, *(
+        Column(c.name, c.type, primary_key=c.primary_key)
+        for c in Base.metadata.tables["candidates"].columns if c.name not in added
+    ))
+    legacy.create_all(engine)
+    Base.metadata.create_all(engine)  # Every other table, as app startup would
+    return engine
+
+
+def test_missing_columns_are_added_once(tmp_path):
+    engine = _legacy_engine(tmp_path)
+
+    assert add_missing_columns(engine, Base.metadata) == [f"{t}.{c}" for t, c in ADDED_COLUMNS]
+    assert add_missing_columns(engine, Base.metadata) == []
+    columns = {c["name"] for c in inspect(engine).get_columns("candidates")}
+    assert {c.name for c in Base.metadata.tables["candidates"].columns} <= columns
+
+
+def test_candidates_load_after_upgrade(tmp_path):
+    engine = _legacy_engine(tmp_path)
+    add_missing_columns(engine, Base.metadata)
+    db = sessionmaker(bind=engine)()
+    try:
+        recruitment = Recruitment(
+            title="Engineer", department="Engineering", location="Remote",
+            requirements="Python", interview_code="MIG001"
+        )
+        db.add(recruitment)
+        db.commit()
+        db.add(Candidate(recruitment_id=recruitment.id, name="Ada", email="ada@example.com",
+                         interview_strengths=["clear"], interview_improvements=["depth"]))
+        db.commit()
+
+        candidate = db.query(Candidate).one()
+        assert candidate.interview_strengths == ["clear"]
+        assert candidate.interview_improvements == ["depth"]
+    finally:
+        db.close()
+
+
+def test_evaluation_columns_get_index_and_default(tmp_path):
+    engine = _legacy_engine(tmp_path)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO candidates (id, recruitment_id, name, email) VALUES (1, 1, 'Old Row', 'old@example.com')"
+        )
+    add_missing_columns(engine, Base.metadata)
+
+    indexed = {tuple(index["column_names"]) for index in inspect(engine).get_indexes("candidates")}
+    assert ("evaluation_status",) in indexed
+    db = sessionmaker(bind=engine)()
+    try:
+        # The startup requeue query must run against an upgraded database
+        assert db.query(Candidate).filter(Candidate.evaluation_status.in_(["pending", "running"])).all() == []
+        assert db.get(Candidate, 1).evaluation_attempts == 0
+    finally:
+        db.close()
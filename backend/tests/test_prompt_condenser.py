@@ -0,0 +1,55 @@
+"""
+Resume condensation: page headers and footers go, repeated content stays
+"""
+
+from app.services.prompt_condenser import ResumeCondenser
+from app.services.resume_parser import PAGE_BREAK
+
+PAGE_ONE = """Jane Doe | jane@example.com
+Senior Engineer
+
+Experience
+Software Engineer
+Acme Corp, 2019-2021
+- Built data pipelines
+Software Engineer
+Globex, 2017-2019
+- Built data pipelines
+Jane Doe - Resume
+Page 1 of 2"""
+
+PAGE_TWO = """Jane Doe | jane@example.com
+Skills
+Python, SQL
+Education
+BSc Computer Science
+Jane Doe - Resume
+Page 2 of 2"""
+
+
+def _condense(text):
+    return ResumeCondenser(token_budget=10_000).condense(text)
+
+
+def test_page_headers_and_footers_are_dropped_once_repeated():
+    condensed, stats = _condense(PAGE_ONE + PAGE_BREAK + PAGE_TWO)
+
+    assert condensed.count("Jane Doe | jane@example.com") == 1
+    assert condensed.count("Jane Doe - Resume") == 1
+    assert "Page" not in condensed
+    assert stats["repeated_lines"] == 2
+    assert "Python, SQL" in condensed
+
+
+def test_repeated_body_lines_are_kept():
+    condensed, _ = _condense(PAGE_ONE + PAGE_BREAK + PAGE_TWO)
+
+    assert condensed.count("Software Engineer") == 2
+    assert condensed.count("- Built data pipelines") == 2
+
+
+def test_text_without_page_breaks_keeps_repeated_lines():
+    condensed, stats = _condense("Jane Doe\nEngineer\nTeam Lead\nEngineer\nJane Doe")
+
+    assert condensed == "Jane Doe\nEngineer\nTeam Lead\nEngineer\nJane Doe"
+    assert stats["repeated_lines"] == 0
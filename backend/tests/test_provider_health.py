@@ -0,0 +1,36 @@
+"""
+Provider health lookups never run a probe on the caller's thread
+"""
+
+import threading
+import time
+
+from app.services.provider_health import ProviderHealth, ProviderHealthRegistry
+
+PROBE_SECONDS = 0.5
+
+
+def test_get_returns_last_known_state_without_waiting_for_the_probe():
+    probed = threading.Event()
+
+    def slow_probe():
+        time.sleep(PROBE_SECONDS)
+        probed.set()
+        return False
+
+    registry = ProviderHealthRegistry(interval=60)
+    registry.register(ProviderHealth("ollama", probe=slow_probe))
+
+    started = time.monotonic()
+    health = registry.get("ollama")
+    assert time.monotonic() - started < PROBE_SECONDS / 5
+    assert health.reachable is None and health.allow_request()
+
+    # The probe finished in the background and its result is used from then on
+    assert probed.wait(PROBE_SECONDS * 4)
+    for _ in range(50):
+        if health.reachable is not None:
+            break
+        time.sleep(0.01)
+    assert health.reachable is False
+    assert not registry.get("ollama").allow_request()
@@ -0,0 +1,29 @@
+"""
+Provider routing must never rank a provider that has no credentials
+"""
+
+from app.database import get_settings
+from app.services.ai_service import AIProvider, AIService
+
+
+def _pairs():
+    return [(AIProvider.OLLAMA, "ollama_call"), (AIProvider.OPENAI, "openai_call")]
+
+
+def test_unconfigured_openai_is_not_routed_even_when_ollama_is_slow(monkeypatch):
+    monkeypatch.setattr(get_settings(), "openai_api_key", "")
+    service = AIService()
+    # Ollama's EWMA far above the prior that an unmeasured OpenAI is costed at
+    for _ in range(10):
+        service._router.record_success(AIProvider.OLLAMA.value, "chat", 60.0)
+
+    assert service._route("chat", _pairs()) == [(AIProvider.OLLAMA, "ollama_call")]
+
+
+def test_configured_openai_is_routed_ahead_of_slow_ollama(monkeypatch):
+    monkeypatch.setattr(get_settings(), "openai_api_key", "sk-test")
+    service = AIService()
+    for _ in range(10):
+        service._router.record_success(AIProvider.OLLAMA.value, "chat", 60.0)
+
+    assert [provider for provider, _ in service._route("chat", _pairs())] == [AIProvider.OPENAI, AIProvider.OLLAMA]
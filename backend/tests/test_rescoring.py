@@ -0,0 +1,29 @@
+"""
+Finished re-scoring jobs are evicted from memory
+"""
+
+from datetime import datetime, timedelta
+
+from app.services.rescoring import RescoreJob, RescoringManager
+
+
+def _job(manager, status, finished_seconds_ago=None):
+    job = RescoreJob(recruitment_id=1)
+    job.status = status
+    if finished_seconds_ago is not None:
+        job.finished_at = datetime.utcnow() - timedelta(seconds=finished_seconds_ago)
+    manager._jobs[job.id] = job
+    return job
+
+
+def test_finished_jobs_expire_after_ttl_and_beyond_the_cap():
+    manager = RescoringManager(job_ttl=60, max_finished_jobs=2)
+    running = _job(manager, "running")
+    expired = _job(manager, "completed", finished_seconds_ago=120)
+    oldest = _job(manager, "failed", finished_seconds_ago=30)
+    kept = [_job(manager, "completed", finished_seconds_ago=s) for s in (20, 10)]
+
+    assert manager.get(expired.id) is None
+    assert manager.get(oldest.id) is None
+    assert manager.get(running.id) is running
+    assert [manager.get(job.id) for job in kept] == kept
@@ -0,0 +1,72 @@
+"""
+Resume upload: the request only queues the file, an intake worker creates the candidate
+"""
+
+import time
+
+from fastapi.testclient import TestClient
+
+from app.database import SessionLocal
+from app.main import app
+from app.models import Candidate, Recruitment
+from app.services import resume_intake
+from app.services.resume_intake import get_intake_manager
+
+
+class StubAIService:
+    """Sync AIService surface used by the intake pipeline"""
+
+    def parse_resume_document(self, file_content, filename, priority=None):
+        parsed = {"name": "Queued Candidate", "email": "queued@example.com"}
+        return parsed, "ollama", {"text": "Queued Candidate\nSkills\nPython", "content_hash": None}
+
+    def calculate_ats_score(self, candidate_data, job_requirements, priority=None):
+        return {"ats_score": 64, "strengths": [], "gaps": [], "reasoning": "stub"}
+
+
+def _recruitment_code():
+    db = SessionLocal()
+    try:
+        recruitment = Recruitment(
+            title="Platform Engineer", department="Engineering", location="Remote",
+            requirements="Python", interview_code=f"INT{time.monotonic_ns() % 10**6:06d}"
+        )
+        db.add(recruitment)
+        db.commit()
+        return recruitment.interview_code
+    finally:
+        db.close()
+
+
+def test_upload_is_queued_and_processed_by_worker(monkeypatch):
+    monkeypatch.setattr(resume_intake, "get_ai_service", lambda: StubAIService())
+    # No lifespan: the workers aren't running, the test drives one job by hand
+    client = TestClient(app)
+
+    for route in ("/api/interview/upload-resume", "/api/interview/upload-resume-ai"):
+        response = client.post(
+            route, params={"interview_code": _recruitment_code()},
+            files={"resume": ("cv.pdf", b"%PDF-1.4 stub", "application/pdf")}
+        )
+        assert response.status_code == 202, response.text
+        queued = response.json()
+        assert queued["status"] == "queued"
+
+        db = SessionLocal()
+        try:
+            # Nothing was parsed inside the request
+            assert db.query(Candidate).filter(Candidate.session_token == queued["session_token"]).first() is None
+        finally:
+            db.close()
+
+        # Other tests leave queued jobs behind, so run this one directly rather than claiming
+        get_intake_manager()._process(queued["job_id"])
+
+        job = client.get(f"/api/interview/upload-status/{queued['job_id']}").json()
+        assert (job["status"], job["stage"], job["candidate_name"]) == ("completed", "done", "Queued Candidate")
+        db = SessionLocal()
+        try:
+            candidate = db.query(Candidate).filter(Candidate.session_token == queued["session_token"]).one()
+            assert (candidate.id, candidate.ats_score) == (job["candidate_id"], 64)
+        finally:
+            db.close()
@@ -0,0 +1,43 @@
+"""
+Skill matching on slash- and hyphen-joined skill lists
+"""
+
+import pytest
+
+from app.services.skill_matcher import DEFAULT_TAXONOMY_PATH, SkillMatcher
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return SkillMatcher.from_file(DEFAULT_TAXONOMY_PATH)
+
+
+@pytest.mark.parametrize("text, skills", [
+    ("Python/Django", ["Python", "Django"]),
+    ("HTML/CSS/JavaScript", ["HTML", "CSS", "JavaScript"]),
+    ("AWS/GCP", ["AWS", "GCP"]),
+    ("MySQL/PostgreSQL", ["MySQL", "PostgreSQL"]),
+    ("SQL/NoSQL", ["SQL", "NoSQL"]),
+    (".NET/C#", [".NET", "C#"]),
+    ("React-Redux", ["React", "Redux"]),
+    ("Python-based tooling", ["Python"]),
+])
+def test_slash_and_hyphen_separate_skills(matcher, text, skills):
+    assert matcher.extract(text) == skills
+
+
+@pytest.mark.parametrize("text, skills", [
+    ("C++ and C#", ["C++", "C#"]),
+    ("node.js", ["Node.js"]),
+    ("CI/CD pipelines", ["CI/CD"]),
+    ("PL/SQL and T-SQL", ["SQL"]),
+    ("React-Native apps", ["React Native"]),
+    ("scikit-learn", ["scikit-learn"]),
+    ("Vue.js/Nuxt.js", ["Vue.js", "Nuxt.js"]),
+])
+def test_compound_tokens_match_whole(matcher, text, skills):
+    assert matcher.extract(text) == skills
+
+
+def test_words_inside_tokens_do_not_match(matcher):
+    assert matcher.extract("digital front-end work on node.js") == ["Node.js"]
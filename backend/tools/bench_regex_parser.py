@@ -0,0 +1,143 @@
+"""
+Micro-benchmark for the regex resume parser (the fallback under LLM outages)
+
+Compares the per-field extract_* functions with the precompiled
+ResumeFieldExtractor on a seeded corpus of synthetic resumes: checks that
+both give identical fields and reports time per resume and throughput.
+
+Usage (from backend/):
+    python tools/bench_regex_parser.py --resumes 2000 --repeat 5
+    python tools/bench_regex_parser.py --pages 8   # longer resumes
+"""
+
+from typing import Any, Callable, Dict, List
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import resume_parser  # noqa: E402
+
+FIRST = ["Aarav", "Priya", "John", "Maria", "Wei", "Fatima", "Lucas", "Ananya", "Omar", "Elena"]
+LAST = ["Sharma", "Patel", "Smith", "Garcia", "Chen", "Khan", "Silva", "Iyer", "Haddad", "Novak"]
+CITIES = ["Bangalore", "Mumbai", "Pune", "Berlin", "Austin", "Chennai", "Toronto", "Hyderabad"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne & Sons"]
+ROLES = ["Software Engineer", "Data Analyst", "Backend Developer", "ML Engineer", "QA Engineer"]
+DEGREES = ["B.Tech in Computer Science", "Bachelor of Science", "Master of Engineering", "MBA", "MSc Data Science"]
+SKILLS = ["Python", "Java", "SQL", "Docker", "Kubernetes", "React", "AWS", "Git", "Pandas", "FastAPI"]
+FILLER = [
+    "Designed and shipped services used by thousands of customers every day.",
+    "Improved query latency by adding indexes and caching hot paths.",
+    "Mentored junior engineers and reviewed pull requests across two teams.",
+    "Owned the on-call rotation and wrote post-incident reviews.",
+    "Migrated batch jobs to a queue-based pipeline with retries.",
+]
+
+
+def synthetic_resume(rng: random.Random, pages: int) -> str:
+    """One resume; layouts vary so every branch of the parser is exercised"""
+    name = f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+    lines: List[str] = [""] * rng.randint(0, 2) + [name]
+    if rng.random() < 0.9:
+        lines.append(f"{name.split()[0].lower()}.{rng.randint(1, 999)}@example.com")
+    if rng.random() < 0.8:
+        lines.append(rng.choice(["+91 98765 43210", "(555) 123-4567", "+1 415 555 0199", "020 7946 0958"]))
+    city = rng.choice(CITIES)
+    lines.append(rng.choice([f"Location: {city}, India", f"Based in {city}", f"{city}", f"Address: 12 Main St, {city}"]))
+    if rng.random() < 0.5:
+        lines.append(f"Currently at {rng.choice(COMPANIES)}")
+    elif rng.random() < 0.5:
+        lines.append(f"Working at {rng.choice(COMPANIES)} as {rng.choice(ROLES)}")
+    lines.append("")
+    lines.append(rng.choice(["Summary", "Profile", "About"]))
+    if rng.random() < 0.6:
+        lines.append(rng.choice([
+            f"{rng.randint(1, 15)}+ years of experience in backend development",
+            f"Experience: {rng.randint(1, 15)} years",
+            f"{rng.randint(1, 15)} years experience building data products",
+        ]))
+    lines.append(rng.choice(FILLER))
+    lines.append("Experience")
+    for _ in range(rng.randint(1, 4) * pages):
+        start = rng.randint(2005, 2021)
+        end = rng.choice([str(start + rng.randint(1, 3)), "Present", "current"])
+        lines.append(f"{rng.choice(ROLES)}, {rng.choice(COMPANIES)}  {start} - {end}")
+        lines.extend(rng.choice(FILLER) for _ in range(rng.randint(1, 3)))
+    lines.append("Education")
+    lines.append(f"{rng.choice(DEGREES)}, {rng.choice(['IIT Delhi', 'TU Berlin', 'UT Austin', 'Anna University'])}")
+    lines.append("Skills")
+    lines.append(", ".join(rng.sample(SKILLS, rng.randint(3, 8))))
+    return "\n".join(lines)
+
+
+def legacy_fields(text: str) -> Dict[str, Any]:
+    """The per-field functions, one full pass each"""
+    return {
+        "name": resume_parser.extract_name(text),
+        "email": resume_parser.extract_email(text),
+        "phone": resume_parser.extract_phone(text),
+        "location": resume_parser.extract_location(text),
+        "current_company": resume_parser.extract_current_company(text),
+        "experience": resume_parser.extract_experience_years(text),
+        "education": resume_parser.extract_education(text),
+    }
+
+
+def time_corpus(parse: Callable[[str], Dict[str, Any]], corpus: List[str], repeat: int) -> List[float]:
+    """Seconds per full corpus pass, one sample per repeat"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in corpus:
+            parse(text)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the regex resume field extraction")
+    parser.add_argument("--resumes", type=int, default=1000)
+    parser.add_argument("--pages", type=int, default=2, help="Scales the number of experience entries")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [synthetic_resume(rng, args.pages) for _ in range(args.resumes)]
+    extractor = resume_parser.get_field_extractor()
+
+    mismatches: Dict[str, int] = {}
+    example = None
+    for text in corpus:
+        expected, actual = legacy_fields(text), extractor.extract(text)
+        for field, value in expected.items():
+            if actual.get(field) != value:
+                mismatches[field] = mismatches.get(field, 0) + 1
+                example = example or {"field": field, "legacy": value, "extractor": actual.get(field)}
+
+    report = {
+        "resumes": len(corpus),
+        "avg_chars": round(statistics.mean(len(text) for text in corpus)),
+        "identical": not mismatches,
+        "mismatches": mismatches,
+    }
+    if example:
+        report["first_mismatch"] = example
+
+    for label, parse in [("per_field_functions", legacy_fields), ("field_extractor", extractor.extract)]:
+        best = min(time_corpus(parse, corpus, args.repeat))
+        report[label] = {
+            "us_per_resume": round(best / len(corpus) * 1e6, 1),
+            "resumes_per_second": round(len(corpus) / best),
+        }
+    report["speedup"] = round(report["per_field_functions"]["us_per_resume"] / report["field_extractor"]["us_per_resume"], 2)
+    print(json.dumps(report, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
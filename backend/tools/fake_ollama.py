@@ -0,0 +1,301 @@
+"""
+Deterministic Ollama stand-in for benchmarks and load tests
+
+Speaks enough of the Ollama REST API for the backend: /api/tags,
+/api/generate (JSON mode, plain, streaming, `context` continuation) and
+/api/chat (JSON mode, plain, streaming). Replies are derived from a hash of
+the request, so the same prompt always gets the same answer; latency and
+failures are drawn from a seeded RNG.
+
+Usage (from backend/):
+    python tools/fake_ollama.py --port 11434 --latency lognormal:0.8,0.4 --error-rate 0.02
+    OLLAMA_BASE_URL=http://localhost:11434 uvicorn app.main:app
+
+Latency specs:
+    fixed:SECONDS
+    uniform:LOW,HIGH
+    lognormal:MEDIAN,SIGMA
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+
+INTERVIEW_QUESTIONS = [
+    "Thanks. Can you walk me through a project where you owned the design end to end?",
+    "How did you measure whether that work was successful?",
+    "Tell me about a production issue you debugged. What was the root cause?",
+    "Which trade-offs did you consider, and why did you pick that approach?",
+    "How do you keep code maintainable when a deadline is close?",
+    "Describe a disagreement with a teammate and how it was resolved.",
+]
+
+KNOWN_SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "React", "Node.js", "SQL",
+    "PostgreSQL", "Docker", "Kubernetes", "AWS", "Django", "FastAPI", "Git",
+    "Machine Learning", "Go", "C++",
+]
+
+
+def parse_latency(spec: str):
+    """Turn a latency spec into a sampler taking a random.Random"""
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v]
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "lognormal" and len(values) == 2:
+        return lambda rng: rng.lognormvariate(math.log(values[0]), values[1])
+    raise argparse.ArgumentTypeError(f"Invalid latency spec: {spec}")
+
+
+def _digest(*parts) -> int:
+    return int(hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()[:12], 16)
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class FakeModel:
+    """Canned but request-dependent replies for each backend prompt"""
+
+    def parse_resume(self, prompt: str) -> dict:
+        resume = prompt.split("Resume:", 1)[-1].split("Return JSON with", 1)[0]
+        lines = [line.strip() for line in resume.splitlines() if line.strip()]
+        email = re.search(r"[\w.+-]+@[\w-]+\.[\w.]+", resume)
+        phone = re.search(r"\+?\d[\d\s().-]{8,}\d", resume)
+        skills = [s for s in KNOWN_SKILLS if re.search(rf"(?<!\w){re.escape(s)}(?!\w)", resume, re.IGNORECASE)]
+        return {
+            "name": lines[0] if lines else "Unknown",
+            "email": email.group(0) if email else "",
+            "phone": phone.group(0) if phone else None,
+            "location": None,
+            "experience": "; ".join(line for line in lines if "experience" in line.lower())[:300],
+            "skills": ", ".join(skills),
+            "education": "; ".join(line for line in lines if re.search(r"b\.?tech|bachelor|master|degree|university", line, re.I))[:300],
+        }
+
+    def score(self, prompt: str) -> dict:
+        value = 40 + _digest("score", prompt) % 56
+        return {
+            "score": value,
+            "strengths": ["Relevant skills listed"],
+            "gaps": ["Limited detail on impact"] if value < 75 else [],
+            "reasoning": f"Synthetic score {value} from the fake Ollama server",
+        }
+
+    def evaluate(self, prompt: str) -> dict:
+        value = 45 + _digest("evaluate", prompt) % 50
+        return {
+            "score": value,
+            "summary": "Candidate answered the questions with reasonable structure; examples were brief and lacked measurable outcomes.",
+            "strengths": ["Clear communication", "Relevant background"],
+            "improvements": ["Quantify results", "Go deeper on design choices"],
+        }
+
+    def reply(self, prompt: str) -> str:
+        if "summar" in prompt.lower()[:400]:
+            return "Earlier the candidate described their background and a recent project."
+        return INTERVIEW_QUESTIONS[_digest("reply", prompt) % len(INTERVIEW_QUESTIONS)]
+
+    def json_reply(self, prompt: str) -> dict:
+        if "Extract candidate information" in prompt:
+            return self.parse_resume(prompt)
+        if "Evaluate candidate match" in prompt:
+            return self.score(prompt)
+        return self.evaluate(prompt)
+
+
+class FakeOllamaServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency, token_delay: float, prompt_eval_rate: float,
+                 error_rate: float, hang_rate: float, hang_seconds: float, seed: int, models,
+                 load_seconds: float = 0.0):
+        super().__init__(address, FakeOllamaHandler)
+        self.latency = latency
+        self.token_delay = token_delay
+        self.prompt_eval_rate = prompt_eval_rate
+        self.error_rate = error_rate
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.models = models
+        self.load_seconds = load_seconds
+        self._loaded = set()
+        self._load_lock = threading.Lock()
+        self.model = FakeModel()
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.counts = {"requests": 0, "errors": 0, "hangs": 0}
+
+    def load(self, name: str):
+        """First request for a model pays the cold load time (serialized, like Ollama)"""
+        if not self.load_seconds or name in self._loaded:
+            return
+        with self._load_lock:
+            if name not in self._loaded:
+                time.sleep(self.load_seconds)
+                self._loaded.add(name)
+
+    def draw(self):
+        """Latency and outcome ("ok", "error" or "hang") for the next request"""
+        with self._rng_lock:
+            self.counts["requests"] += 1
+            roll = self._rng.random()
+            latency = max(0.0, self.latency(self._rng))
+            if roll < self.error_rate:
+                self.counts["errors"] += 1
+                return latency, "error"
+            if roll < self.error_rate + self.hang_rate:
+                self.counts["hangs"] += 1
+                return latency, "hang"
+            return latency, "ok"
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, obj, status: int = 200):
+        body = json.dumps(obj).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, chunks):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i, chunk in enumerate(chunks):
+            if i and self.server.token_delay:
+                time.sleep(self.server.token_delay)
+            line = (json.dumps(chunk) + "\n").encode("utf-8")
+            self.wfile.write(f"{len(line):X}\r\n".encode("ascii") + line + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_GET(self):
+        if self.path == "/api/tags":
+            self._send_json({"models": [{"name": name, "model": name} for name in self.server.models]})
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if self.path not in ("/api/generate", "/api/chat"):
+            self._send_json({"error": "not found"}, status=404)
+            return
+
+        if self.path == "/api/generate":
+            prompt = (body.get("system") or "") + (body.get("prompt") or "")
+        else:
+            prompt = "\n".join(m.get("content", "") for m in body.get("messages", []))
+        prompt_tokens = _tokens(prompt)
+        self.server.load(body.get("model"))
+
+        if not prompt.strip():
+            # Model load / keep-alive request
+            self._send_json({"model": body.get("model"), "response": "", "done": True})
+            return
+
+        latency, outcome = self.server.draw()
+        if self.server.prompt_eval_rate:
+            latency += prompt_tokens / self.server.prompt_eval_rate
+        if outcome == "hang":
+            time.sleep(self.server.hang_seconds)
+        time.sleep(latency)
+        if outcome == "error":
+            self._send_json({"error": "injected failure"}, status=500)
+            return
+
+        if body.get("format") == "json":
+            text = json.dumps(self.server.model.json_reply(prompt))
+        else:
+            text = self.server.model.reply(prompt)
+
+        stats = {
+            "prompt_eval_count": prompt_tokens,
+            "eval_count": _tokens(text),
+            "total_duration": int(latency * 1e9),
+        }
+        if self.path == "/api/generate":
+            # Continuation context grows with every turn, like the real one
+            context = list(body.get("context") or []) + [_digest(prompt) % 32000] * (prompt_tokens + _tokens(text))
+            final = {"model": body.get("model"), "done": True, "context": context, **stats}
+            if body.get("stream"):
+                words = text.split(" ")
+                self._stream(
+                    [{"model": body.get("model"), "response": w + (" " if i < len(words) - 1 else ""), "done": False}
+                     for i, w in enumerate(words)]
+                    + [{**final, "response": ""}]
+                )
+            else:
+                self._send_json({**final, "response": text})
+        else:
+            final = {"model": body.get("model"), "done": True, **stats}
+            if body.get("stream"):
+                words = text.split(" ")
+                self._stream(
+                    [{"model": body.get("model"), "message": {"role": "assistant", "content": w + (" " if i < len(words) - 1 else "")}, "done": False}
+                     for i, w in enumerate(words)]
+                    + [{**final, "message": {"role": "assistant", "content": ""}}]
+                )
+            else:
+                self._send_json({**final, "message": {"role": "assistant", "content": text}})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deterministic fake Ollama server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--latency", type=parse_latency, default="lognormal:0.5,0.4",
+                        help="Time to first token: fixed:S, uniform:LO,HI or lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="Delay between streamed chunks")
+    parser.add_argument("--prompt-eval-rate", type=float, default=0.0,
+                        help="Prompt tokens per second added to latency (0 = free)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="Fraction of requests that stall for --hang-seconds")
+    parser.add_argument("--hang-seconds", type=float, default=120.0)
+    parser.add_argument("--load-seconds", type=float, default=0.0,
+                        help="Cold load time paid by the first request for each model")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--models", default="phi3", help="Comma-separated names reported by /api/tags")
+    args = parser.parse_args()
+
+    server = FakeOllamaServer(
+        (args.host, args.port),
+        latency=args.latency,
+        token_delay=args.token_delay,
+        prompt_eval_rate=args.prompt_eval_rate,
+        error_rate=args.error_rate,
+        hang_rate=args.hang_rate,
+        hang_seconds=args.hang_seconds,
+        seed=args.seed,
+        models=[m.strip() for m in args.models.split(",") if m.strip()],
+        load_seconds=args.load_seconds,
+    )
+    print(f"Fake Ollama listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.counts))
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
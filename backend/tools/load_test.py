@@ -0,0 +1,256 @@
+"""
+Load test for resume upload and interview chat
+
+Drives a running backend (pointed at Ollama, the fake server in
+tools/fake_ollama.py, or LLM_RECORD_MODE=replay fixtures) and reports
+throughput and latency percentiles per endpoint.
+
+Usage (from backend/):
+    python tools/fake_ollama.py --latency lognormal:0.8,0.4 &
+    uvicorn app.main:app &
+    python tools/load_test.py --uploads 50 --sessions 10 --turns 5 --concurrency 8
+
+Uploads are queued by the API; "upload_resume" is the time to accept the file
+and "resume_processing" the time until its background job finished.
+Each upload uses a distinct synthetic resume so the parse cache doesn't hide
+the LLM cost; pass --same-resume to measure the cached path instead.
+"""
+
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import io
+import json
+import time
+
+import httpx
+
+# Polling of queued uploads (seconds)
+POLL_INTERVAL = 0.25
+PROCESSING_TIMEOUT = 300.0
+
+ANSWERS = [
+    "I led the migration of our billing service to Python 3 and FastAPI.",
+    "We tracked p95 latency and error rate before and after the rollout.",
+    "A connection pool was exhausted under load; we added limits and timeouts.",
+    "I chose a queue over synchronous calls because the work was bursty.",
+    "I write small PRs with tests so reviews stay quick even near a deadline.",
+]
+
+
+def make_resume(index: int) -> bytes:
+    """Small DOCX resume; `index` makes the content (and its hash) unique"""
+    import docx
+
+    document = docx.Document()
+    for line in [
+        f"Test Candidate {index}",
+        f"candidate{index}@example.com",
+        f"+1 555 {index:03d} {1000 + index % 9000}",
+        "Experience",
+        f"{2 + index % 8} years of experience building Python and SQL services",
+        "Education",
+        "B.Tech Computer Science",
+        "Skills",
+        "Python, SQL, Docker, Git, FastAPI",
+    ]:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+class Recorder:
+    """Latency samples and failures per endpoint"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def add(self, name: str, seconds: float, ok: bool):
+        if ok:
+            self.samples.setdefault(name, []).append(seconds)
+        else:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def report(self, elapsed: float) -> Dict[str, Dict[str, float]]:
+        report = {}
+        for name in sorted(set(self.samples) | set(self.errors)):
+            samples = sorted(self.samples.get(name, []))
+            errors = self.errors.get(name, 0)
+
+            def pct(p: float) -> float:
+                return round(samples[min(len(samples) - 1, int(p * len(samples)))], 4) if samples else 0.0
+
+            report[name] = {
+                "requests": len(samples) + errors,
+                "errors": errors,
+                "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+                "p50": pct(0.50),
+                "p90": pct(0.90),
+                "p95": pct(0.95),
+                "p99": pct(0.99),
+                "max": round(samples[-1], 4) if samples else 0.0,
+            }
+        return report
+
+
+async def timed(recorder: Recorder, name: str, call) -> Optional[httpx.Response]:
+    started = time.perf_counter()
+    try:
+        response = await call
+    except httpx.HTTPError:
+        recorder.add(name, time.perf_counter() - started, ok=False)
+        return None
+    recorder.add(name, time.perf_counter() - started, ok=response.status_code < 400)
+    return response if response.status_code < 400 else None
+
+
+async def ensure_interview_code(client: httpx.AsyncClient, code: Optional[str]) -> str:
+    if code:
+        return code
+    response = await client.get("/api/recruitment")
+    if response.status_code == 200 and response.json().get("interview_code"):
+        return response.json()["interview_code"]
+    response = await client.post("/api/recruitment", json={
+        "title": "Load Test Engineer",
+        "department": "Engineering",
+        "location": "Remote",
+        "requirements": "Python, SQL, Docker, 3+ years of backend experience",
+    })
+    response.raise_for_status()
+    return response.json()["interview_code"]
+
+
+async def upload(client: httpx.AsyncClient, recorder: Recorder, code: str, resume: bytes, index: int) -> Optional[str]:
+    response = await timed(recorder, "upload_resume", client.post(
+        "/api/interview/upload-resume",
+        params={"interview_code": code},
+        files={"resume": (f"resume_{index}.docx", resume,
+                          "application/vnd.openxmlformats-officedocument.wordprocessingml.document")},
+    ))
+    if response is None:
+        return None
+    # The upload is queued; the candidate (and its session) exists once processing completes
+    job = response.json()
+    started = time.perf_counter()
+    while time.perf_counter() - started < PROCESSING_TIMEOUT:
+        await asyncio.sleep(POLL_INTERVAL)
+        try:
+            status = await client.get(f"/api/interview/upload-status/{job['job_id']}")
+        except httpx.HTTPError:
+            continue
+        state = status.json().get("status") if status.status_code == 200 else None
+        if state in ("completed", "failed"):
+            recorder.add("resume_processing", time.perf_counter() - started, ok=state == "completed")
+            return job["session_token"] if state == "completed" else None
+    recorder.add("resume_processing", time.perf_counter() - started, ok=False)
+    return None
+
+
+async def interview(client: httpx.AsyncClient, recorder: Recorder, token: str, turns: int, stream: bool):
+    response = await timed(recorder, "start", client.post("/api/interview/start", json={"session_token": token}))
+    if response is None:
+        return
+    history = [{"role": "assistant", "content": response.json()["greeting"]}]
+    for turn in range(turns):
+        message = ANSWERS[turn % len(ANSWERS)]
+        payload = {"session_token": token, "message": message, "conversation_history": history}
+        if stream:
+            reply = await stream_turn(client, recorder, payload)
+        else:
+            response = await timed(recorder, "chat", client.post("/api/interview/chat", json=payload))
+            reply = response.json()["reply"] if response is not None else None
+        if reply is None:
+            return
+        history = history + [{"role": "user", "content": message}, {"role": "assistant", "content": reply}]
+
+
+async def stream_turn(client: httpx.AsyncClient, recorder: Recorder, payload: dict) -> Optional[str]:
+    """One /chat/stream turn; records time to first token and total time"""
+    started = time.perf_counter()
+    tokens, first, reply = [], None, None
+    try:
+        async with client.stream("POST", "/api/interview/chat/stream", json=payload) as response:
+            if response.status_code >= 400:
+                recorder.add("chat_stream", time.perf_counter() - started, ok=False)
+                return None
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                event = json.loads(line[5:])
+                if event.get("token"):
+                    if first is None:
+                        first = time.perf_counter() - started
+                    tokens.append(event["token"])
+                if event.get("error"):
+                    recorder.add("chat_stream", time.perf_counter() - started, ok=False)
+                    return None
+                if event.get("done"):
+                    reply = event.get("reply")
+    except httpx.HTTPError:
+        recorder.add("chat_stream", time.perf_counter() - started, ok=False)
+        return None
+    recorder.add("chat_stream", time.perf_counter() - started, ok=True)
+    if first is not None:
+        recorder.add("chat_stream_ttft", first, ok=True)
+    return reply if reply is not None else "".join(tokens).strip()
+
+
+async def run(args) -> Dict[str, Dict[str, float]]:
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.concurrency * 2)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        code = await ensure_interview_code(client, args.interview_code)
+        gate = asyncio.Semaphore(args.concurrency)
+        shared = make_resume(0) if args.same_resume else None
+
+        async def one_upload(i: int):
+            async with gate:
+                await upload(client, recorder, code, shared or make_resume(i), i)
+
+        async def one_session(i: int):
+            async with gate:
+                token = await upload(client, recorder, code, shared or make_resume(100000 + i), 100000 + i)
+                if token:
+                    await interview(client, recorder, token, args.turns, args.stream)
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(one_upload(i) for i in range(args.uploads)),
+            *(one_session(i) for i in range(args.sessions)),
+        )
+        elapsed = time.perf_counter() - started
+
+        report = recorder.report(elapsed)
+        report["_run"] = {"elapsed_seconds": round(elapsed, 3), "concurrency": args.concurrency}
+        health = await client.get("/health")
+        if health.status_code == 200:
+            report["_server"] = {k: health.json().get(k) for k in ("scheduler", "caches", "event_loop")}
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test upload_resume and interview chat")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--interview-code", help="Active recruitment code (one is created if omitted)")
+    parser.add_argument("--uploads", type=int, default=20, help="Standalone resume uploads")
+    parser.add_argument("--sessions", type=int, default=5, help="Interview sessions (upload + start + chat turns)")
+    parser.add_argument("--turns", type=int, default=4, help="Chat turns per session")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--stream", action="store_true", help="Use /chat/stream instead of /chat")
+    parser.add_argument("--same-resume", action="store_true", help="Upload one identical resume (cache path)")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,10 @@ import { useNavigate } from 'react-router-dom';
 import { Sparkles, ArrowLeft, Upload, FileText, CheckCircle, Loader } from 'lucide-react';
 import { interviewApi } from '../services/api';
 
+// Polling for the background resume processing job
+const POLL_INTERVAL_MS = 1500;
+const PROCESSING_TIMEOUT_MS = 5 * 60 * 1000;
+
 function ApplicantResumeUpload() {
   const navigate = useNavigate();
   const [uploading, setUploading] = useState(false);
@@ -68,6 +72,21 @@ function ApplicantResumeUpload() {
     setSelectedFile(file);
   };
 
+  const waitForProcessing = async (jobId) => {
+    const deadline = Date.now() + PROCESSING_TIMEOUT_MS;
+    while (Date.now() < deadline) {
+      const job = await interviewApi.getUploadStatus(jobId);
+      if (job.status === 'completed') {
+        return job;
+      }
+      if (job.status === 'failed') {
+        throw new Error(job.error || 'Error processing resume');
+      }
+      await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+    }
+    throw new Error('Resume processing is taking longer than expected. Please try again.');
+  };
+
   const handleSubmit = async () => {
     if (!selectedFile) {
       setError('Please select a file');
@@ -80,13 +99,14 @@ function ApplicantResumeUpload() {
       
       const interviewCode = sessionStorage.getItem('interview_code');
       
-      // Upload resume with AI parsing
-      const response = await interviewApi.uploadResumeAI(interviewCode, selectedFile);
+      // Upload returns right away; AI parsing runs in the background
+      const upload = await interviewApi.uploadResume(interviewCode, selectedFile);
+      const job = await waitForProcessing(upload.job_id);
       
       // Store candidate ID, session token, and name
-      sessionStorage.setItem('candidate_id', response.candidate_id);
-      sessionStorage.setItem('session_token', response.session_token);
-      sessionStorage.setItem('candidate_name', response.candidate_name);
+      sessionStorage.setItem('candidate_id', job.candidate_id);
+      sessionStorage.setItem('session_token', upload.session_token);
+      sessionStorage.setItem('candidate_name', job.candidate_name);
       
       // Navigate to profile view
       navigate('/applicant/profile');
@@ -277,6 +277,8 @@ function RecruiterDashboard() {
         return 'bg-purple-900/30 text-purple-400 border-purple-800';
       case 'Interviewed':
         return 'bg-green-900/30 text-green-400 border-green-800';
+      case 'Evaluating':
+        return 'bg-cyan-900/30 text-cyan-400 border-cyan-800';
       case 'Shortlisted':
         return 'bg-blue-900/30 text-blue-400 border-blue-800';
       case 'New':
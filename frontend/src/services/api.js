@@ -47,6 +47,51 @@ export const recruitmentApi = {
   regenerateCode: (id) => apiCall(`/recruitment/regenerate-code/${id}`, {
     method: 'POST',
   }),
+
+  rescore: (id) => apiCall(`/recruitment/${id}/rescore`, {
+    method: 'POST',
+  }),
+
+  getRescoreStatus: (id, jobId) => apiCall(`/recruitment/${id}/rescore/${jobId}`),
+
+  // Calls onEvent for each progress event; resolves with the final "done" event
+  importResumes: async (id, files, onEvent = () => {}) => {
+    const formData = new FormData();
+    for (const file of files) {
+      formData.append('files', file);
+    }
+
+    const response = await fetch(`${API_BASE_URL}/recruitment/${id}/import`, {
+      method: 'POST',
+      body: formData,
+    });
+
+    if (!response.ok) {
+      const error = await response.json().catch(() => ({ detail: 'Import failed' }));
+      throw new Error(error.detail || 'Resume import failed');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let done = null;
+    for (;;) {
+      const { value, done: finished } = await reader.read();
+      if (finished) break;
+      buffer += decoder.decode(value, { stream: true });
+      const lines = buffer.split('\n');
+      buffer = lines.pop();
+      for (const line of lines) {
+        if (!line.trim()) continue;
+        const event = JSON.parse(line);
+        if (event.event === 'done') done = event;
+        onEvent(event);
+      }
+    }
+    return done;
+  },
+
+  getImportStatus: (id, jobId) => apiCall(`/recruitment/${id}/import/${jobId}`),
 };
 
 // Candidates API
@@ -78,6 +123,8 @@ export const candidatesApi = {
   }),
   
   getTranscript: (id) => apiCall(`/candidates/${id}/transcript`),
+  
+  getResumeText: (id, section) => apiCall(`/candidates/${id}/resume-text${section ? `?section=${encodeURIComponent(section)}` : ''}`),
 };
 
 // Interview API
@@ -87,6 +134,7 @@ export const interviewApi = {
     body: JSON.stringify({ interview_code: interviewCode }),
   }),
   
+  // Queues the resume; poll getUploadStatus(job_id) until it is completed or failed
   uploadResume: async (interviewCode, resumeFile) => {
     const formData = new FormData();
     formData.append('resume', resumeFile);
@@ -107,25 +155,7 @@ export const interviewApi = {
     return response.json();
   },
   
-  uploadResumeAI: async (interviewCode, resumeFile) => {
-    const formData = new FormData();
-    formData.append('resume', resumeFile);
-    
-    const response = await fetch(
-      `${API_BASE_URL}/interview/upload-resume-ai?interview_code=${interviewCode}`,
-      {
-        method: 'POST',
-        body: formData,
-      }
-    );
-    
-    if (!response.ok) {
-      const error = await response.json().catch(() => ({ detail: 'Upload failed' }));
-      throw new Error(error.detail || 'AI resume parsing failed');
-    }
-    
-    return response.json();
-  },
+  getUploadStatus: (jobId) => apiCall(`/interview/upload-status/${jobId}`),
   
   start: (sessionToken) => apiCall('/interview/start', {
     method: 'POST',
@@ -142,6 +172,50 @@ export const interviewApi = {
   }),
   
   getStatus: (sessionToken) => apiCall(`/interview/status/${sessionToken}`),
+
+  // Streams the interviewer reply; onToken is called for each chunk, resolves with the full reply
+  chatStream: async (sessionToken, message, conversationHistory = [], onToken = () => {}) => {
+    const response = await fetch(`${API_BASE_URL}/interview/chat/stream`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({
+        session_token: sessionToken,
+        message,
+        conversation_history: conversationHistory,
+      }),
+    });
+
+    if (!response.ok) {
+      const error = await response.json().catch(() => ({ detail: 'Chat failed' }));
+      throw new Error(error.detail || 'Chat request failed');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let reply = '';
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      const events = buffer.split('\n\n');
+      buffer = events.pop();
+      for (const event of events) {
+        if (!event.startsWith('data: ')) continue;
+        const data = JSON.parse(event.slice(6));
+        if (data.error) throw new Error(data.error);
+        if (data.token) {
+          reply += data.token;
+          onToken(data.token);
+        }
+        if (data.done) return data.reply ?? reply;
+      }
+    }
+
+    return reply;
+  },
 };
 
 export default {